@@ -1,10 +1,14 @@
 """
 ROBINS-E Tool Domain 5: Risk of Bias due to Missing Data
 Implementation of the algorithm for assessing bias from missing data and analysis methods
+
+Requires Python 3.10+ (the decision walk uses structural pattern matching)
 """
 
+import sys
 from enum import Enum
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, NamedTuple, Optional
 
 class Response(Enum):
     """Possible responses to algorithm questions"""
@@ -25,100 +29,194 @@ class RiskLevel(Enum):
     HIGH_RISK = "High risk of bias"
     VERY_HIGH_RISK = "Very high risk of bias"
 
+# Response codes used when rendering the pathway, resolved once at import
+_RESPONSE_VALUE = {response: response.value for response in Response}
+
+# Response groups shared by the predicates and the decision walk
+_POSITIVE = frozenset({Response.YES, Response.PROBABLY_YES})
+_POSITIVE_OR_STRONG_YES = _POSITIVE | {Response.STRONG_YES}
+_POSITIVE_OR_NI = _POSITIVE | {Response.NO_INFORMATION}
+_NEGATIVE = frozenset({Response.NO, Response.PROBABLY_NO})
+_NEGATIVE_OR_NI = _NEGATIVE | {Response.NO_INFORMATION}
+_WEAK_OR_NI = frozenset({Response.WEAK_YES, Response.WEAK_NO, Response.NO_INFORMATION})
+_STRONG = frozenset({Response.STRONG_YES, Response.STRONG_NO})
+
+def _outcome(risk_level: RiskLevel, rationale: str) -> MappingProxyType:
+    """Read-only result template with an interned rationale"""
+    return MappingProxyType({'risk_level': risk_level, 'rationale': sys.intern(rationale)})
+
+# Fixed outcomes of the decision walk; only the pathway varies per call
+_R_LOW_COMPLETE = _outcome(RiskLevel.LOW_RISK, 'complete_data_all_participants')
+_R_MISSING_Q5_1_3 = _outcome(RiskLevel.SOME_CONCERNS, 'incomplete_data_assessment')
+_R_MISSING_Q5_4 = _outcome(RiskLevel.HIGH_RISK, 'incomplete_analysis_method_assessment')
+_R_MISSING_Q5_5 = _outcome(RiskLevel.HIGH_RISK, 'incomplete_exclusion_assessment')
+_R_MISSING_Q5_6 = _outcome(RiskLevel.HIGH_RISK, 'incomplete_predictors_assessment')
+_R_PREDICTORS_STRONG = _outcome(RiskLevel.SOME_CONCERNS, 'predictors_included_strong')
+_R_MISSING_Q5_7 = _outcome(RiskLevel.HIGH_RISK, 'incomplete_imputation_assessment')
+_R_MISSING_Q5_8 = _outcome(RiskLevel.HIGH_RISK, 'incomplete_imputation_quality_assessment')
+_R_MISSING_Q5_9 = _outcome(RiskLevel.HIGH_RISK, 'incomplete_method_assessment')
+_R_UNEXPECTED = _outcome(RiskLevel.HIGH_RISK, 'unexpected_pathway')
+
+# Missing data strategies indexed by bitmask:
+# bit 0 = complete case analysis, bit 1 = imputation, bit 2 = predictors modeled
+_STRATEGY_LABELS = (
+    "Complete case analysis",
+    "Imputation methods",
+    "Predictors of missingness modeled",
+)
+_STRATEGY_TABLE = tuple(
+    tuple(label for bit, label in enumerate(_STRATEGY_LABELS) if mask & (1 << bit))
+    for mask in range(1 << len(_STRATEGY_LABELS))
+)
+
+# Detailed explanations keyed by interned rationale, used by get_detailed_assessment
+_EXPLANATIONS = {
+    sys.intern('complete_data_all_participants'):
+        "Complete data available for all participants across all relevant variables. "
+        "This eliminates missing data bias.",
+
+    sys.intern('predictors_included_strong'):
+        "Complete case analysis was used, but strong evidence that predictors of "
+        "missingness were included in the model, reducing bias risk.",
+
+    sys.intern('appropriate_imputation'):
+        "Missing data were handled using imputation methods, with evidence of "
+        "appropriate imputation techniques.",
+
+    sys.intern('poor_imputation'):
+        "Missing data were handled using imputation, but the imputation methods "
+        "may not be appropriate, creating potential bias.",
+
+    sys.intern('exclusion_related'):
+        "Exclusions from analysis appear related to the true outcome value, "
+        "creating substantial risk of bias.",
+
+    sys.intern('incomplete_data_assessment'):
+        "Insufficient information to assess completeness of data."
+}
+
+class _Evidence(NamedTuple):
+    """Outcome of the Q5.10 evidence assessment"""
+    risk_level: RiskLevel
+    rationale: str
+
+# Q5.10 pathway contexts grouped by how positive evidence is weighed
+_FAVOURABLE_CONTEXTS = frozenset({'predictors_included', 'exclusion_unrelated', 'appropriate_imputation', 'appropriate_method'})
+_UNFAVOURABLE_CONTEXTS = frozenset({'exclusion_related', 'poor_imputation', 'poor_method'})
+
+def _evidence_outcomes(pathway_context: str) -> Dict[str, _Evidence]:
+    """
+    Q5.10 outcomes for one pathway context, keyed by response class
+    (missing, positive, negative, unclear)
+    """
+    if pathway_context in _FAVOURABLE_CONTEXTS:
+        # These pathways typically have better outcomes for positive evidence
+        positive = (RiskLevel.SOME_CONCERNS, 'evidence_supports_low_bias')
+        negative = (RiskLevel.HIGH_RISK, 'evidence_suggests_bias')
+    elif pathway_context in _UNFAVOURABLE_CONTEXTS:
+        # These pathways typically have worse outcomes even with positive evidence
+        positive = (RiskLevel.SOME_CONCERNS, 'evidence_supports_but_concerns_remain')
+        negative = (RiskLevel.VERY_HIGH_RISK, 'evidence_confirms_bias')
+    else:
+        # Default moderate assessment for unclear pathways
+        positive = (RiskLevel.SOME_CONCERNS, 'evidence_moderate')
+        negative = (RiskLevel.HIGH_RISK, 'evidence_poor')
+    
+    def outcome(risk_level: RiskLevel, prefix: str) -> _Evidence:
+        return _Evidence(risk_level, sys.intern(f'{prefix}_{pathway_context}'))
+    
+    return {
+        'missing': outcome(RiskLevel.HIGH_RISK, 'missing_evidence_assessment'),
+        'positive': outcome(*positive),
+        'negative': outcome(*negative),
+        'unclear': outcome(RiskLevel.SOME_CONCERNS, 'evidence_unclear'),
+    }
+
+# Precomputed Q5.10 outcomes for every context the decision walk can produce
+_EVIDENCE_OUTCOMES = {
+    context: _evidence_outcomes(context)
+    for context in (
+        'predictors_included', 'predictors_not_included', 'exclusion_somewhat_related',
+        'exclusion_related', 'appropriate_imputation', 'poor_imputation',
+        'appropriate_method', 'poor_method',
+    )
+}
+
 class ROBINSEDomain5:
     """ROBINS-E Domain 5 Algorithm Implementation"""
     
-    def __init__(self):
-        self.questions = {
-            'q5_1_to_5_3_complete_data': "5.1-5.3 Complete data for all participants?",
-            'q5_4_complete_case_analysis': "5.4 Complete case analysis?",
-            'q5_5_exclusion_related_outcome': "5.5 Exclusion from analysis related to true value of outcome?",
-            'q5_6_predictors_missingness': "5.6 Predictors of missingness included in model?",
-            'q5_7_analysis_imputing': "5.7 Analysis based on imputing missing values?",
-            'q5_8_appropriate_imputation': "5.8 Appropriate imputation?",
-            'q5_9_appropriate_method': "5.9 Appropriate method?",
-            'q5_10_evidence_not_biased': "5.10 Evidence that result is not biased?"
-        }
+    # The assessor is stateless; questions are shared read-only at class level
+    __slots__ = ()
+    
+    _QUESTIONS = MappingProxyType({
+        'q5_1_to_5_3_complete_data': "5.1-5.3 Complete data for all participants?",
+        'q5_4_complete_case_analysis': "5.4 Complete case analysis?",
+        'q5_5_exclusion_related_outcome': "5.5 Exclusion from analysis related to true value of outcome?",
+        'q5_6_predictors_missingness': "5.6 Predictors of missingness included in model?",
+        'q5_7_analysis_imputing': "5.7 Analysis based on imputing missing values?",
+        'q5_8_appropriate_imputation': "5.8 Appropriate imputation?",
+        'q5_9_appropriate_method': "5.9 Appropriate method?",
+        'q5_10_evidence_not_biased': "5.10 Evidence that result is not biased?"
+    })
+    questions = _QUESTIONS
     
     def _is_positive_response(self, response: Response) -> bool:
         """Check if response is positive (Y/PY)"""
-        return response in [Response.YES, Response.PROBABLY_YES]
+        return response in _POSITIVE
     
     def _is_negative_response(self, response: Response) -> bool:
         """Check if response is negative (N/PN)"""
-        return response in [Response.NO, Response.PROBABLY_NO]
+        return response in _NEGATIVE
     
     def _is_positive_or_ni(self, response: Response) -> bool:
         """Check if response is positive or no information (Y/PY/NI)"""
-        return response in [Response.YES, Response.PROBABLY_YES, Response.NO_INFORMATION]
+        return response in _POSITIVE_OR_NI
     
     def _is_negative_or_ni(self, response: Response) -> bool:
         """Check if response is negative or no information (N/PN/NI)"""
-        return response in [Response.NO, Response.PROBABLY_NO, Response.NO_INFORMATION]
+        return response in _NEGATIVE_OR_NI
     
     def _is_weak_or_ni(self, response: Response) -> bool:
         """Check if response is weak or no information (WY/WN/NI)"""
-        return response in [Response.WEAK_YES, Response.WEAK_NO, Response.NO_INFORMATION]
+        return response in _WEAK_OR_NI
     
     def _is_strong_response(self, response: Response) -> bool:
         """Check if response is strong (SY/SN)"""
-        return response in [Response.STRONG_YES, Response.STRONG_NO]
+        return response in _STRONG
 
-    def _assess_evidence_pathway(self, q5_10_response: Response, pathway_context: str) -> Dict[str, Any]:
+    def _assess_evidence_pathway(self, q5_10_response: Response, pathway_context: str) -> _Evidence:
         """
         Assess Q5.10 Evidence that result is not biased based on pathway context
         Different pathways to Q5.10 have different outcome mappings
         """
         if not q5_10_response:
-            return {
-                'risk_level': RiskLevel.HIGH_RISK,
-                'rationale': f'missing_evidence_assessment_{pathway_context}'
-            }
-        
-        # The outcome depends on both the response and the pathway context
-        if pathway_context in ['predictors_included', 'exclusion_unrelated', 'appropriate_imputation', 'appropriate_method']:
-            # These pathways typically have better outcomes for positive evidence
-            if self._is_positive_response(q5_10_response):
-                return {
-                    'risk_level': RiskLevel.SOME_CONCERNS,
-                    'rationale': f'evidence_supports_low_bias_{pathway_context}'
-                }
-            elif self._is_negative_response(q5_10_response):
-                return {
-                    'risk_level': RiskLevel.HIGH_RISK,
-                    'rationale': f'evidence_suggests_bias_{pathway_context}'
-                }
-        
-        elif pathway_context in ['exclusion_related', 'poor_imputation', 'poor_method']:
-            # These pathways typically have worse outcomes even with positive evidence
-            if self._is_positive_response(q5_10_response):
-                return {
-                    'risk_level': RiskLevel.SOME_CONCERNS,
-                    'rationale': f'evidence_supports_but_concerns_remain_{pathway_context}'
-                }
-            elif self._is_negative_response(q5_10_response):
-                return {
-                    'risk_level': RiskLevel.VERY_HIGH_RISK,
-                    'rationale': f'evidence_confirms_bias_{pathway_context}'
-                }
-        
+            response_class = 'missing'
+        elif q5_10_response in _POSITIVE:
+            response_class = 'positive'
+        elif q5_10_response in _NEGATIVE:
+            response_class = 'negative'
         else:
-            # Default moderate assessment for unclear pathways
-            if self._is_positive_response(q5_10_response):
-                return {
-                    'risk_level': RiskLevel.SOME_CONCERNS,
-                    'rationale': f'evidence_moderate_{pathway_context}'
-                }
-            elif self._is_negative_response(q5_10_response):
-                return {
-                    'risk_level': RiskLevel.HIGH_RISK,
-                    'rationale': f'evidence_poor_{pathway_context}'
-                }
+            response_class = 'unclear'
         
-        # Default for unclear responses
+        outcomes = _EVIDENCE_OUTCOMES.get(pathway_context) or _evidence_outcomes(pathway_context)
+        return outcomes[response_class]
+
+    def _finalize_q5_10(self, responses: Dict[str, Response], pathway: list,
+                        context: str, transition_msg: str) -> Dict[str, Any]:
+        """
+        Record the transition to Q5.10 and resolve the final judgement
+        Shared tail of every pathway that ends at Q5.10
+        """
+        q5_10 = responses.get('q5_10_evidence_not_biased')
+        pathway.append(transition_msg)
+        if q5_10:
+            pathway.append(f"Q5.10 Evidence that result is not biased? -> {_RESPONSE_VALUE[q5_10]}")
+        
+        evidence_result = self._assess_evidence_pathway(q5_10, context)
         return {
-            'risk_level': RiskLevel.SOME_CONCERNS,
-            'rationale': f'evidence_unclear_{pathway_context}'
+            'risk_level': evidence_result.risk_level,
+            'pathway': pathway,
+            'rationale': evidence_result.rationale
         }
 
     def assess_missing_data_bias(self, responses: Dict[str, Response]) -> Dict[str, Any]:
@@ -135,184 +233,106 @@ class ROBINSEDomain5:
         
         # Start with Q5.1-5.3 Complete data for all participants?
         q5_1_3 = responses.get('q5_1_to_5_3_complete_data')
-        if not q5_1_3:
-            return {
-                'risk_level': RiskLevel.SOME_CONCERNS,
-                'pathway': ["Missing Q5.1-5.3 response"],
-                'rationale': 'incomplete_data_assessment'
-            }
-        
-        pathway.append(f"Q5.1-5.3 Complete data for all participants? -> {q5_1_3.value}")
         
-        # Check for complete data (All Y/PY)
-        if q5_1_3 in [Response.YES, Response.PROBABLY_YES]:
+        # Complete data (All Y/PY) is tested before the missing-response check
+        # because it is the expected common case and ends the walk immediately
+        if q5_1_3 in _POSITIVE:
             # This assumes "All Y/PY" means the overall assessment is positive
+            pathway.append(f"Q5.1-5.3 Complete data for all participants? -> {_RESPONSE_VALUE[q5_1_3]}")
             pathway.append("All Y/PY path -> LOW RISK OF BIAS")
-            return {
-                'risk_level': RiskLevel.LOW_RISK,
-                'pathway': pathway,
-                'rationale': 'complete_data_all_participants'
-            }
+            return {**_R_LOW_COMPLETE, 'pathway': pathway}
+        
+        if not q5_1_3:
+            return {**_R_MISSING_Q5_1_3, 'pathway': ["Missing Q5.1-5.3 response"]}
+        
+        pathway.append(f"Q5.1-5.3 Complete data for all participants? -> {_RESPONSE_VALUE[q5_1_3]}")
         
         # Any N/PN/NI path - proceed to Q5.4
         pathway.append("Any N/PN/NI path -> Proceeding to Q5.4")
         
         q5_4 = responses.get('q5_4_complete_case_analysis')
         if not q5_4:
-            return {
-                'risk_level': RiskLevel.HIGH_RISK,
-                'pathway': pathway + ["Missing Q5.4 response"],
-                'rationale': 'incomplete_analysis_method_assessment'
-            }
+            return {**_R_MISSING_Q5_4, 'pathway': pathway + ["Missing Q5.4 response"]}
         
-        pathway.append(f"Q5.4 Complete case analysis? -> {q5_4.value}")
+        pathway.append(f"Q5.4 Complete case analysis? -> {_RESPONSE_VALUE[q5_4]}")
         
-        # Complete case analysis path
-        if self._is_positive_or_ni(q5_4):
-            # Y/PY/NI -> Q5.5
-            q5_5 = responses.get('q5_5_exclusion_related_outcome')
-            if not q5_5:
-                return {
-                    'risk_level': RiskLevel.HIGH_RISK,
-                    'pathway': pathway + ["Missing Q5.5 response"],
-                    'rationale': 'incomplete_exclusion_assessment'
-                }
-            
-            pathway.append(f"Q5.5 Exclusion from analysis related to true value of outcome? -> {q5_5.value}")
-            
-            if self._is_negative_response(q5_5):
-                # N/PN -> Q5.6
-                q5_6 = responses.get('q5_6_predictors_missingness')
-                if not q5_6:
-                    return {
-                        'risk_level': RiskLevel.HIGH_RISK,
-                        'pathway': pathway + ["Missing Q5.6 response"],
-                        'rationale': 'incomplete_predictors_assessment'
-                    }
+        match q5_4:
+            # Complete case analysis path
+            case Response.YES | Response.PROBABLY_YES | Response.NO_INFORMATION:
+                # Y/PY/NI -> Q5.5
+                q5_5 = responses.get('q5_5_exclusion_related_outcome')
+                if not q5_5:
+                    return {**_R_MISSING_Q5_5, 'pathway': pathway + ["Missing Q5.5 response"]}
                 
-                pathway.append(f"Q5.6 Predictors of missingness included in model? -> {q5_6.value}")
+                pathway.append(f"Q5.5 Exclusion from analysis related to true value of outcome? -> {_RESPONSE_VALUE[q5_5]}")
                 
-                if q5_6 == Response.STRONG_YES:
-                    pathway.append("SY path -> SOME CONCERNS")
-                    return {
-                        'risk_level': RiskLevel.SOME_CONCERNS,
-                        'pathway': pathway,
-                        'rationale': 'predictors_included_strong'
-                    }
-                else:
-                    # WY/NI or N/PN -> Q5.10
-                    q5_10 = responses.get('q5_10_evidence_not_biased')
-                    pathway.append(f"Q5.6 {q5_6.value} -> Proceeding to Q5.10")
-                    if q5_10:
-                        pathway.append(f"Q5.10 Evidence that result is not biased? -> {q5_10.value}")
+                match q5_5:
+                    case Response.NO | Response.PROBABLY_NO:
+                        # N/PN -> Q5.6
+                        q5_6 = responses.get('q5_6_predictors_missingness')
+                        if not q5_6:
+                            return {**_R_MISSING_Q5_6, 'pathway': pathway + ["Missing Q5.6 response"]}
+                        
+                        pathway.append(f"Q5.6 Predictors of missingness included in model? -> {_RESPONSE_VALUE[q5_6]}")
+                        
+                        if q5_6 == Response.STRONG_YES:
+                            pathway.append("SY path -> SOME CONCERNS")
+                            return {**_R_PREDICTORS_STRONG, 'pathway': pathway}
+                        
+                        # WY/NI or N/PN -> Q5.10
+                        context = 'predictors_included' if self._is_weak_or_ni(q5_6) else 'predictors_not_included'
+                        return self._finalize_q5_10(
+                            responses, pathway, context, f"Q5.6 {_RESPONSE_VALUE[q5_6]} -> Proceeding to Q5.10"
+                        )
                     
-                    context = 'predictors_included' if self._is_weak_or_ni(q5_6) else 'predictors_not_included'
-                    evidence_result = self._assess_evidence_pathway(q5_10, context)
-                    return {
-                        'risk_level': evidence_result['risk_level'],
-                        'pathway': pathway,
-                        'rationale': evidence_result['rationale']
-                    }
-            
-            elif q5_5 in [Response.WEAK_YES, Response.NO_INFORMATION]:
-                # WY/NI -> Q5.10
-                q5_10 = responses.get('q5_10_evidence_not_biased')
-                pathway.append("WY/NI path -> Proceeding to Q5.10")
-                if q5_10:
-                    pathway.append(f"Q5.10 Evidence that result is not biased? -> {q5_10.value}")
-                
-                evidence_result = self._assess_evidence_pathway(q5_10, 'exclusion_somewhat_related')
-                return {
-                    'risk_level': evidence_result['risk_level'],
-                    'pathway': pathway,
-                    'rationale': evidence_result['rationale']
-                }
-            
-            elif q5_5 == Response.STRONG_YES:
-                # SY -> Q5.10
-                q5_10 = responses.get('q5_10_evidence_not_biased')
-                pathway.append("SY path -> Proceeding to Q5.10")
-                if q5_10:
-                    pathway.append(f"Q5.10 Evidence that result is not biased? -> {q5_10.value}")
-                
-                evidence_result = self._assess_evidence_pathway(q5_10, 'exclusion_related')
-                return {
-                    'risk_level': evidence_result['risk_level'],
-                    'pathway': pathway,
-                    'rationale': evidence_result['rationale']
-                }
-        
-        # Analysis based on imputing missing values path
-        elif self._is_negative_response(q5_4):
-            # N/PN -> Q5.7
-            q5_7 = responses.get('q5_7_analysis_imputing')
-            if not q5_7:
-                return {
-                    'risk_level': RiskLevel.HIGH_RISK,
-                    'pathway': pathway + ["Missing Q5.7 response"],
-                    'rationale': 'incomplete_imputation_assessment'
-                }
-            
-            pathway.append(f"Q5.7 Analysis based on imputing missing values? -> {q5_7.value}")
-            
-            if self._is_positive_response(q5_7):
-                # Y/PY -> Q5.8
-                q5_8 = responses.get('q5_8_appropriate_imputation')
-                if not q5_8:
-                    return {
-                        'risk_level': RiskLevel.HIGH_RISK,
-                        'pathway': pathway + ["Missing Q5.8 response"],
-                        'rationale': 'incomplete_imputation_quality_assessment'
-                    }
-                
-                pathway.append(f"Q5.8 Appropriate imputation? -> {q5_8.value}")
-                
-                # All Q5.8 responses lead to Q5.10
-                q5_10 = responses.get('q5_10_evidence_not_biased')
-                pathway.append("Proceeding to Q5.10")
-                if q5_10:
-                    pathway.append(f"Q5.10 Evidence that result is not biased? -> {q5_10.value}")
-                
-                context = 'appropriate_imputation' if self._is_positive_response(q5_8) else 'poor_imputation'
-                evidence_result = self._assess_evidence_pathway(q5_10, context)
-                return {
-                    'risk_level': evidence_result['risk_level'],
-                    'pathway': pathway,
-                    'rationale': evidence_result['rationale']
-                }
+                    case Response.WEAK_YES | Response.NO_INFORMATION:
+                        # WY/NI -> Q5.10
+                        return self._finalize_q5_10(
+                            responses, pathway, 'exclusion_somewhat_related', "WY/NI path -> Proceeding to Q5.10"
+                        )
+                    
+                    case Response.STRONG_YES:
+                        # SY -> Q5.10
+                        return self._finalize_q5_10(
+                            responses, pathway, 'exclusion_related', "SY path -> Proceeding to Q5.10"
+                        )
             
-            elif self._is_negative_response(q5_7):
-                # N/PN -> Q5.9
-                q5_9 = responses.get('q5_9_appropriate_method')
-                if not q5_9:
-                    return {
-                        'risk_level': RiskLevel.HIGH_RISK,
-                        'pathway': pathway + ["Missing Q5.9 response"],
-                        'rationale': 'incomplete_method_assessment'
-                    }
-                
-                pathway.append(f"Q5.9 Appropriate method? -> {q5_9.value}")
+            # Analysis based on imputing missing values path
+            case Response.NO | Response.PROBABLY_NO:
+                # N/PN -> Q5.7
+                q5_7 = responses.get('q5_7_analysis_imputing')
+                if not q5_7:
+                    return {**_R_MISSING_Q5_7, 'pathway': pathway + ["Missing Q5.7 response"]}
                 
-                # All Q5.9 responses lead to Q5.10
-                q5_10 = responses.get('q5_10_evidence_not_biased')
-                pathway.append("Proceeding to Q5.10")
-                if q5_10:
-                    pathway.append(f"Q5.10 Evidence that result is not biased? -> {q5_10.value}")
+                pathway.append(f"Q5.7 Analysis based on imputing missing values? -> {_RESPONSE_VALUE[q5_7]}")
                 
-                context = 'appropriate_method' if self._is_positive_response(q5_9) else 'poor_method'
-                evidence_result = self._assess_evidence_pathway(q5_10, context)
-                return {
-                    'risk_level': evidence_result['risk_level'],
-                    'pathway': pathway,
-                    'rationale': evidence_result['rationale']
-                }
+                match q5_7:
+                    case Response.YES | Response.PROBABLY_YES:
+                        # Y/PY -> Q5.8
+                        q5_8 = responses.get('q5_8_appropriate_imputation')
+                        if not q5_8:
+                            return {**_R_MISSING_Q5_8, 'pathway': pathway + ["Missing Q5.8 response"]}
+                        
+                        pathway.append(f"Q5.8 Appropriate imputation? -> {_RESPONSE_VALUE[q5_8]}")
+                        
+                        # All Q5.8 responses lead to Q5.10
+                        context = 'appropriate_imputation' if self._is_positive_response(q5_8) else 'poor_imputation'
+                        return self._finalize_q5_10(responses, pathway, context, "Proceeding to Q5.10")
+                    
+                    case Response.NO | Response.PROBABLY_NO:
+                        # N/PN -> Q5.9
+                        q5_9 = responses.get('q5_9_appropriate_method')
+                        if not q5_9:
+                            return {**_R_MISSING_Q5_9, 'pathway': pathway + ["Missing Q5.9 response"]}
+                        
+                        pathway.append(f"Q5.9 Appropriate method? -> {_RESPONSE_VALUE[q5_9]}")
+                        
+                        # All Q5.9 responses lead to Q5.10
+                        context = 'appropriate_method' if self._is_positive_response(q5_9) else 'poor_method'
+                        return self._finalize_q5_10(responses, pathway, context, "Proceeding to Q5.10")
         
         # Default fallback
-        return {
-            'risk_level': RiskLevel.HIGH_RISK,
-            'pathway': pathway + ["Unexpected pathway - defaulting to HIGH RISK"],
-            'rationale': 'unexpected_pathway'
-        }
+        return {**_R_UNEXPECTED, 'pathway': pathway + ["Unexpected pathway - defaulting to HIGH RISK"]}
 
     def get_detailed_assessment(self, responses: Dict[str, Response]) -> Dict[str, Any]:
         """
@@ -321,55 +341,25 @@ class ROBINSEDomain5:
         result = self.assess_missing_data_bias(responses)
         
         # Add detailed explanations based on rationale
-        explanations = {
-            'complete_data_all_participants': 
-                "Complete data available for all participants across all relevant variables. "
-                "This eliminates missing data bias.",
-            
-            'predictors_included_strong': 
-                "Complete case analysis was used, but strong evidence that predictors of "
-                "missingness were included in the model, reducing bias risk.",
-            
-            'appropriate_imputation': 
-                "Missing data were handled using imputation methods, with evidence of "
-                "appropriate imputation techniques.",
-            
-            'poor_imputation': 
-                "Missing data were handled using imputation, but the imputation methods "
-                "may not be appropriate, creating potential bias.",
-            
-            'exclusion_related': 
-                "Exclusions from analysis appear related to the true outcome value, "
-                "creating substantial risk of bias.",
-            
-            'incomplete_data_assessment': 
-                "Insufficient information to assess completeness of data."
-        }
-        
-        result['explanation'] = explanations.get(
-            result['rationale'], 
-            f"Assessment based on: {result['rationale']}"
+        result['explanation'] = (
+            _EXPLANATIONS.get(result['rationale'])
+            or f"Assessment based on: {result['rationale']}"
         )
         
-        # Add missing data strategy assessment
-        missing_data_strategies = []
-        
-        if responses.get('q5_4_complete_case_analysis') in [Response.YES, Response.PROBABLY_YES]:
-            missing_data_strategies.append("Complete case analysis")
-        
-        if responses.get('q5_7_analysis_imputing') in [Response.YES, Response.PROBABLY_YES]:
-            missing_data_strategies.append("Imputation methods")
-            
-        if responses.get('q5_6_predictors_missingness') in [Response.YES, Response.PROBABLY_YES, Response.STRONG_YES]:
-            missing_data_strategies.append("Predictors of missingness modeled")
-        
-        result['missing_data_strategies'] = missing_data_strategies
+        # Add missing data strategy assessment (one bit per strategy)
+        get = responses.get
+        strategy_mask = (
+            (get('q5_4_complete_case_analysis') in _POSITIVE)
+            | (get('q5_7_analysis_imputing') in _POSITIVE) << 1
+            | (get('q5_6_predictors_missingness') in _POSITIVE_OR_STRONG_YES) << 2
+        )
+        result['missing_data_strategies'] = list(_STRATEGY_TABLE[strategy_mask])
         
         return result
 
     def get_questions(self) -> Dict[str, str]:
         """Return the algorithm questions"""
-        return self.questions.copy()
+        return dict(self._QUESTIONS)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -3,11 +3,27 @@ ROBINS-E Tool Domain 6: Risk of Bias due to Measurement of Outcomes
 Implementation of the algorithm for assessing bias in outcome measurement
 """
 
+import functools
+import itertools
+import sys
 from enum import Enum
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
-class Response(Enum):
-    """Possible responses to algorithm questions"""
+from robins_e_results import AssessmentResult
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Response(str, Enum):
+    """
+    Possible responses to algorithm questions
+    
+    The str mixin gives members C-level hashing and equality, which keeps the
+    decision table and bit lookups cheap while .value stays the code
+    """
     YES = "Y"
     PROBABLY_YES = "PY"
     NO = "N"
@@ -16,248 +32,428 @@ class Response(Enum):
     STRONG_YES = "SY"
     WEAK_YES = "WY"
 
-class RiskLevel(Enum):
+class RiskLevel(str, Enum):
     """Risk of bias levels"""
     LOW_RISK = "Low risk of bias"
     SOME_CONCERNS = "Some concerns"
     HIGH_RISK = "High risk of bias"
 
+# Integer codes for batch assessment: 0 marks a missing answer
+RESPONSE_CODES = {None: 0, **{response: code for code, response in enumerate(Response, start=1)}}
+# Risk levels indexed by the codes returned from assess_batch
+RISK_LEVELS_BY_CODE = tuple(RiskLevel)
+
+# One bit per response; each response group is a mask tested with a single AND
+_RESPONSE_BITS = {response: 1 << index for index, response in enumerate(Response)}
+_MASK_NI = _RESPONSE_BITS[Response.NO_INFORMATION]
+_MASK_SY = _RESPONSE_BITS[Response.STRONG_YES]
+_MASK_POSITIVE = _RESPONSE_BITS[Response.YES] | _RESPONSE_BITS[Response.PROBABLY_YES]
+_MASK_NEGATIVE = _RESPONSE_BITS[Response.NO] | _RESPONSE_BITS[Response.PROBABLY_NO]
+_MASK_POSITIVE_OR_NI = _MASK_POSITIVE | _MASK_NI
+_MASK_WEAK_YES_OR_NI = _RESPONSE_BITS[Response.WEAK_YES] | _MASK_NI
+
+# Rationale codes, interned so callers can compare them by identity
+RATIONALE_INCOMPLETE_MEASUREMENT = sys.intern('incomplete_measurement_assessment')
+RATIONALE_DIFFERENTIAL = sys.intern('differential_outcome_measurement')
+RATIONALE_INCOMPLETE_AWARENESS = sys.intern('incomplete_awareness_assessment')
+RATIONALE_ASSESSORS_UNAWARE = sys.intern('assessors_unaware_of_exposure')
+RATIONALE_INCOMPLETE_INFLUENCE = sys.intern('incomplete_influence_assessment')
+RATIONALE_AWARE_NOT_INFLUENCED = sys.intern('assessors_aware_but_not_influenced')
+RATIONALE_POSSIBLE_INFLUENCE = sys.intern('possible_assessment_influence')
+RATIONALE_STRONG_INFLUENCE = sys.intern('strong_assessment_influence')
+RATIONALE_UNEXPECTED = sys.intern('unexpected_case')
+
+def _outcome(risk_level: RiskLevel, rationale: str) -> MappingProxyType:
+    """Read-only result template for one decision tree outcome"""
+    return MappingProxyType({'risk_level': risk_level, 'rationale': rationale})
+
+# Fixed outcomes of the decision walk; only the pathway varies per answer set
+_R_INCOMPLETE_MEASUREMENT = _outcome(RiskLevel.SOME_CONCERNS, RATIONALE_INCOMPLETE_MEASUREMENT)
+_R_DIFFERENTIAL = _outcome(RiskLevel.HIGH_RISK, RATIONALE_DIFFERENTIAL)
+_R_INCOMPLETE_AWARENESS = _outcome(RiskLevel.SOME_CONCERNS, RATIONALE_INCOMPLETE_AWARENESS)
+_R_ASSESSORS_UNAWARE = _outcome(RiskLevel.LOW_RISK, RATIONALE_ASSESSORS_UNAWARE)
+_R_INCOMPLETE_INFLUENCE = _outcome(RiskLevel.HIGH_RISK, RATIONALE_INCOMPLETE_INFLUENCE)
+_R_AWARE_NOT_INFLUENCED = _outcome(RiskLevel.LOW_RISK, RATIONALE_AWARE_NOT_INFLUENCED)
+_R_POSSIBLE_INFLUENCE = _outcome(RiskLevel.SOME_CONCERNS, RATIONALE_POSSIBLE_INFLUENCE)
+_R_STRONG_INFLUENCE = _outcome(RiskLevel.HIGH_RISK, RATIONALE_STRONG_INFLUENCE)
+_R_UNEXPECTED = _outcome(RiskLevel.SOME_CONCERNS, RATIONALE_UNEXPECTED)
+
+# Pathway labels for the answers that continue to the next question
+_TO_Q6_2 = {
+    Response.NO: "N/PN path -> Proceeding to Q6.2",
+    Response.PROBABLY_NO: "N/PN path -> Proceeding to Q6.2",
+    Response.NO_INFORMATION: "NI path -> Proceeding to Q6.2",
+}
+_TO_Q6_3 = {
+    Response.YES: "Y/PY path -> Proceeding to Q6.3",
+    Response.PROBABLY_YES: "Y/PY path -> Proceeding to Q6.3",
+    Response.NO_INFORMATION: "NI path -> Proceeding to Q6.3",
+}
+
+# Presence bits for validate_responses: Q6.1 -> 4, Q6.2 -> 2, Q6.3 -> 1
+_Q6_1_PRESENT, _Q6_2_PRESENT, _Q6_3_PRESENT = 4, 2, 1
+
+# Answers that make Q6.2 and Q6.3 redundant once Q6.1 is Y/PY
+_FOLLOW_UP_KEYS = frozenset({'q6_2_assessors_aware', 'q6_3_assessment_influenced'})
+_FOLLOW_UP_NOT_NEEDED = "Q6.2 and Q6.3 not needed when Q6.1 is Y/PY (differential measurement)"
+
+def _validation_outcome(present: int, q6_2_negative: bool):
+    """Resolve the validation flow for one presence/answer signature when Q6.1 is not Y/PY"""
+    if not present & _Q6_1_PRESENT:
+        return False, ('q6_1_measurement_differs',), ()
+    if not present & _Q6_2_PRESENT:
+        return False, ('q6_2_assessors_aware',), ()
+    if q6_2_negative:
+        if present & _Q6_3_PRESENT:
+            return True, (), ("Q6.3 not needed when Q6.2 is N/PN (assessors unaware)",)
+        return True, (), ()
+    if not present & _Q6_3_PRESENT:
+        return False, ('q6_3_assessment_influenced',), ()
+    return True, (), ()
+
+# (presence bits, Q6.2 is N/PN) -> (is_valid, missing, recommendations)
+_VALIDATION_TABLE = {
+    key: _validation_outcome(*key)
+    for key in itertools.product(range(8), (False, True))
+}
+
 class ROBINSEDomain6:
     """ROBINS-E Domain 6 Algorithm Implementation"""
     
-    def __init__(self):
-        self.questions = {
-            'q6_1_measurement_differs': "6.1 Measurement of outcome differs by exposure?",
-            'q6_2_assessors_aware': "6.2 Outcome assessors aware of exposure history?",
-            'q6_3_assessment_influenced': "6.3 Assessment could be influenced by knowledge of exposure?"
-        }
+    __slots__ = ()
+    
+    # Shared read-only question text
+    _QUESTIONS = MappingProxyType({
+        'q6_1_measurement_differs': "6.1 Measurement of outcome differs by exposure?",
+        'q6_2_assessors_aware': "6.2 Outcome assessors aware of exposure history?",
+        'q6_3_assessment_influenced': "6.3 Assessment could be influenced by knowledge of exposure?"
+    })
+    questions = _QUESTIONS
+    
+    # Detailed explanations keyed by rationale
+    _EXPLANATIONS: ClassVar[Dict[str, str]] = {
+        RATIONALE_DIFFERENTIAL:
+            "Outcome measurement methods differed between exposure groups, creating "
+            "systematic bias in outcome assessment. This represents a fundamental flaw "
+            "that cannot be adequately corrected analytically.",
+
+        RATIONALE_ASSESSORS_UNAWARE:
+            "Outcome assessors were unaware of participants' exposure history, eliminating "
+            "the potential for assessment bias. This represents optimal blinding conditions.",
+
+        RATIONALE_AWARE_NOT_INFLUENCED:
+            "While outcome assessors were aware of exposure history, the assessment "
+            "process was unlikely to be influenced by this knowledge, maintaining objectivity.",
+
+        RATIONALE_POSSIBLE_INFLUENCE:
+            "Outcome assessors were aware of exposure history and this knowledge could "
+            "potentially influence their assessments, introducing some bias risk.",
+
+        RATIONALE_STRONG_INFLUENCE:
+            "Outcome assessors were aware of exposure history and this knowledge was "
+            "likely to strongly influence their assessments, creating substantial bias.",
+
+        RATIONALE_INCOMPLETE_MEASUREMENT:
+            "Insufficient information to assess whether outcome measurement differed by exposure.",
+
+        RATIONALE_INCOMPLETE_AWARENESS:
+            "Insufficient information to assess outcome assessor awareness of exposure.",
+
+        RATIONALE_INCOMPLETE_INFLUENCE:
+            "Cannot determine if assessment could be influenced by exposure knowledge."
+    }
+    
+    # Decision table and batch lookup array, shared by every instance and
+    # filled in once below the class
+    _decision: ClassVar[Dict[tuple, AssessmentResult]] = {}
+    _risk_lut: ClassVar[Optional['np.ndarray']] = None
     
     def _is_positive_response(self, response: Response) -> bool:
         """Check if response is positive (Y/PY)"""
-        return response in [Response.YES, Response.PROBABLY_YES]
+        return bool(_RESPONSE_BITS.get(response, 0) & _MASK_POSITIVE)
     
     def _is_negative_response(self, response: Response) -> bool:
         """Check if response is negative (N/PN)"""
-        return response in [Response.NO, Response.PROBABLY_NO]
+        return bool(_RESPONSE_BITS.get(response, 0) & _MASK_NEGATIVE)
     
     def _is_positive_or_ni(self, response: Response) -> bool:
         """Check if response is positive or no information (Y/PY/NI)"""
-        return response in [Response.YES, Response.PROBABLY_YES, Response.NO_INFORMATION]
+        return bool(_RESPONSE_BITS.get(response, 0) & _MASK_POSITIVE_OR_NI)
     
     def _is_weak_yes_or_ni(self, response: Response) -> bool:
         """Check if response is weak yes or no information (WY/NI)"""
-        return response in [Response.WEAK_YES, Response.NO_INFORMATION]
+        return bool(_RESPONSE_BITS.get(response, 0) & _MASK_WEAK_YES_OR_NI)
     
     def _is_strong_yes(self, response: Response) -> bool:
         """Check if response is strong yes (SY)"""
-        return response == Response.STRONG_YES
+        return bool(_RESPONSE_BITS.get(response, 0) & _MASK_SY)
 
-    def assess_outcome_measurement_bias(self, responses: Dict[str, Response]) -> Dict[str, Any]:
+    def _walk_decision_tree(self, q6_1: Optional[Response], q6_2: Optional[Response],
+                            q6_3: Optional[Response]) -> Dict[str, Any]:
         """
-        Assess risk of bias due to measurement of outcomes
+        Walk the Domain 6 decision tree for one combination of answers
         
-        Args:
-            responses: Dictionary containing responses to algorithm questions
-            
         Returns:
             Dictionary with risk assessment and pathway taken
         """
         pathway = []
         
         # Start with Q6.1 Measurement of outcome differs by exposure?
-        q6_1 = responses.get('q6_1_measurement_differs')
         if not q6_1:
-            return {
-                'risk_level': RiskLevel.SOME_CONCERNS,
-                'pathway': ["Missing Q6.1 response"],
-                'rationale': 'incomplete_measurement_assessment'
-            }
+            return {**_R_INCOMPLETE_MEASUREMENT, 'pathway': ["Missing Q6.1 response"]}
         
         pathway.append(f"Q6.1 Measurement of outcome differs by exposure? -> {q6_1.value}")
         
         # Direct path to HIGH RISK for differential measurement
         if self._is_positive_response(q6_1):
             pathway.append("Y/PY path -> HIGH RISK OF BIAS")
-            return {
-                'risk_level': RiskLevel.HIGH_RISK,
-                'pathway': pathway,
-                'rationale': 'differential_outcome_measurement'
-            }
+            return {**_R_DIFFERENTIAL, 'pathway': pathway}
         
         # N/PN and NI paths both proceed to Q6.2
-        if self._is_negative_response(q6_1) or q6_1 == Response.NO_INFORMATION:
-            if self._is_negative_response(q6_1):
-                pathway.append("N/PN path -> Proceeding to Q6.2")
-            else:
-                pathway.append("NI path -> Proceeding to Q6.2")
+        transition = _TO_Q6_2.get(q6_1)
+        if transition:
+            pathway.append(transition)
             
-            q6_2 = responses.get('q6_2_assessors_aware')
             if not q6_2:
-                return {
-                    'risk_level': RiskLevel.SOME_CONCERNS,
-                    'pathway': pathway + ["Missing Q6.2 response"],
-                    'rationale': 'incomplete_awareness_assessment'
-                }
+                return {**_R_INCOMPLETE_AWARENESS, 'pathway': pathway + ["Missing Q6.2 response"]}
             
             pathway.append(f"Q6.2 Outcome assessors aware of exposure history? -> {q6_2.value}")
             
             # Direct path to LOW RISK if assessors unaware
             if self._is_negative_response(q6_2):
                 pathway.append("N/PN path -> LOW RISK OF BIAS")
-                return {
-                    'risk_level': RiskLevel.LOW_RISK,
-                    'pathway': pathway,
-                    'rationale': 'assessors_unaware_of_exposure'
-                }
+                return {**_R_ASSESSORS_UNAWARE, 'pathway': pathway}
             
             # Y/PY/NI paths proceed to Q6.3
-            if self._is_positive_or_ni(q6_2):
-                if self._is_positive_response(q6_2):
-                    pathway.append("Y/PY path -> Proceeding to Q6.3")
-                else:
-                    pathway.append("NI path -> Proceeding to Q6.3")
+            transition = _TO_Q6_3.get(q6_2)
+            if transition:
+                pathway.append(transition)
                 
-                q6_3 = responses.get('q6_3_assessment_influenced')
                 if not q6_3:
-                    return {
-                        'risk_level': RiskLevel.HIGH_RISK,
-                        'pathway': pathway + ["Missing Q6.3 response -> HIGH RISK"],
-                        'rationale': 'incomplete_influence_assessment'
-                    }
+                    return {**_R_INCOMPLETE_INFLUENCE, 'pathway': pathway + ["Missing Q6.3 response -> HIGH RISK"]}
                 
                 pathway.append(f"Q6.3 Assessment could be influenced by knowledge of exposure? -> {q6_3.value}")
                 
                 # Assess influence potential
                 if self._is_negative_response(q6_3):
                     pathway.append("N/PN path -> LOW RISK OF BIAS")
-                    return {
-                        'risk_level': RiskLevel.LOW_RISK,
-                        'pathway': pathway,
-                        'rationale': 'assessors_aware_but_not_influenced'
-                    }
+                    return {**_R_AWARE_NOT_INFLUENCED, 'pathway': pathway}
                 
                 elif self._is_weak_yes_or_ni(q6_3):
                     pathway.append("WY/NI path -> SOME CONCERNS")
-                    return {
-                        'risk_level': RiskLevel.SOME_CONCERNS,
-                        'pathway': pathway,
-                        'rationale': 'possible_assessment_influence'
-                    }
+                    return {**_R_POSSIBLE_INFLUENCE, 'pathway': pathway}
                 
                 elif self._is_strong_yes(q6_3):
                     pathway.append("SY path -> HIGH RISK OF BIAS")
-                    return {
-                        'risk_level': RiskLevel.HIGH_RISK,
-                        'pathway': pathway,
-                        'rationale': 'strong_assessment_influence'
-                    }
+                    return {**_R_STRONG_INFLUENCE, 'pathway': pathway}
         
         # Default fallback (should not reach here with valid inputs)
-        return {
-            'risk_level': RiskLevel.SOME_CONCERNS,
-            'pathway': pathway + ["Unexpected pathway - defaulting to SOME CONCERNS"],
-            'rationale': 'unexpected_case'
-        }
+        return {**_R_UNEXPECTED, 'pathway': pathway + ["Unexpected pathway - defaulting to SOME CONCERNS"]}
 
-    def get_detailed_assessment(self, responses: Dict[str, Response]) -> Dict[str, Any]:
+    def _build_decision_table(self) -> Dict[tuple, tuple]:
         """
-        Get detailed assessment with additional context about outcome measurement
+        Enumerate every (Q6.1, Q6.2, Q6.3) combination once
+        
+        Returns:
+            Mapping of answer tuple to a shared AssessmentResult
+        """
+        answers = [None, *Response]
+        table = {}
+        for key in itertools.product(answers, repeat=3):
+            table[key] = self._to_result(self._walk_decision_tree(*key))
+        return table
+
+    def _to_result(self, result: Dict[str, Any]) -> AssessmentResult:
+        """Freeze a decision tree result dictionary"""
+        # Formatted pathway steps repeat across many keys, so share one copy of each
+        pathway = tuple(sys.intern(step) for step in result['pathway'])
+        return AssessmentResult(
+            risk_level=result['risk_level'],
+            rationale=result['rationale'],
+            pathway=pathway
+        )
+
+    def _read_answers(self, responses: Dict[str, Response]) -> tuple:
+        """Read the (Q6.1, Q6.2, Q6.3) answers from a responses dictionary once"""
+        return (
+            responses.get('q6_1_measurement_differs'),
+            responses.get('q6_2_assessors_aware'),
+            responses.get('q6_3_assessment_influenced')
+        )
+
+    def assess_from_tuple(self, q6_1: Optional[Response], q6_2: Optional[Response] = None,
+                          q6_3: Optional[Response] = None) -> Dict[str, Any]:
+        """
+        Assess risk of bias due to measurement of outcomes from positional answers
+        
+        Equivalent to assess_outcome_measurement_bias, for callers that already
+        hold the answers and want to skip building a responses dictionary
         
         Args:
-            responses: Dictionary containing responses to algorithm questions
+            q6_1: Response to Q6.1, or None if missing
+            q6_2: Response to Q6.2, or None if missing
+            q6_3: Response to Q6.3, or None if missing
             
         Returns:
-            Dictionary with detailed risk assessment and explanations
+            Dictionary with risk assessment and pathway taken
         """
-        result = self.assess_outcome_measurement_bias(responses)
+        try:
+            return self._decision[q6_1, q6_2, q6_3].as_dict()
+        except (KeyError, TypeError):
+            # Values outside the Response enum are walked directly
+            return self._walk_decision_tree(q6_1, q6_2, q6_3)
+
+    def assess_result(self, responses: Dict[str, Response]) -> AssessmentResult:
+        """
+        Assess risk of bias due to measurement of outcomes without copying
         
-        # Add detailed explanations based on rationale
-        explanations = {
-            'differential_outcome_measurement': 
-                "Outcome measurement methods differed between exposure groups, creating "
-                "systematic bias in outcome assessment. This represents a fundamental flaw "
-                "that cannot be adequately corrected analytically.",
-            
-            'assessors_unaware_of_exposure': 
-                "Outcome assessors were unaware of participants' exposure history, eliminating "
-                "the potential for assessment bias. This represents optimal blinding conditions.",
-            
-            'assessors_aware_but_not_influenced': 
-                "While outcome assessors were aware of exposure history, the assessment "
-                "process was unlikely to be influenced by this knowledge, maintaining objectivity.",
-            
-            'possible_assessment_influence': 
-                "Outcome assessors were aware of exposure history and this knowledge could "
-                "potentially influence their assessments, introducing some bias risk.",
+        Args:
+            responses: Dictionary containing responses to algorithm questions
             
-            'strong_assessment_influence': 
-                "Outcome assessors were aware of exposure history and this knowledge was "
-                "likely to strongly influence their assessments, creating substantial bias.",
+        Returns:
+            Shared, immutable AssessmentResult for the given answers
+        """
+        answers = self._read_answers(responses)
+        try:
+            return self._decision[answers]
+        except (KeyError, TypeError):
+            return self._to_result(self._walk_decision_tree(*answers))
+
+    def _build_risk_lut(self) -> 'np.ndarray':
+        """
+        Flatten the decision table into an int8 lookup array
+        
+        Returns:
+            Array indexed by [q6_1_code, q6_2_code, q6_3_code] holding risk codes
+        """
+        size = len(RESPONSE_CODES)
+        lut = np.empty((size, size, size), dtype=np.int8)
+        risk_codes = {risk_level: code for code, risk_level in enumerate(RISK_LEVELS_BY_CODE)}
+        for (q6_1, q6_2, q6_3), result in self._decision.items():
+            lut[RESPONSE_CODES[q6_1], RESPONSE_CODES[q6_2], RESPONSE_CODES[q6_3]] = risk_codes[result.risk_level]
+        return lut
+
+    def assess_batch(self, q6_1_codes, q6_2_codes, q6_3_codes) -> 'np.ndarray':
+        """
+        Assess risk of bias for many studies at once
+        
+        Args:
+            q6_1_codes: Array of Q6.1 answers encoded with RESPONSE_CODES
+            q6_2_codes: Array of Q6.2 answers encoded with RESPONSE_CODES
+            q6_3_codes: Array of Q6.3 answers encoded with RESPONSE_CODES
             
-            'incomplete_measurement_assessment': 
-                "Insufficient information to assess whether outcome measurement differed by exposure.",
+        Returns:
+            int8 array of risk codes; decode with RISK_LEVELS_BY_CODE
+        """
+        if self._risk_lut is None:
+            raise ImportError("NumPy is required for batch assessment")
+        
+        codes = tuple(np.asarray(column) for column in (q6_1_codes, q6_2_codes, q6_3_codes))
+        # NumPy indexing accepts negative codes, so reject bad input up front
+        if any(column.shape != codes[0].shape for column in codes):
+            raise ValueError("Q6.1, Q6.2 and Q6.3 code arrays must have the same shape")
+        for column in codes:
+            if not np.issubdtype(column.dtype, np.integer):
+                raise ValueError("Response codes must be integers")
+            if column.size and (column.min() < 0 or column.max() >= len(RESPONSE_CODES)):
+                raise IndexError("Response code out of range")
+        
+        return self._risk_lut[codes]
+
+    def assess_outcome_measurement_bias(self, responses: Dict[str, Response]) -> Dict[str, Any]:
+        """
+        Assess risk of bias due to measurement of outcomes
+        
+        Args:
+            responses: Dictionary containing responses to algorithm questions
             
-            'incomplete_awareness_assessment': 
-                "Insufficient information to assess outcome assessor awareness of exposure.",
+        Returns:
+            Dictionary with risk assessment and pathway taken
+        """
+        return self.assess_from_tuple(*self._read_answers(responses))
+
+    def get_detailed_assessment(self, responses: Dict[str, Response]) -> Dict[str, Any]:
+        """
+        Get detailed assessment with additional context about outcome measurement
+        
+        Args:
+            responses: Dictionary containing responses to algorithm questions
             
-            'incomplete_influence_assessment': 
-                "Cannot determine if assessment could be influenced by exposure knowledge."
-        }
+        Returns:
+            Dictionary with detailed risk assessment and explanations
+        """
+        # Read the answers once and share them between all three assessments
+        answers = self._read_answers(responses)
+        try:
+            details = _cached_detailed_assessment(*answers)
+        except TypeError:
+            # Unhashable answers cannot be cached
+            details = self._detailed_from_tuple(*answers)
         
-        result['explanation'] = explanations.get(
-            result['rationale'], 
-            f"Assessment based on: {result['rationale']}"
-        )
+        # Hand out a fresh dictionary so callers cannot alter the cached entry
+        result = details[0].as_dict()
+        result['explanation'], result['blinding_status'], result['bias_mechanism'] = details[1:]
+        return result
+
+    def _detailed_from_tuple(self, q6_1: Optional[Response], q6_2: Optional[Response],
+                             q6_3: Optional[Response]) -> tuple:
+        """
+        Compute the detailed assessment for positional answers
         
-        # Add blinding assessment
-        blinding_status = self._assess_blinding_status(responses)
-        result['blinding_status'] = blinding_status
+        Returns:
+            Tuple of (AssessmentResult, explanation, blinding status, bias mechanism)
+        """
+        try:
+            result = self._decision[q6_1, q6_2, q6_3]
+        except (KeyError, TypeError):
+            result = self._to_result(self._walk_decision_tree(q6_1, q6_2, q6_3))
         
-        # Add bias mechanism assessment
-        bias_mechanism = self._assess_bias_mechanism(responses)
-        result['bias_mechanism'] = bias_mechanism
+        # Add detailed explanations based on rationale
+        explanation = self._EXPLANATIONS.get(
+            result.rationale, 
+            f"Assessment based on: {result.rationale}"
+        )
         
-        return result
+        return (
+            result,
+            explanation,
+            self._assess_blinding_status(q6_1, q6_2),
+            self._assess_bias_mechanism(q6_1, q6_3)
+        )
 
-    def _assess_blinding_status(self, responses: Dict[str, Response]) -> str:
+    def _assess_blinding_status(self, q6_1: Optional[Response], q6_2: Optional[Response]) -> str:
         """Assess the blinding status of outcome assessment"""
-        q6_1 = responses.get('q6_1_measurement_differs')
-        q6_2 = responses.get('q6_2_assessors_aware')
-        
-        if q6_1 and self._is_positive_response(q6_1):
+        if _RESPONSE_BITS.get(q6_1, 0) & _MASK_POSITIVE:
             return "No blinding - differential measurement methods"
         
-        if q6_2:
-            if self._is_negative_response(q6_2):
-                return "Effective blinding - assessors unaware of exposure"
-            elif self._is_positive_response(q6_2):
-                return "No blinding - assessors aware of exposure"
-            elif q6_2 == Response.NO_INFORMATION:
-                return "Blinding status unclear"
+        q6_2_bits = _RESPONSE_BITS.get(q6_2, 0)
+        if q6_2_bits & _MASK_NEGATIVE:
+            return "Effective blinding - assessors unaware of exposure"
+        elif q6_2_bits & _MASK_POSITIVE:
+            return "No blinding - assessors aware of exposure"
+        elif q6_2_bits & _MASK_NI:
+            return "Blinding status unclear"
         
         return "Insufficient information to assess blinding"
 
-    def _assess_bias_mechanism(self, responses: Dict[str, Response]) -> str:
+    def _assess_bias_mechanism(self, q6_1: Optional[Response], q6_3: Optional[Response]) -> str:
         """Assess the primary mechanism of potential bias"""
-        q6_1 = responses.get('q6_1_measurement_differs')
-        q6_3 = responses.get('q6_3_assessment_influenced')
-        
-        if q6_1 and self._is_positive_response(q6_1):
+        if _RESPONSE_BITS.get(q6_1, 0) & _MASK_POSITIVE:
             return "Systematic measurement differences between exposure groups"
         
-        if q6_3:
-            if self._is_strong_yes(q6_3):
-                return "Strong potential for assessor bias due to exposure knowledge"
-            elif self._is_weak_yes_or_ni(q6_3):
-                return "Moderate potential for assessor bias"
-            elif self._is_negative_response(q6_3):
-                return "Minimal potential for assessor bias"
+        q6_3_bits = _RESPONSE_BITS.get(q6_3, 0)
+        if q6_3_bits & _MASK_SY:
+            return "Strong potential for assessor bias due to exposure knowledge"
+        elif q6_3_bits & _MASK_WEAK_YES_OR_NI:
+            return "Moderate potential for assessor bias"
+        elif q6_3_bits & _MASK_NEGATIVE:
+            return "Minimal potential for assessor bias"
         
         return "Bias mechanism unclear"
 
     def get_questions(self) -> Dict[str, str]:
         """Return the algorithm questions"""
-        return self.questions.copy()
+        return dict(self._QUESTIONS)
 
     def validate_responses(self, responses: Dict[str, Response]) -> Dict[str, Any]:
         """
@@ -269,129 +465,39 @@ class ROBINSEDomain6:
         Returns:
             Dictionary with validation results
         """
-        validation = {
-            'is_valid': True,
-            'missing_questions': [],
-            'logical_inconsistencies': [],
-            'recommendations': []
-        }
+        # Y/PY on Q6.1 settles the domain, so only the follow-up keys matter
+        if _RESPONSE_BITS.get(responses.get('q6_1_measurement_differs'), 0) & _MASK_POSITIVE:
+            return {
+                'is_valid': True,
+                'missing_questions': [],
+                'logical_inconsistencies': [],
+                'recommendations': [] if _FOLLOW_UP_KEYS.isdisjoint(responses) else [_FOLLOW_UP_NOT_NEEDED]
+            }
         
-        # Check Q6.1
-        if 'q6_1_measurement_differs' not in responses:
-            validation['is_valid'] = False
-            validation['missing_questions'].append('q6_1_measurement_differs')
-        else:
-            q6_1 = responses['q6_1_measurement_differs']
-            
-            # If Q6.1 is Y/PY, no further questions needed
-            if self._is_positive_response(q6_1):
-                # Check if unnecessary questions were answered
-                if 'q6_2_assessors_aware' in responses or 'q6_3_assessment_influenced' in responses:
-                    validation['recommendations'].append(
-                        "Q6.2 and Q6.3 not needed when Q6.1 is Y/PY (differential measurement)"
-                    )
-            else:
-                # Q6.2 is needed
-                if 'q6_2_assessors_aware' not in responses:
-                    validation['is_valid'] = False
-                    validation['missing_questions'].append('q6_2_assessors_aware')
-                else:
-                    q6_2 = responses['q6_2_assessors_aware']
-                    
-                    # If Q6.2 is N/PN, Q6.3 not needed
-                    if self._is_negative_response(q6_2):
-                        if 'q6_3_assessment_influenced' in responses:
-                            validation['recommendations'].append(
-                                "Q6.3 not needed when Q6.2 is N/PN (assessors unaware)"
-                            )
-                    else:
-                        # Q6.3 is needed
-                        if 'q6_3_assessment_influenced' not in responses:
-                            validation['is_valid'] = False
-                            validation['missing_questions'].append('q6_3_assessment_influenced')
+        present = (
+            (_Q6_1_PRESENT if 'q6_1_measurement_differs' in responses else 0)
+            | (_Q6_2_PRESENT if 'q6_2_assessors_aware' in responses else 0)
+            | (_Q6_3_PRESENT if 'q6_3_assessment_influenced' in responses else 0)
+        )
+        q6_2_negative = bool(present & _Q6_2_PRESENT) and (_RESPONSE_BITS.get(responses['q6_2_assessors_aware'], 0) & _MASK_NEGATIVE) != 0
+        is_valid, missing, recommendations = _VALIDATION_TABLE[present, q6_2_negative]
         
-        return validation
+        return {
+            'is_valid': is_valid,
+            'missing_questions': list(missing),
+            'logical_inconsistencies': [],
+            'recommendations': list(recommendations)
+        }
 
-# Example usage and testing
-if __name__ == "__main__":
-    robins_e_d6 = ROBINSEDomain6()
-    
-    # Example 1: Low risk - assessors unaware
-    responses_low = {
-        'q6_1_measurement_differs': Response.NO,
-        'q6_2_assessors_aware': Response.NO
-    }
-    
-    result_low = robins_e_d6.get_detailed_assessment(responses_low)
-    print("=== Low Risk Example ===")
-    print(f"Risk Level: {result_low['risk_level'].value}")
-    print(f"Rationale: {result_low['rationale']}")
-    print(f"Blinding Status: {result_low['blinding_status']}")
-    print(f"Bias Mechanism: {result_low['bias_mechanism']}")
-    print(f"Explanation: {result_low['explanation']}")
-    print()
-    
-    # Example 2: Some concerns - possible influence
-    responses_concerns = {
-        'q6_1_measurement_differs': Response.NO,
-        'q6_2_assessors_aware': Response.YES,
-        'q6_3_assessment_influenced': Response.WEAK_YES
-    }
-    
-    result_concerns = robins_e_d6.get_detailed_assessment(responses_concerns)
-    print("=== Some Concerns Example ===")
-    print(f"Risk Level: {result_concerns['risk_level'].value}")
-    print(f"Rationale: {result_concerns['rationale']}")
-    print(f"Blinding Status: {result_concerns['blinding_status']}")
-    print(f"Bias Mechanism: {result_concerns['bias_mechanism']}")
-    print(f"Explanation: {result_concerns['explanation']}")
-    print()
-    
-    # Example 3: High risk - differential measurement
-    responses_high_diff = {
-        'q6_1_measurement_differs': Response.YES
-    }
-    
-    result_high_diff = robins_e_d6.get_detailed_assessment(responses_high_diff)
-    print("=== High Risk (Differential Measurement) Example ===")
-    print(f"Risk Level: {result_high_diff['risk_level'].value}")
-    print(f"Rationale: {result_high_diff['rationale']}")
-    print(f"Blinding Status: {result_high_diff['blinding_status']}")
-    print(f"Bias Mechanism: {result_high_diff['bias_mechanism']}")
-    print(f"Explanation: {result_high_diff['explanation']}")
-    print()
-    
-    # Example 4: High risk - strong influence
-    responses_high_influence = {
-        'q6_1_measurement_differs': Response.NO,
-        'q6_2_assessors_aware': Response.YES,
-        'q6_3_assessment_influenced': Response.STRONG_YES
-    }
-    
-    result_high_influence = robins_e_d6.get_detailed_assessment(responses_high_influence)
-    print("=== High Risk (Strong Influence) Example ===")
-    print(f"Risk Level: {result_high_influence['risk_level'].value}")
-    print(f"Rationale: {result_high_influence['rationale']}")
-    print(f"Blinding Status: {result_high_influence['blinding_status']}")
-    print(f"Bias Mechanism: {result_high_influence['bias_mechanism']}")
-    print(f"Explanation: {result_high_influence['explanation']}")
-    print()
-    
-    # Example 5: Validation check
-    incomplete_responses = {
-        'q6_1_measurement_differs': Response.NO,
-        'q6_2_assessors_aware': Response.YES
-        # Missing Q6.3
-    }
-    
-    validation = robins_e_d6.validate_responses(incomplete_responses)
-    print("=== Validation Example ===")
-    print(f"Is Valid: {validation['is_valid']}")
-    print(f"Missing Questions: {validation['missing_questions']}")
-    print(f"Recommendations: {validation['recommendations']}")
-    print()
-    
-    # Print available questions for reference
-    print("=== Available Questions ===")
-    for key, question in robins_e_d6.get_questions().items():
-        print(f"{key}: {question}")
+# The decision table depends only on the algorithm, so it is built once at
+# import; the class has no per-instance state to set up first
+_shared = ROBINSEDomain6()
+ROBINSEDomain6._decision = _shared._build_decision_table()
+ROBINSEDomain6._risk_lut = _shared._build_risk_lut() if np is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_detailed_assessment(q6_1: Optional[Response], q6_2: Optional[Response],
+                                q6_3: Optional[Response]) -> tuple:
+    """Detailed assessment keyed only on the answers, shared by all instances"""
+    return _shared._detailed_from_tuple(q6_1, q6_2, q6_3)
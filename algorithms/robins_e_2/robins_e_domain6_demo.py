@@ -0,0 +1,92 @@
+"""
+Example usage of the ROBINS-E Domain 6 algorithm
+
+Kept apart from robins_e_domain6 so importing the algorithm does not
+carry the demo code. Run directly: python robins_e_domain6_demo.py
+"""
+
+from robins_e_domain6 import ROBINSEDomain6, Response
+
+# Example usage and testing
+if __name__ == "__main__":
+    robins_e_d6 = ROBINSEDomain6()
+    
+    # Example 1: Low risk - assessors unaware
+    responses_low = {
+        'q6_1_measurement_differs': Response.NO,
+        'q6_2_assessors_aware': Response.NO
+    }
+    
+    result_low = robins_e_d6.get_detailed_assessment(responses_low)
+    print("=== Low Risk Example ===")
+    print(f"Risk Level: {result_low['risk_level'].value}")
+    print(f"Rationale: {result_low['rationale']}")
+    print(f"Blinding Status: {result_low['blinding_status']}")
+    print(f"Bias Mechanism: {result_low['bias_mechanism']}")
+    print(f"Explanation: {result_low['explanation']}")
+    print()
+    
+    # Example 2: Some concerns - possible influence
+    responses_concerns = {
+        'q6_1_measurement_differs': Response.NO,
+        'q6_2_assessors_aware': Response.YES,
+        'q6_3_assessment_influenced': Response.WEAK_YES
+    }
+    
+    result_concerns = robins_e_d6.get_detailed_assessment(responses_concerns)
+    print("=== Some Concerns Example ===")
+    print(f"Risk Level: {result_concerns['risk_level'].value}")
+    print(f"Rationale: {result_concerns['rationale']}")
+    print(f"Blinding Status: {result_concerns['blinding_status']}")
+    print(f"Bias Mechanism: {result_concerns['bias_mechanism']}")
+    print(f"Explanation: {result_concerns['explanation']}")
+    print()
+    
+    # Example 3: High risk - differential measurement
+    responses_high_diff = {
+        'q6_1_measurement_differs': Response.YES
+    }
+    
+    result_high_diff = robins_e_d6.get_detailed_assessment(responses_high_diff)
+    print("=== High Risk (Differential Measurement) Example ===")
+    print(f"Risk Level: {result_high_diff['risk_level'].value}")
+    print(f"Rationale: {result_high_diff['rationale']}")
+    print(f"Blinding Status: {result_high_diff['blinding_status']}")
+    print(f"Bias Mechanism: {result_high_diff['bias_mechanism']}")
+    print(f"Explanation: {result_high_diff['explanation']}")
+    print()
+    
+    # Example 4: High risk - strong influence
+    responses_high_influence = {
+        'q6_1_measurement_differs': Response.NO,
+        'q6_2_assessors_aware': Response.YES,
+        'q6_3_assessment_influenced': Response.STRONG_YES
+    }
+    
+    result_high_influence = robins_e_d6.get_detailed_assessment(responses_high_influence)
+    print("=== High Risk (Strong Influence) Example ===")
+    print(f"Risk Level: {result_high_influence['risk_level'].value}")
+    print(f"Rationale: {result_high_influence['rationale']}")
+    print(f"Blinding Status: {result_high_influence['blinding_status']}")
+    print(f"Bias Mechanism: {result_high_influence['bias_mechanism']}")
+    print(f"Explanation: {result_high_influence['explanation']}")
+    print()
+    
+    # Example 5: Validation check
+    incomplete_responses = {
+        'q6_1_measurement_differs': Response.NO,
+        'q6_2_assessors_aware': Response.YES
+        # Missing Q6.3
+    }
+    
+    validation = robins_e_d6.validate_responses(incomplete_responses)
+    print("=== Validation Example ===")
+    print(f"Is Valid: {validation['is_valid']}")
+    print(f"Missing Questions: {validation['missing_questions']}")
+    print(f"Recommendations: {validation['recommendations']}")
+    print()
+    
+    # Print available questions for reference
+    print("=== Available Questions ===")
+    for key, question in robins_e_d6.get_questions().items():
+        print(f"{key}: {question}")
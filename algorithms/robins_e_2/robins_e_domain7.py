@@ -3,58 +3,251 @@ ROBINS-E Tool Domain 7: Risk of Bias in Reported Results
 Implementation of the algorithm for assessing selective reporting and multiple testing bias
 """
 
+import functools
+import itertools
+import sys
+from operator import itemgetter
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 
-class Response(Enum):
-    """Possible responses to algorithm questions"""
+from robins_e_results import AssessmentResult as BaseAssessmentResult
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+class Response(str, Enum):
+    """
+    Possible responses to algorithm questions
+    
+    The str mixin gives members C-level hashing, which keeps the bit lookups
+    below cheap while .value stays the response code
+    """
     YES = "Y"
     PROBABLY_YES = "PY"
     NO = "N"
     PROBABLY_NO = "PN"
     NO_INFORMATION = "NI"
 
-class RiskLevel(Enum):
+class RiskLevel(str, Enum):
     """Risk of bias levels"""
     LOW_RISK = "Low risk of bias"
     SOME_CONCERNS = "Some concerns"
     HIGH_RISK = "High risk of bias"
     VERY_HIGH_RISK = "Very high risk of bias"
 
+# Pathway step templates; the Q7.1 step is preformatted for every response
+_Q7_1_STEP = "Q7.1 Result reported according to analysis plan? -> %s"
+_Q7_1_PATHWAY = {response: _Q7_1_STEP % response.value for response in Response}
+_SELECTION_STEP = "Selection assessment: %d positive, %d no information, %d negative"
+
+# Integer codes for batch assessment: 0 marks a missing answer
+RESPONSE_CODES = {None: 0, **{response: code for code, response in enumerate(Response, start=1)}}
+# Risk levels indexed by the codes returned from assess_batch
+RISK_LEVELS_BY_CODE = tuple(RiskLevel)
+
+if njit is not None:
+    @njit(parallel=True)
+    def _score_kernel(codes, lut, out):
+        """Gather one risk code per row of (N, 5) response codes in a single fused loop"""
+        for i in prange(codes.shape[0]):
+            out[i] = lut[codes[i, 0], codes[i, 1], codes[i, 2], codes[i, 3], codes[i, 4]]
+else:
+    _score_kernel = None
+
+# One bit per response; each response group is a mask tested with a single AND
+_RESPONSE_BITS = {response: 1 << index for index, response in enumerate(Response)}
+_POS_MASK = _RESPONSE_BITS[Response.YES] | _RESPONSE_BITS[Response.PROBABLY_YES]
+_NEG_MASK = _RESPONSE_BITS[Response.NO] | _RESPONSE_BITS[Response.PROBABLY_NO]
+_NI_MASK = _RESPONSE_BITS[Response.NO_INFORMATION]
+_NEG_OR_NI_MASK = _NEG_MASK | _NI_MASK
+
+# Selection questions Q7.2-7.5, and every question key in positional order
+_SELECTION_QUESTIONS = (
+    'q7_2_multiple_exposure_measurements',
+    'q7_3_multiple_outcome_measurements',
+    'q7_4_multiple_analyses',
+    'q7_5_multiple_subgroups'
+)
+_ORDERED_KEYS = ('q7_1_result_according_plan', *_SELECTION_QUESTIONS)
+# Reads all five answers in one C-level call; raises KeyError if any is missing
+_all_answers = itemgetter(*_ORDERED_KEYS)
+
+@functools.lru_cache(maxsize=256)
+def _validation_outcome(present: frozenset, q7_1_positive: bool) -> tuple:
+    """
+    Resolve the validation flow for one set of answered questions
+    
+    Returns:
+        Tuple of (is_valid, missing_questions, recommendations, warnings)
+    """
+    # Check Q7.1
+    if 'q7_1_result_according_plan' not in present:
+        return False, ('q7_1_result_according_plan',), (), ()
+    
+    # If Q7.1 is Y/PY, selection questions not strictly needed
+    if q7_1_positive:
+        if present.isdisjoint(_SELECTION_QUESTIONS):
+            return True, (), (), ()
+        return True, (), (
+            "Selection questions (Q7.2-7.5) not needed when results follow analysis plan (Q7.1 Y/PY)",
+        ), ()
+    
+    # Q7.2-7.5 are needed for complete assessment
+    missing_selection = [q for q in _SELECTION_QUESTIONS if q not in present]
+    if not missing_selection:
+        return True, (), (), ()
+    return True, (), (
+        "Consider answering Q7.2-7.5 for comprehensive selective reporting assessment",
+    ), (
+        f"Missing selection questions for complete assessment: {missing_selection}",
+    )
+
+def _selection_risk(positive_count: int, ni_count: int) -> Tuple[RiskLevel, str]:
+    """Combination rule for a complete set of Q7.2-7.5 answers"""
+    if positive_count == 0 and ni_count == 0:
+        # All N/PN -> LOW RISK
+        return RiskLevel.LOW_RISK, 'no_selective_reporting'
+    elif positive_count == 0:
+        # At least one NI, but none Y/PY -> SOME CONCERNS
+        return RiskLevel.SOME_CONCERNS, 'unclear_selective_reporting'
+    elif positive_count <= 2:
+        # Up to two Y/PY -> HIGH RISK
+        return RiskLevel.HIGH_RISK, 'moderate_selective_reporting'
+    # More than two Y/PY -> VERY HIGH RISK
+    return RiskLevel.VERY_HIGH_RISK, 'extensive_selective_reporting'
+
+# (risk_level, rationale) indexed by [positive_count][ni_count]
+_SELECTION_RISK = tuple(
+    tuple(_selection_risk(positive_count, ni_count) for ni_count in range(len(_SELECTION_QUESTIONS) + 1))
+    for positive_count in range(len(_SELECTION_QUESTIONS) + 1)
+)
+
+@dataclass(frozen=True, slots=True)
+class AssessmentResult(BaseAssessmentResult):
+    """Domain 7 assessment outcome, with the selection details of Q7.2-7.5"""
+    # Selection details stay None/empty when Q7.2-7.5 were not assessed
+    positive_count: Optional[int] = None
+    ni_count: Optional[int] = None
+    negative_count: Optional[int] = None
+    selection_responses: Tuple[Tuple[str, Response], ...] = ()
+    missing_questions: Tuple[str, ...] = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a mutable dictionary in the shape assess_reported_results_bias has always used"""
+        # slots=True rebuilds the class, so zero-argument super() cannot be used
+        result = BaseAssessmentResult.as_dict(self)
+        if self.positive_count is not None:
+            result['positive_count'] = self.positive_count
+            result['ni_count'] = self.ni_count
+            result['negative_count'] = self.negative_count
+            result['selection_responses'] = dict(self.selection_responses)
+            result['missing_questions'] = list(self.missing_questions)
+        return result
+
 class ROBINSEDomain7:
     """ROBINS-E Domain 7 Algorithm Implementation"""
     
-    def __init__(self):
-        self.questions = {
-            'q7_1_result_according_plan': "7.1 Result reported according to analysis plan?",
-            'q7_2_multiple_exposure_measurements': "7.2 Result selected from multiple exposure measurements?",
-            'q7_3_multiple_outcome_measurements': "7.3 Result selected from multiple outcome measurements?",
-            'q7_4_multiple_analyses': "7.4 Result selected from multiple analyses of the data?",
-            'q7_5_multiple_subgroups': "7.5 Result selected from multiple subgroups?"
-        }
+    # Shared read-only question text
+    _QUESTIONS = MappingProxyType({
+        'q7_1_result_according_plan': "7.1 Result reported according to analysis plan?",
+        'q7_2_multiple_exposure_measurements': "7.2 Result selected from multiple exposure measurements?",
+        'q7_3_multiple_outcome_measurements': "7.3 Result selected from multiple outcome measurements?",
+        'q7_4_multiple_analyses': "7.4 Result selected from multiple analyses of the data?",
+        'q7_5_multiple_subgroups': "7.5 Result selected from multiple subgroups?"
+    })
+    questions = _QUESTIONS
+    selection_questions = _SELECTION_QUESTIONS
+    
+    # Detailed explanations keyed by rationale
+    _EXPLANATIONS = MappingProxyType({
+        'results_according_to_plan': 
+            "Results were reported according to a pre-specified analysis plan, minimizing "
+            "the risk of selective reporting bias. This represents best practice for "
+            "transparent research conduct.",
+        
+        'no_selective_reporting': 
+            "No evidence of selective reporting from multiple exposure measurements, "
+            "outcome measurements, analyses, or subgroups. Results appear to be "
+            "comprehensively reported.",
+        
+        'unclear_selective_reporting': 
+            "Some uncertainty about selective reporting practices, but no clear evidence "
+            "of selection from multiple alternatives. This may reflect incomplete "
+            "documentation rather than bias.",
         
-        self.selection_questions = [
-            'q7_2_multiple_exposure_measurements',
-            'q7_3_multiple_outcome_measurements', 
-            'q7_4_multiple_analyses',
-            'q7_5_multiple_subgroups'
-        ]
+        'moderate_selective_reporting': 
+            "Evidence of selective reporting from a limited number of alternatives "
+            "(exposure measurements, outcome measurements, analyses, or subgroups). "
+            "This creates substantial bias risk.",
+        
+        'extensive_selective_reporting': 
+            "Extensive evidence of selective reporting across multiple domains "
+            "(exposure measurements, outcome measurements, analyses, and subgroups). "
+            "This represents severe bias that undermines result reliability.",
+        
+        'incomplete_plan_adherence_assessment': 
+            "Insufficient information to assess whether results were reported according "
+            "to a pre-specified analysis plan.",
+        
+        'incomplete_selection_assessment': 
+            "Insufficient information to fully assess selective reporting practices."
+    })
+    
+    # Reporting issue labels keyed by selection question
+    _ISSUE_MAPPING = MappingProxyType({
+        'q7_2_multiple_exposure_measurements': "Selection from multiple exposure measurements",
+        'q7_3_multiple_outcome_measurements': "Selection from multiple outcome measurements", 
+        'q7_4_multiple_analyses': "Selection from multiple analyses",
+        'q7_5_multiple_subgroups': "Selection from multiple subgroups"
+    })
+    
+    # Bias severity keyed by (risk level, exactly one Y/PY selection answer)
+    _BIAS_SEVERITY = MappingProxyType({
+        **{(RiskLevel.LOW_RISK, single): "Minimal impact on result reliability"
+           for single in (False, True)},
+        **{(RiskLevel.SOME_CONCERNS, single): "Moderate uncertainty about result selection"
+           for single in (False, True)},
+        (RiskLevel.HIGH_RISK, True): "Substantial bias from single domain of selective reporting",
+        (RiskLevel.HIGH_RISK, False): "Substantial bias from multiple domains of selective reporting",
+        **{(RiskLevel.VERY_HIGH_RISK, single): "Severe bias undermining result credibility"
+           for single in (False, True)}
+    })
+    
+    # Decision table and batch lookup array; they depend only on the
+    # algorithm, so the first instance builds them for every later one
+    _table: Optional[Dict[Tuple[Optional[Response], ...], AssessmentResult]] = None
+    _risk_lut: Optional['np.ndarray'] = None
+    
+    def __init__(self):
+        if ROBINSEDomain7._table is None:
+            table = self._build_table()
+            ROBINSEDomain7._risk_lut = self._build_risk_lut(table) if np is not None else None
+            ROBINSEDomain7._table = table
     
     def _is_positive_response(self, response: Response) -> bool:
         """Check if response is positive (Y/PY)"""
-        return response in [Response.YES, Response.PROBABLY_YES]
+        return bool(_RESPONSE_BITS.get(response, 0) & _POS_MASK)
     
     def _is_negative_response(self, response: Response) -> bool:
         """Check if response is negative (N/PN)"""
-        return response in [Response.NO, Response.PROBABLY_NO]
+        return bool(_RESPONSE_BITS.get(response, 0) & _NEG_MASK)
     
     def _is_no_information(self, response: Response) -> bool:
         """Check if response is no information (NI)"""
-        return response == Response.NO_INFORMATION
+        return bool(_RESPONSE_BITS.get(response, 0) & _NI_MASK)
     
     def _is_negative_or_ni(self, response: Response) -> bool:
         """Check if response is negative or no information (N/PN/NI)"""
-        return response in [Response.NO, Response.PROBABLY_NO, Response.NO_INFORMATION]
+        return bool(_RESPONSE_BITS.get(response, 0) & _NEG_OR_NI_MASK)
 
     def _assess_selection_bias(self, responses: Dict[str, Response]) -> Dict[str, Any]:
         """
@@ -69,25 +262,24 @@ class ROBINSEDomain7:
         negative_count = 0
         
         # Collect responses for selection questions
-        for question in self.selection_questions:
+        for question in _SELECTION_QUESTIONS:
             response = responses.get(question)
             if response:
                 selection_responses[question] = response
                 
-                if self._is_positive_response(response):
-                    positive_count += 1
-                elif self._is_no_information(response):
-                    ni_count += 1
-                elif self._is_negative_response(response):
-                    negative_count += 1
+                # Groups are disjoint, so each answer adds to at most one count
+                bits = _RESPONSE_BITS.get(response, 0)
+                positive_count += (bits & _POS_MASK) != 0
+                ni_count += (bits & _NI_MASK) != 0
+                negative_count += (bits & _NEG_MASK) != 0
         
         # Determine risk level based on combination rules
-        total_questions = len(self.selection_questions)
+        total_questions = len(_SELECTION_QUESTIONS)
         answered_questions = len(selection_responses)
         
         # Check if all questions were answered
         if answered_questions < total_questions:
-            missing_questions = [q for q in self.selection_questions if q not in selection_responses]
+            missing_questions = [q for q in _SELECTION_QUESTIONS if q not in selection_responses]
             return {
                 'risk_level': RiskLevel.SOME_CONCERNS,
                 'rationale': 'incomplete_selection_assessment',
@@ -99,49 +291,23 @@ class ROBINSEDomain7:
             }
         
         # Apply combination rules from flowchart
-        if positive_count == 0 and ni_count == 0:
-            # All N/PN -> LOW RISK
-            return {
-                'risk_level': RiskLevel.LOW_RISK,
-                'rationale': 'no_selective_reporting',
-                'positive_count': positive_count,
-                'ni_count': ni_count,
-                'negative_count': negative_count,
-                'selection_responses': selection_responses
-            }
-        
-        elif positive_count == 0 and ni_count > 0:
-            # At least one NI, but none Y/PY -> SOME CONCERNS
-            return {
-                'risk_level': RiskLevel.SOME_CONCERNS,
-                'rationale': 'unclear_selective_reporting',
-                'positive_count': positive_count,
-                'ni_count': ni_count,
-                'negative_count': negative_count,
-                'selection_responses': selection_responses
-            }
-        
-        elif positive_count <= 2:
-            # Up to two Y/PY -> HIGH RISK
-            return {
-                'risk_level': RiskLevel.HIGH_RISK,
-                'rationale': 'moderate_selective_reporting',
-                'positive_count': positive_count,
-                'ni_count': ni_count,
-                'negative_count': negative_count,
-                'selection_responses': selection_responses
-            }
-        
-        else:  # positive_count > 2
-            # More than two Y/PY -> VERY HIGH RISK
-            return {
-                'risk_level': RiskLevel.VERY_HIGH_RISK,
-                'rationale': 'extensive_selective_reporting',
-                'positive_count': positive_count,
-                'ni_count': ni_count,
-                'negative_count': negative_count,
-                'selection_responses': selection_responses
-            }
+        risk_level, rationale = _SELECTION_RISK[positive_count][ni_count]
+        return {
+            'risk_level': risk_level,
+            'rationale': rationale,
+            'positive_count': positive_count,
+            'ni_count': ni_count,
+            'negative_count': negative_count,
+            'selection_responses': selection_responses
+        }
+
+    def _read_answers(self, responses: Dict[str, Response]) -> Tuple[Optional[Response], ...]:
+        """Read the (Q7.1, ..., Q7.5) answers, with None for any that are missing"""
+        try:
+            # Complete responses are the common case
+            return _all_answers(responses)
+        except KeyError:
+            return tuple(responses.get(question) for question in _ORDERED_KEYS)
 
     def assess_reported_results_bias(self, responses: Dict[str, Response]) -> Dict[str, Any]:
         """
@@ -153,10 +319,155 @@ class ROBINSEDomain7:
         Returns:
             Dictionary with risk assessment and pathway taken
         """
-        pathway = []
+        key = self._read_answers(responses)
+        try:
+            result = self._table[key]
+        except (KeyError, TypeError):
+            # Values outside the Response enum are evaluated directly
+            return self._evaluate(dict(zip(_ORDERED_KEYS, key)))
+        
+        # Hand out a fresh dictionary so callers cannot alter the shared entry
+        return result.as_dict()
+
+    def assess_result(self, responses: Dict[str, Response]) -> AssessmentResult:
+        """
+        Assess risk of bias in reported results without copying
+        
+        Args:
+            responses: Dictionary containing responses to algorithm questions
+            
+        Returns:
+            Shared, immutable AssessmentResult for the given responses
+        """
+        return self.assess_tuple(self._read_answers(responses))
+
+    def assess_tuple(self, answers: Tuple[Optional[Response], ...]) -> AssessmentResult:
+        """
+        Assess risk of bias in reported results from positional answers
+        
+        For hot loops that hold the answers already and want to skip
+        building and hashing a responses dictionary
+        
+        Args:
+            answers: Tuple of (Q7.1, Q7.2, Q7.3, Q7.4, Q7.5), None where missing
+            
+        Returns:
+            Shared, immutable AssessmentResult for the given answers
+        """
+        try:
+            return self._table[answers]
+        except (KeyError, TypeError):
+            if len(answers) != len(_ORDERED_KEYS):
+                raise ValueError(f"Expected {len(_ORDERED_KEYS)} answers, got {len(answers)}")
+            return self._to_result(self._evaluate(dict(zip(_ORDERED_KEYS, answers))))
+
+    def _build_risk_lut(self, table) -> 'np.ndarray':
+        """
+        Flatten a decision table into an int8 lookup array
+        
+        Returns:
+            Array indexed by the five response codes, Q7.1 first, holding risk codes
+        """
+        size = len(RESPONSE_CODES)
+        lut = np.empty((size,) * len(_ORDERED_KEYS), dtype=np.int8)
+        risk_codes = {risk_level: code for code, risk_level in enumerate(RISK_LEVELS_BY_CODE)}
+        for key, result in table.items():
+            lut[tuple(RESPONSE_CODES[answer] for answer in key)] = risk_codes[result.risk_level]
+        return lut
+
+    def assess_batch(self, response_codes) -> 'np.ndarray':
+        """
+        Assess risk of bias in reported results for many studies at once
         
+        Args:
+            response_codes: (N, 5) array of answers encoded with RESPONSE_CODES,
+                one row per study with columns Q7.1 to Q7.5
+            
+        Returns:
+            int8 array of N risk codes; decode with RISK_LEVELS_BY_CODE
+        """
+        if self._risk_lut is None:
+            raise ImportError("NumPy is required for batch assessment")
+        
+        codes = np.asarray(response_codes)
+        # The compiled kernel skips bounds checks and NumPy indexing accepts
+        # negative codes, so reject bad input before either path
+        if codes.ndim != 2 or codes.shape[1] != len(_ORDERED_KEYS):
+            raise ValueError(f"Expected an (N, {len(_ORDERED_KEYS)}) array of response codes")
+        if codes.size and not np.issubdtype(codes.dtype, np.integer):
+            raise ValueError("Response codes must be integers")
+        if codes.size and (codes.min() < 0 or codes.max() >= len(RESPONSE_CODES)):
+            raise IndexError("Response code out of range")
+        
+        if _score_kernel is None:
+            return self._risk_lut[tuple(codes.T)]
+        
+        out = np.empty(codes.shape[0], dtype=np.int8)
+        _score_kernel(np.ascontiguousarray(codes, dtype=np.int8), self._risk_lut, out)
+        return out
+
+    def assess_risk_level(self, responses: Dict[str, Response]) -> RiskLevel:
+        """
+        Assess only the risk level for reported results
+        
+        Skips copying the pathway and selection details for callers that
+        just need the judgement
+        
+        Args:
+            responses: Dictionary containing responses to algorithm questions
+            
+        Returns:
+            RiskLevel for the given responses
+        """
+        key = self._read_answers(responses)
+        try:
+            return self._table[key].risk_level
+        except (KeyError, TypeError):
+            return self._evaluate(dict(zip(_ORDERED_KEYS, key)))['risk_level']
+
+    def _build_table(self) -> Dict[Tuple[Optional[Response], ...], AssessmentResult]:
+        """
+        Evaluate every (Q7.1, ..., Q7.5) combination once
+        
+        Returns:
+            Mapping of answer tuple to the frozen assessment result
+        """
+        # Equal outcomes (e.g. every Q7.1 Y answer, whatever Q7.2-7.5 say) share one instance
+        unique = {}
+        table = {}
+        for key in itertools.product([None, *Response], repeat=len(_ORDERED_KEYS)):
+            result = self._to_result(self._evaluate(dict(zip(_ORDERED_KEYS, key))))
+            table[key] = unique.setdefault(result, result)
+        return table
+
+    def _to_result(self, result: Dict[str, Any]) -> AssessmentResult:
+        """Freeze an assessment result dictionary"""
+        return AssessmentResult(
+            risk_level=result['risk_level'],
+            rationale=result['rationale'],
+            # Formatted pathway steps repeat across many answer sets, so share one copy of each
+            pathway=tuple(sys.intern(step) for step in result['pathway']),
+            positive_count=result.get('positive_count'),
+            ni_count=result.get('ni_count'),
+            negative_count=result.get('negative_count'),
+            selection_responses=tuple(result.get('selection_responses', {}).items()),
+            missing_questions=tuple(result.get('missing_questions', ()))
+        )
+
+    def _evaluate(self, responses: Dict[str, Response]) -> Dict[str, Any]:
+        """Walk the Domain 7 algorithm for one set of responses"""
         # Start with Q7.1 Result reported according to analysis plan?
         q7_1 = responses.get('q7_1_result_according_plan')
+        
+        # Results reported according to plan are the common case, so they are
+        # tested first, by identity, and go directly to LOW RISK
+        if q7_1 is Response.YES or q7_1 is Response.PROBABLY_YES:
+            return {
+                'risk_level': RiskLevel.LOW_RISK,
+                'pathway': [_Q7_1_PATHWAY[q7_1], "Y/PY path -> LOW RISK OF BIAS"],
+                'rationale': 'results_according_to_plan'
+            }
+        
         if not q7_1:
             return {
                 'risk_level': RiskLevel.SOME_CONCERNS,
@@ -164,16 +475,7 @@ class ROBINSEDomain7:
                 'rationale': 'incomplete_plan_adherence_assessment'
             }
         
-        pathway.append(f"Q7.1 Result reported according to analysis plan? -> {q7_1.value}")
-        
-        # Direct path to LOW RISK if results according to plan
-        if self._is_positive_response(q7_1):
-            pathway.append("Y/PY path -> LOW RISK OF BIAS")
-            return {
-                'risk_level': RiskLevel.LOW_RISK,
-                'pathway': pathway,
-                'rationale': 'results_according_to_plan'
-            }
+        pathway = [_Q7_1_PATHWAY.get(q7_1) or _Q7_1_STEP % q7_1.value]
         
         # N/PN/NI path -> assess selective reporting
         pathway.append("N/PN/NI path -> Assessing selective reporting")
@@ -182,9 +484,11 @@ class ROBINSEDomain7:
         selection_assessment = self._assess_selection_bias(responses)
         
         # Add selection details to pathway
-        pathway.append(f"Selection assessment: {selection_assessment['positive_count']} positive, "
-                      f"{selection_assessment['ni_count']} no information, "
-                      f"{selection_assessment['negative_count']} negative")
+        pathway.append(_SELECTION_STEP % (
+            selection_assessment['positive_count'],
+            selection_assessment['ni_count'],
+            selection_assessment['negative_count']
+        ))
         
         return {
             'risk_level': selection_assessment['risk_level'],
@@ -210,41 +514,7 @@ class ROBINSEDomain7:
         result = self.assess_reported_results_bias(responses)
         
         # Add detailed explanations based on rationale
-        explanations = {
-            'results_according_to_plan': 
-                "Results were reported according to a pre-specified analysis plan, minimizing "
-                "the risk of selective reporting bias. This represents best practice for "
-                "transparent research conduct.",
-            
-            'no_selective_reporting': 
-                "No evidence of selective reporting from multiple exposure measurements, "
-                "outcome measurements, analyses, or subgroups. Results appear to be "
-                "comprehensively reported.",
-            
-            'unclear_selective_reporting': 
-                "Some uncertainty about selective reporting practices, but no clear evidence "
-                "of selection from multiple alternatives. This may reflect incomplete "
-                "documentation rather than bias.",
-            
-            'moderate_selective_reporting': 
-                "Evidence of selective reporting from a limited number of alternatives "
-                "(exposure measurements, outcome measurements, analyses, or subgroups). "
-                "This creates substantial bias risk.",
-            
-            'extensive_selective_reporting': 
-                "Extensive evidence of selective reporting across multiple domains "
-                "(exposure measurements, outcome measurements, analyses, and subgroups). "
-                "This represents severe bias that undermines result reliability.",
-            
-            'incomplete_plan_adherence_assessment': 
-                "Insufficient information to assess whether results were reported according "
-                "to a pre-specified analysis plan.",
-            
-            'incomplete_selection_assessment': 
-                "Insufficient information to fully assess selective reporting practices."
-        }
-        
-        result['explanation'] = explanations.get(
+        result['explanation'] = self._EXPLANATIONS.get(
             result['rationale'], 
             f"Assessment based on: {result['rationale']}"
         )
@@ -264,43 +534,24 @@ class ROBINSEDomain7:
         """Identify specific types of selective reporting"""
         issues = []
         
-        issue_mapping = {
-            'q7_2_multiple_exposure_measurements': "Selection from multiple exposure measurements",
-            'q7_3_multiple_outcome_measurements': "Selection from multiple outcome measurements", 
-            'q7_4_multiple_analyses': "Selection from multiple analyses",
-            'q7_5_multiple_subgroups': "Selection from multiple subgroups"
-        }
-        
         for question, response in selection_responses.items():
             if self._is_positive_response(response):
-                issues.append(issue_mapping.get(question, f"Issue with {question}"))
+                issues.append(self._ISSUE_MAPPING.get(question, f"Issue with {question}"))
             elif self._is_no_information(response):
-                issues.append(f"Unclear: {issue_mapping.get(question, question)}")
+                issues.append(f"Unclear: {self._ISSUE_MAPPING.get(question, question)}")
         
         return issues
 
     def _assess_bias_severity(self, result: Dict[str, Any]) -> str:
         """Assess the severity and impact of reporting bias"""
-        risk_level = result['risk_level']
-        positive_count = result.get('positive_count', 0)
-        
-        if risk_level == RiskLevel.LOW_RISK:
-            return "Minimal impact on result reliability"
-        elif risk_level == RiskLevel.SOME_CONCERNS:
-            return "Moderate uncertainty about result selection"
-        elif risk_level == RiskLevel.HIGH_RISK:
-            if positive_count == 1:
-                return "Substantial bias from single domain of selective reporting"
-            else:
-                return "Substantial bias from multiple domains of selective reporting"
-        elif risk_level == RiskLevel.VERY_HIGH_RISK:
-            return "Severe bias undermining result credibility"
-        
-        return "Unknown bias severity"
+        return self._BIAS_SEVERITY.get(
+            (result['risk_level'], result.get('positive_count', 0) == 1),
+            "Unknown bias severity"
+        )
 
     def get_questions(self) -> Dict[str, str]:
         """Return the algorithm questions"""
-        return self.questions.copy()
+        return dict(self._QUESTIONS)
 
     def validate_responses(self, responses: Dict[str, Response]) -> Dict[str, Any]:
         """
@@ -312,39 +563,19 @@ class ROBINSEDomain7:
         Returns:
             Dictionary with validation results
         """
-        validation = {
-            'is_valid': True,
-            'missing_questions': [],
-            'recommendations': [],
-            'warnings': []
-        }
+        present = frozenset(question for question in _ORDERED_KEYS if question in responses)
+        q7_1_positive = (
+            'q7_1_result_according_plan' in present
+            and self._is_positive_response(responses['q7_1_result_according_plan'])
+        )
+        is_valid, missing, recommendations, warnings = _validation_outcome(present, q7_1_positive)
         
-        # Check Q7.1
-        if 'q7_1_result_according_plan' not in responses:
-            validation['is_valid'] = False
-            validation['missing_questions'].append('q7_1_result_according_plan')
-        else:
-            q7_1 = responses['q7_1_result_according_plan']
-            
-            # If Q7.1 is Y/PY, selection questions not strictly needed
-            if self._is_positive_response(q7_1):
-                selection_answered = any(q in responses for q in self.selection_questions)
-                if selection_answered:
-                    validation['recommendations'].append(
-                        "Selection questions (Q7.2-7.5) not needed when results follow analysis plan (Q7.1 Y/PY)"
-                    )
-            else:
-                # Q7.2-7.5 are needed for complete assessment
-                missing_selection = [q for q in self.selection_questions if q not in responses]
-                if missing_selection:
-                    validation['warnings'].append(
-                        f"Missing selection questions for complete assessment: {missing_selection}"
-                    )
-                    validation['recommendations'].append(
-                        "Consider answering Q7.2-7.5 for comprehensive selective reporting assessment"
-                    )
-        
-        return validation
+        return {
+            'is_valid': is_valid,
+            'missing_questions': list(missing),
+            'recommendations': list(recommendations),
+            'warnings': list(warnings)
+        }
 
 # Example usage and testing
 if __name__ == "__main__":
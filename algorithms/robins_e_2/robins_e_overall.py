@@ -3,9 +3,21 @@ ROBINS-E Overall Assessment: Combining all domains into overall risk of bias jud
 Implementation of the algorithm for reaching overall bias assessment and conclusion threat evaluation
 """
 
+import sys
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
-from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 class DomainRisk(Enum):
     """Risk levels for individual domains"""
@@ -27,19 +39,201 @@ class ConclusionThreat(Enum):
     NO = "No"
     CANNOT_TELL = "Cannot tell"
 
+# Exact spellings of each level, as produced by the domain modules and by snake_case keys
+_RISK_LOOKUP = {
+    **{risk.value.lower(): risk for risk in DomainRisk},
+    **{risk.name.lower(): risk for risk in DomainRisk}
+}
+# Substring fallback, in priority order: the first phrase found decides the level
+_RISK_FALLBACK = (
+    ('low risk', DomainRisk.LOW_RISK),
+    ('low_risk', DomainRisk.LOW_RISK),
+    ('some concerns', DomainRisk.SOME_CONCERNS),
+    ('some_concerns', DomainRisk.SOME_CONCERNS),
+    ('very high risk', DomainRisk.VERY_HIGH_RISK),
+    ('very_high_risk', DomainRisk.VERY_HIGH_RISK),
+    ('high risk', DomainRisk.HIGH_RISK),
+    ('high_risk', DomainRisk.HIGH_RISK)
+)
+
+@lru_cache(maxsize=64)
+def _normalize_str(risk_input: str) -> Optional[DomainRisk]:
+    """
+    Match a risk level string to DomainRisk, or None if it names no level
+    
+    Cached because callers pass the same handful of spellings over and over
+    """
+    risk_str = risk_input.lower().strip()
+    
+    risk_level = _RISK_LOOKUP.get(risk_str)
+    if risk_level is not None:
+        return risk_level
+    
+    for phrase, risk_level in _RISK_FALLBACK:
+        if phrase in risk_str:
+            return risk_level
+    return None
+
+def _outcome(overall_risk: OverallRisk, rationale: str) -> MappingProxyType:
+    """Read-only result template for one overall judgement"""
+    return MappingProxyType({'overall_risk': overall_risk, 'rationale': rationale})
+
+# Fixed slot for each domain risk level in the per-assessment count list
+_RISK_INDEX = {risk: index for index, risk in enumerate(DomainRisk)}
+_LOW = _RISK_INDEX[DomainRisk.LOW_RISK]
+_SOME = _RISK_INDEX[DomainRisk.SOME_CONCERNS]
+_HIGH = _RISK_INDEX[DomainRisk.HIGH_RISK]
+_VERY_HIGH = _RISK_INDEX[DomainRisk.VERY_HIGH_RISK]
+
+# Public batch encoding: domain risk codes in, overall risk codes out
+DOMAIN_RISK_CODES = MappingProxyType(_RISK_INDEX)
+OVERALL_RISKS_BY_CODE = (
+    OverallRisk.LOW_RISK_EXCEPT_CONFOUNDING,
+    OverallRisk.SOME_CONCERNS,
+    OverallRisk.HIGH_RISK,
+    OverallRisk.VERY_HIGH_RISK
+)
+
+def _risk_counts(counts: List[int]) -> Dict[DomainRisk, int]:
+    """Per-level domain counts as a dictionary, omitting levels with no domains"""
+    return {risk: counts[index] for risk, index in _RISK_INDEX.items() if counts[index]}
+
+# Rationale codes, interned so callers can compare them by identity
+RATIONALE_VERY_HIGH_DOMAIN = sys.intern('at_least_one_very_high_risk_domain')
+RATIONALE_SEVERAL_HIGH = sys.intern('several_high_risk_domains_additive')
+RATIONALE_HIGH_DOMAIN = sys.intern('at_least_one_high_risk_domain')
+RATIONALE_SEVERAL_SOME_CONCERNS = sys.intern('several_some_concerns_domains_additive')
+RATIONALE_SOME_CONCERNS_DOMAIN = sys.intern('at_least_one_some_concerns_domain')
+RATIONALE_ALL_LOW = sys.intern('low_risk_all_domains_confounding_caveat')
+RATIONALE_UNEXPECTED = sys.intern('unexpected_risk_combination')
+RATIONALE_INCOMPLETE = sys.intern('incomplete_domain_assessments')
+RATIONALE_NO_THREATS = sys.intern('no_threat_assessments_provided')
+RATIONALE_THREATENS = sys.intern('bias_threatens_conclusions_in_any_domain')
+RATIONALE_DOES_NOT_THREATEN = sys.intern('bias_does_not_threaten_conclusions')
+RATIONALE_UNCERTAIN_THREAT = sys.intern('uncertain_threat_assessment')
+
+# Combination rules as (risk slot, minimum count, outcome, details key), strongest first.
+# The "several" thresholds for the additive judgements can be adjusted here.
+_OVERALL_RULES = (
+    # At least one Very High risk domain
+    (_VERY_HIGH, 1,
+     _outcome(OverallRisk.VERY_HIGH_RISK, RATIONALE_VERY_HIGH_DOMAIN), 'very_high_count'),
+    # Several domains at High risk (additive judgment)
+    (_HIGH, 3,
+     _outcome(OverallRisk.VERY_HIGH_RISK, RATIONALE_SEVERAL_HIGH), 'high_count'),
+    # At least one High risk domain
+    (_HIGH, 1,
+     _outcome(OverallRisk.HIGH_RISK, RATIONALE_HIGH_DOMAIN), 'high_count'),
+    # Several domains at Some concerns (additive judgment)
+    (_SOME, 4,
+     _outcome(OverallRisk.HIGH_RISK, RATIONALE_SEVERAL_SOME_CONCERNS), 'some_concerns_count'),
+    # At least one Some concerns domain
+    (_SOME, 1,
+     _outcome(OverallRisk.SOME_CONCERNS, RATIONALE_SOME_CONCERNS_DOMAIN), 'some_concerns_count')
+)
+_LOW_EXCEPT_CONFOUNDING = _outcome(OverallRisk.LOW_RISK_EXCEPT_CONFOUNDING, RATIONALE_ALL_LOW)
+_UNEXPECTED_COMBINATION = _outcome(OverallRisk.SOME_CONCERNS, RATIONALE_UNEXPECTED)
+
+# _OVERALL_RULES flattened for batch assessment: the risk slot, minimum count
+# and overall risk code of each rule, in the same strongest-first order
+_RULE_SLOTS = tuple(index for index, _, _, _ in _OVERALL_RULES)
+_RULE_THRESHOLDS = tuple(threshold for _, threshold, _, _ in _OVERALL_RULES)
+_RULE_CODES = tuple(OVERALL_RISKS_BY_CODE.index(template['overall_risk'])
+                    for _, _, template, _ in _OVERALL_RULES)
+_ALL_LOW_CODE = OVERALL_RISKS_BY_CODE.index(_LOW_EXCEPT_CONFOUNDING['overall_risk'])
+
+if njit is not None:
+    @njit(parallel=True)
+    def _overall_kernel(codes, out, rule_slots, rule_thresholds, rule_codes, default_code):
+        """Apply the combination rules to each row of (N, 7) domain risk codes"""
+        for i in prange(codes.shape[0]):
+            out[i] = default_code
+            for r in range(rule_slots.shape[0]):
+                count = 0
+                for j in range(codes.shape[1]):
+                    if codes[i, j] == rule_slots[r]:
+                        count += 1
+                if count >= rule_thresholds[r]:
+                    out[i] = rule_codes[r]
+                    break
+else:
+    _overall_kernel = None
+
+# Human-readable explanation for each overall rationale
+_EXPLANATIONS = MappingProxyType({
+    RATIONALE_ALL_LOW:
+        "The study shows low risk of bias across all domains. However, as with all observational studies, "
+        "there remains the possibility of uncontrolled confounding that has not been adequately addressed.",
+
+    RATIONALE_SOME_CONCERNS_DOMAIN:
+        "The study has some concerns about bias, with at least one domain showing potential issues, "
+        "but no domains have high or very high risk of bias.",
+
+    RATIONALE_HIGH_DOMAIN:
+        "The study has important problems with at least one domain showing high risk of bias, "
+        "which could substantially affect the reliability of the results.",
+
+    RATIONALE_SEVERAL_SOME_CONCERNS:
+        "While individual domains show only some concerns, the cumulative effect of multiple domains "
+        "with potential bias issues elevates the overall assessment to high risk.",
+
+    RATIONALE_VERY_HIGH_DOMAIN:
+        "The study has very serious problems with at least one domain showing very high risk of bias, "
+        "which severely undermines confidence in the results.",
+
+    RATIONALE_SEVERAL_HIGH:
+        "Multiple domains show high risk of bias, and the cumulative effect of these problems "
+        "elevates the overall assessment to very high risk."
+})
+# Sentence appended to the explanation for each conclusion threat judgement
+_THREAT_SUFFIX = MappingProxyType({
+    ConclusionThreat.YES: " The identified biases are likely to threaten the validity of the study conclusions.",
+    ConclusionThreat.NO: " Despite the identified bias concerns, they are unlikely to threaten the main study conclusions.",
+    ConclusionThreat.CANNOT_TELL: " It is unclear whether the identified biases threaten the study conclusions."
+})
+# Standard recommendations for each overall judgement, before any domain-specific ones
+_RECOMMENDATIONS = MappingProxyType({
+    OverallRisk.LOW_RISK_EXCEPT_CONFOUNDING: (
+        "Consider additional sensitivity analyses to address potential unmeasured confounding",
+        "Discuss the potential impact of residual confounding in limitations",
+        "Results can be interpreted with moderate confidence"
+    ),
+    OverallRisk.SOME_CONCERNS: (
+        "Address the identified bias concerns in study interpretation",
+        "Consider additional analyses to assess bias impact",
+        "Results should be interpreted with caution"
+    ),
+    OverallRisk.HIGH_RISK: (
+        "Substantial bias concerns require careful interpretation",
+        "Consider whether results are reliable enough for decision-making",
+        "Additional studies with better methodology may be needed"
+    ),
+    OverallRisk.VERY_HIGH_RISK: (
+        "Very serious bias concerns severely limit result reliability",
+        "Results should not be used for decision-making without major caveats",
+        "New studies with improved methodology are strongly recommended"
+    )
+})
+
 class ROBINSEOverallAssessment:
     """ROBINS-E Overall Assessment Implementation"""
     
-    def __init__(self):
-        self.domain_names = {
-            'domain_1': "Domain 1: Confounding",
-            'domain_2': "Domain 2: Measurement of Exposure",
-            'domain_3': "Domain 3: Selection and Timing",
-            'domain_4': "Domain 4: Post-Exposure Interventions", 
-            'domain_5': "Domain 5: Missing Data",
-            'domain_6': "Domain 6: Measurement of Outcomes",
-            'domain_7': "Domain 7: Bias in Reported Results"
-        }
+    # The assessor is stateless, so instances carry no attribute storage
+    __slots__ = ()
+    
+    # Shared by all instances; read-only so no assessment can alter it
+    _DOMAIN_NAMES = MappingProxyType({
+        'domain_1': "Domain 1: Confounding",
+        'domain_2': "Domain 2: Measurement of Exposure",
+        'domain_3': "Domain 3: Selection and Timing",
+        'domain_4': "Domain 4: Post-Exposure Interventions",
+        'domain_5': "Domain 5: Missing Data",
+        'domain_6': "Domain 6: Measurement of Outcomes",
+        'domain_7': "Domain 7: Bias in Reported Results"
+    })
+    _DOMAIN_KEYS = tuple(_DOMAIN_NAMES)
+    _DOMAIN_KEY_SET = frozenset(_DOMAIN_KEYS)
+    domain_names = _DOMAIN_NAMES
     
     def _normalize_risk_level(self, risk_input: Any) -> DomainRisk:
         """
@@ -50,16 +244,9 @@ class ROBINSEOverallAssessment:
         
         # Handle string inputs
         if isinstance(risk_input, str):
-            risk_str = risk_input.lower().strip()
-            
-            if any(phrase in risk_str for phrase in ['low risk', 'low_risk']):
-                return DomainRisk.LOW_RISK
-            elif any(phrase in risk_str for phrase in ['some concerns', 'some_concerns']):
-                return DomainRisk.SOME_CONCERNS
-            elif any(phrase in risk_str for phrase in ['very high risk', 'very_high_risk']):
-                return DomainRisk.VERY_HIGH_RISK
-            elif any(phrase in risk_str for phrase in ['high risk', 'high_risk']):
-                return DomainRisk.HIGH_RISK
+            risk_level = _normalize_str(risk_input)
+            if risk_level is not None:
+                return risk_level
         
         # Handle enum-like objects with value attribute
         if hasattr(risk_input, 'value'):
@@ -83,129 +270,130 @@ class ROBINSEOverallAssessment:
         Returns:
             Dictionary with overall risk assessment
         """
+        # Check completeness up front; present domains are still validated first
+        missing = self._DOMAIN_KEY_SET.difference(domain_assessments)
+        present_keys = self._DOMAIN_KEYS
+        if missing:
+            present_keys = [key for key in self._DOMAIN_KEYS if key not in missing]
+        
         # Validate and normalize domain assessments
         normalized_assessments = {}
-        missing_domains = []
         
-        for domain_key in self.domain_names.keys():
-            if domain_key in domain_assessments:
-                try:
-                    normalized_assessments[domain_key] = self._normalize_risk_level(
-                        domain_assessments[domain_key]
-                    )
-                except ValueError as e:
-                    return {
-                        'overall_risk': OverallRisk.SOME_CONCERNS,
-                        'rationale': f'invalid_risk_level_for_{domain_key}',
-                        'error': str(e),
-                        'domain_assessments': domain_assessments
-                    }
-            else:
-                missing_domains.append(domain_key)
+        for domain_key in present_keys:
+            value = domain_assessments[domain_key]
+            # DomainRisk members are the common case and need no normalizing
+            if type(value) is DomainRisk:
+                normalized_assessments[domain_key] = value
+                continue
+            try:
+                normalized_assessments[domain_key] = self._normalize_risk_level(value)
+            except ValueError as e:
+                return {
+                    'overall_risk': OverallRisk.SOME_CONCERNS,
+                    'rationale': f'invalid_risk_level_for_{domain_key}',
+                    'error': str(e),
+                    'domain_assessments': domain_assessments
+                }
         
-        if missing_domains:
+        if missing:
             return {
                 'overall_risk': OverallRisk.SOME_CONCERNS,
-                'rationale': 'incomplete_domain_assessments',
-                'missing_domains': missing_domains,
+                'rationale': RATIONALE_INCOMPLETE,
+                'missing_domains': [key for key in self._DOMAIN_KEYS if key in missing],
                 'domain_assessments': normalized_assessments
             }
         
-        # Count risk levels across domains
-        risk_counts = Counter(normalized_assessments.values())
+        # Group domains into one fixed slot per risk level in a single pass
+        domains_by_risk = [[] for _ in _RISK_INDEX]
+        for domain_key, risk in normalized_assessments.items():
+            domains_by_risk[_RISK_INDEX[risk]].append(domain_key)
+        counts = [len(domains) for domains in domains_by_risk]
         
         # Apply overall assessment algorithm
-        overall_assessment = self._determine_overall_risk(normalized_assessments, risk_counts)
+        overall_assessment = self._determine_overall_risk(domains_by_risk, counts)
         
         return {
             'overall_risk': overall_assessment['overall_risk'],
             'rationale': overall_assessment['rationale'],
             'domain_assessments': normalized_assessments,
-            'risk_counts': dict(risk_counts),
+            'risk_counts': _risk_counts(counts),
             'contributing_domains': overall_assessment.get('contributing_domains', []),
             'assessment_details': overall_assessment.get('details', {})
         }
 
-    def _determine_overall_risk(self, domain_assessments: Dict[str, DomainRisk], 
-                              risk_counts: Counter) -> Dict[str, Any]:
+    def _determine_overall_risk(self, domains_by_risk: List[List[str]],
+                              counts: List[int]) -> Dict[str, Any]:
         """
         Determine overall risk level based on domain assessments and combination rules
-        """
-        # Check for Very High Risk conditions
-        if risk_counts[DomainRisk.VERY_HIGH_RISK] >= 1:
-            very_high_domains = [domain for domain, risk in domain_assessments.items() 
-                               if risk == DomainRisk.VERY_HIGH_RISK]
-            return {
-                'overall_risk': OverallRisk.VERY_HIGH_RISK,
-                'rationale': 'at_least_one_very_high_risk_domain',
-                'contributing_domains': very_high_domains,
-                'details': {'very_high_count': risk_counts[DomainRisk.VERY_HIGH_RISK]}
-            }
-        
-        # Alternative Very High Risk: Several domains at High risk (additive judgment)
-        if risk_counts[DomainRisk.HIGH_RISK] >= 3:  # Threshold for "several" - can be adjusted
-            high_domains = [domain for domain, risk in domain_assessments.items() 
-                          if risk == DomainRisk.HIGH_RISK]
-            return {
-                'overall_risk': OverallRisk.VERY_HIGH_RISK,
-                'rationale': 'several_high_risk_domains_additive',
-                'contributing_domains': high_domains,
-                'details': {'high_count': risk_counts[DomainRisk.HIGH_RISK]}
-            }
         
-        # Check for High Risk conditions
-        if risk_counts[DomainRisk.HIGH_RISK] >= 1:
-            high_domains = [domain for domain, risk in domain_assessments.items() 
-                          if risk == DomainRisk.HIGH_RISK]
-            return {
-                'overall_risk': OverallRisk.HIGH_RISK,
-                'rationale': 'at_least_one_high_risk_domain',
-                'contributing_domains': high_domains,
-                'details': {'high_count': risk_counts[DomainRisk.HIGH_RISK]}
-            }
-        
-        # Alternative High Risk: Several domains at Some concerns (additive judgment)
-        if risk_counts[DomainRisk.SOME_CONCERNS] >= 4:  # Threshold for "several" - can be adjusted
-            concern_domains = [domain for domain, risk in domain_assessments.items() 
-                             if risk == DomainRisk.SOME_CONCERNS]
-            return {
-                'overall_risk': OverallRisk.HIGH_RISK,
-                'rationale': 'several_some_concerns_domains_additive',
-                'contributing_domains': concern_domains,
-                'details': {'some_concerns_count': risk_counts[DomainRisk.SOME_CONCERNS]}
-            }
-        
-        # Check for Some Concerns
-        if risk_counts[DomainRisk.SOME_CONCERNS] >= 1:
-            concern_domains = [domain for domain, risk in domain_assessments.items() 
-                             if risk == DomainRisk.SOME_CONCERNS]
-            return {
-                'overall_risk': OverallRisk.SOME_CONCERNS,
-                'rationale': 'at_least_one_some_concerns_domain',
-                'contributing_domains': concern_domains,
-                'details': {'some_concerns_count': risk_counts[DomainRisk.SOME_CONCERNS]}
-            }
+        Args:
+            domains_by_risk: Domain keys per risk level, indexed by _RISK_INDEX
+            counts: Number of domains per risk level, indexed by _RISK_INDEX
+        """
+        # Rules are tried in order; the first threshold reached decides
+        for index, threshold, template, count_key in _OVERALL_RULES:
+            count = counts[index]
+            if count >= threshold:
+                return {
+                    **template,
+                    'contributing_domains': domains_by_risk[index],
+                    'details': {count_key: count}
+                }
         
         # Low risk except for confounding concerns
-        # This applies when Domain 1 is Low risk and all other domains are Low risk
-        if (domain_assessments.get('domain_1') == DomainRisk.LOW_RISK and 
-            all(risk == DomainRisk.LOW_RISK for domain, risk in domain_assessments.items() 
-                if domain != 'domain_1')):
+        # This applies when every domain, Domain 1 included, is Low risk
+        if counts[_LOW] == len(self._DOMAIN_KEYS):
             return {
-                'overall_risk': OverallRisk.LOW_RISK_EXCEPT_CONFOUNDING,
-                'rationale': 'low_risk_all_domains_confounding_caveat',
+                **_LOW_EXCEPT_CONFOUNDING,
                 'contributing_domains': [],
                 'details': {'all_low_risk': True}
             }
         
         # This shouldn't happen with valid inputs, but provides fallback
         return {
-            'overall_risk': OverallRisk.SOME_CONCERNS,
-            'rationale': 'unexpected_risk_combination',
+            **_UNEXPECTED_COMBINATION,
             'contributing_domains': [],
-            'details': {'risk_counts': dict(risk_counts)}
+            'details': {'risk_counts': _risk_counts(counts)}
         }
 
+    def assess_overall_bias_risk_batch(self, risk_codes) -> 'np.ndarray':
+        """
+        Assess overall risk of bias for many studies at once
+
+        Args:
+            risk_codes: (N, 7) array of domain risks encoded with DOMAIN_RISK_CODES,
+                one row per study with columns domain_1 to domain_7
+
+        Returns:
+            int8 array of N overall risk codes; decode with OVERALL_RISKS_BY_CODE
+        """
+        if np is None:
+            raise ImportError("NumPy is required for batch assessment")
+
+        codes = np.asarray(risk_codes)
+        if codes.ndim != 2 or codes.shape[1] != len(self._DOMAIN_KEYS):
+            raise ValueError(f"Expected an (N, {len(self._DOMAIN_KEYS)}) array of domain risk codes")
+        if codes.size and not np.issubdtype(codes.dtype, np.integer):
+            raise ValueError("Domain risk codes must be integers")
+        if codes.size and (codes.min() < 0 or codes.max() >= len(DOMAIN_RISK_CODES)):
+            raise IndexError("Domain risk code out of range")
+
+        codes = np.ascontiguousarray(codes, dtype=np.int8)
+        out = np.empty(codes.shape[0], dtype=np.int8)
+        if _overall_kernel is not None:
+            _overall_kernel(codes, out, np.array(_RULE_SLOTS, dtype=np.int8),
+                            np.array(_RULE_THRESHOLDS), np.array(_RULE_CODES, dtype=np.int8),
+                            _ALL_LOW_CODE)
+            return out
+
+        counts = {slot: (codes == slot).sum(axis=1) for slot in set(_RULE_SLOTS)}
+        out[:] = np.select(
+            [counts[slot] >= threshold for slot, threshold in zip(_RULE_SLOTS, _RULE_THRESHOLDS)],
+            _RULE_CODES,
+            default=_ALL_LOW_CODE
+        )
+        return out
+
     def assess_conclusion_threat(self, domain_threat_assessments: Dict[str, ConclusionThreat]) -> Dict[str, Any]:
         """
         Assess whether bias threatens the conclusions based on domain-specific threat assessments
@@ -224,40 +412,38 @@ class ROBINSEOverallAssessment:
         if not domain_threat_assessments:
             return {
                 'conclusion_threat': ConclusionThreat.CANNOT_TELL,
-                'rationale': 'no_threat_assessments_provided',
+                'rationale': RATIONALE_NO_THREATS,
                 'domain_threats': {}
             }
         
-        # Count threat responses
-        threat_counts = Counter(domain_threat_assessments.values())
-        
-        # Apply threat assessment algorithm
-        if threat_counts[ConclusionThreat.YES] >= 1:
+        # Apply threat assessment algorithm; each scan stops at the first match
+        threats = domain_threat_assessments.values()
+        if ConclusionThreat.YES in threats:
             # Yes in any domains -> Overall YES
             yes_domains = [domain for domain, threat in domain_threat_assessments.items() 
-                          if threat == ConclusionThreat.YES]
+                          if threat is ConclusionThreat.YES]
             return {
                 'conclusion_threat': ConclusionThreat.YES,
-                'rationale': 'bias_threatens_conclusions_in_any_domain',
+                'rationale': RATIONALE_THREATENS,
                 'threatening_domains': yes_domains,
                 'domain_threats': domain_threat_assessments
             }
         
-        elif threat_counts[ConclusionThreat.NO] >= 1 and threat_counts[ConclusionThreat.YES] == 0:
+        elif ConclusionThreat.NO in threats:
             # No in any domains (and no Yes) -> Overall NO
             return {
                 'conclusion_threat': ConclusionThreat.NO,
-                'rationale': 'bias_does_not_threaten_conclusions',
+                'rationale': RATIONALE_DOES_NOT_THREATEN,
                 'domain_threats': domain_threat_assessments
             }
         
         else:
             # At least one Cannot tell, but no Yes -> Overall CANNOT TELL
             uncertain_domains = [domain for domain, threat in domain_threat_assessments.items() 
-                                if threat == ConclusionThreat.CANNOT_TELL]
+                                if threat is ConclusionThreat.CANNOT_TELL]
             return {
                 'conclusion_threat': ConclusionThreat.CANNOT_TELL,
-                'rationale': 'uncertain_threat_assessment',
+                'rationale': RATIONALE_UNCERTAIN_THREAT,
                 'uncertain_domains': uncertain_domains,
                 'domain_threats': domain_threat_assessments
             }
@@ -272,8 +458,26 @@ class ROBINSEOverallAssessment:
             domain_threat_assessments: Optional threat assessments for all domains
             
         Returns:
-            Comprehensive assessment dictionary
+            Read-only comprehensive assessment: nested dictionaries are
+            mappingproxies and lists are tuples, so repeated inputs can share
+            one cached result
         """
+        # Value types are part of the key so that e.g. True and 1 stay distinct
+        risk_key = tuple((key, type(value), value) for key, value in domain_assessments.items())
+        threat_key = None
+        if domain_threat_assessments:
+            threat_key = tuple((key, type(value), value)
+                               for key, value in domain_threat_assessments.items())
+        
+        try:
+            return _cached_comprehensive(risk_key, threat_key)
+        except TypeError:
+            # Unhashable inputs cannot be cached
+            return _freeze(self._comprehensive(domain_assessments, domain_threat_assessments))
+
+    def _comprehensive(self, domain_assessments: Dict[str, Any],
+                       domain_threat_assessments: Optional[Dict[str, ConclusionThreat]]) -> Dict[str, Any]:
+        """Build the comprehensive assessment without caching"""
         # Get overall bias risk assessment
         bias_assessment = self.assess_overall_bias_risk(domain_assessments)
         
@@ -298,78 +502,18 @@ class ROBINSEOverallAssessment:
         overall_risk = bias_assessment['overall_risk']
         rationale = bias_assessment['rationale']
         
-        explanations = {
-            'low_risk_all_domains_confounding_caveat': 
-                "The study shows low risk of bias across all domains. However, as with all observational studies, "
-                "there remains the possibility of uncontrolled confounding that has not been adequately addressed.",
-            
-            'at_least_one_some_concerns_domain': 
-                "The study has some concerns about bias, with at least one domain showing potential issues, "
-                "but no domains have high or very high risk of bias.",
-            
-            'at_least_one_high_risk_domain': 
-                "The study has important problems with at least one domain showing high risk of bias, "
-                "which could substantially affect the reliability of the results.",
-            
-            'several_some_concerns_domains_additive': 
-                "While individual domains show only some concerns, the cumulative effect of multiple domains "
-                "with potential bias issues elevates the overall assessment to high risk.",
-            
-            'at_least_one_very_high_risk_domain': 
-                "The study has very serious problems with at least one domain showing very high risk of bias, "
-                "which severely undermines confidence in the results.",
-            
-            'several_high_risk_domains_additive': 
-                "Multiple domains show high risk of bias, and the cumulative effect of these problems "
-                "elevates the overall assessment to very high risk."
-        }
-        
-        explanation = explanations.get(rationale, f"Assessment based on: {rationale}")
+        explanation = _EXPLANATIONS.get(rationale, f"Assessment based on: {rationale}")
         
         if threat_assessment:
             threat_result = threat_assessment['conclusion_threat']
-            if threat_result == ConclusionThreat.YES:
-                explanation += " The identified biases are likely to threaten the validity of the study conclusions."
-            elif threat_result == ConclusionThreat.NO:
-                explanation += " Despite the identified bias concerns, they are unlikely to threaten the main study conclusions."
-            else:
-                explanation += " It is unclear whether the identified biases threaten the study conclusions."
+            explanation += _THREAT_SUFFIX.get(threat_result, _THREAT_SUFFIX[ConclusionThreat.CANNOT_TELL])
         
         return explanation
 
     def _generate_recommendations(self, bias_assessment: Dict[str, Any], 
                                 threat_assessment: Optional[Dict[str, Any]]) -> List[str]:
         """Generate recommendations based on the assessment"""
-        recommendations = []
-        overall_risk = bias_assessment['overall_risk']
-        
-        if overall_risk == OverallRisk.LOW_RISK_EXCEPT_CONFOUNDING:
-            recommendations.extend([
-                "Consider additional sensitivity analyses to address potential unmeasured confounding",
-                "Discuss the potential impact of residual confounding in limitations",
-                "Results can be interpreted with moderate confidence"
-            ])
-        
-        elif overall_risk == OverallRisk.SOME_CONCERNS:
-            recommendations.extend([
-                "Address the identified bias concerns in study interpretation",
-                "Consider additional analyses to assess bias impact",
-                "Results should be interpreted with caution"
-            ])
-        
-        elif overall_risk == OverallRisk.HIGH_RISK:
-            recommendations.extend([
-                "Substantial bias concerns require careful interpretation",
-                "Consider whether results are reliable enough for decision-making",
-                "Additional studies with better methodology may be needed"
-            ])
-        
-        elif overall_risk == OverallRisk.VERY_HIGH_RISK:
-            recommendations.extend([
-                "Very serious bias concerns severely limit result reliability",
-                "Results should not be used for decision-making without major caveats",
-                "New studies with improved methodology are strongly recommended"
-            ])
+        recommendations = list(_RECOMMENDATIONS.get(bias_assessment['overall_risk'], ()))
         
         # Add domain-specific recommendations
         if 'contributing_domains' in bias_assessment:
@@ -379,115 +523,30 @@ class ROBINSEOverallAssessment:
         
         return recommendations
 
-# Example usage and testing
-if __name__ == "__main__":
-    robins_e_overall = ROBINSEOverallAssessment()
-    
-    # Example 1: Low risk except confounding
-    domain_assessments_low = {
-        'domain_1': DomainRisk.LOW_RISK,
-        'domain_2': DomainRisk.LOW_RISK,
-        'domain_3': DomainRisk.LOW_RISK,
-        'domain_4': DomainRisk.LOW_RISK,
-        'domain_5': DomainRisk.LOW_RISK,
-        'domain_6': DomainRisk.LOW_RISK,
-        'domain_7': DomainRisk.LOW_RISK
-    }
-    
-    result_low = robins_e_overall.generate_comprehensive_assessment(domain_assessments_low)
-    print("=== Low Risk Except Confounding Example ===")
-    print(f"Overall Risk: {result_low['overall_bias_assessment']['overall_risk'].value}")
-    print(f"Rationale: {result_low['overall_bias_assessment']['rationale']}")
-    print(f"Explanation: {result_low['explanation']}")
-    print()
-    
-    # Example 2: Some concerns
-    domain_assessments_concerns = {
-        'domain_1': DomainRisk.LOW_RISK,
-        'domain_2': DomainRisk.SOME_CONCERNS,
-        'domain_3': DomainRisk.LOW_RISK,
-        'domain_4': DomainRisk.LOW_RISK,
-        'domain_5': DomainRisk.SOME_CONCERNS,
-        'domain_6': DomainRisk.LOW_RISK,
-        'domain_7': DomainRisk.LOW_RISK
-    }
-    
-    result_concerns = robins_e_overall.generate_comprehensive_assessment(domain_assessments_concerns)
-    print("=== Some Concerns Example ===")
-    print(f"Overall Risk: {result_concerns['overall_bias_assessment']['overall_risk'].value}")
-    print(f"Contributing Domains: {result_concerns['overall_bias_assessment']['contributing_domains']}")
-    print(f"Risk Counts: {result_concerns['overall_bias_assessment']['risk_counts']}")
-    print()
-    
-    # Example 3: High risk - single high risk domain
-    domain_assessments_high = {
-        'domain_1': DomainRisk.LOW_RISK,
-        'domain_2': DomainRisk.HIGH_RISK,
-        'domain_3': DomainRisk.SOME_CONCERNS,
-        'domain_4': DomainRisk.LOW_RISK,
-        'domain_5': DomainRisk.LOW_RISK,
-        'domain_6': DomainRisk.LOW_RISK,
-        'domain_7': DomainRisk.LOW_RISK
-    }
-    
-    result_high = robins_e_overall.generate_comprehensive_assessment(domain_assessments_high)
-    print("=== High Risk (Single Domain) Example ===")
-    print(f"Overall Risk: {result_high['overall_bias_assessment']['overall_risk'].value}")
-    print(f"Contributing Domains: {result_high['overall_bias_assessment']['contributing_domains']}")
-    print()
-    
-    # Example 4: Very high risk - multiple high risk domains
-    domain_assessments_very_high = {
-        'domain_1': DomainRisk.HIGH_RISK,
-        'domain_2': DomainRisk.HIGH_RISK,
-        'domain_3': DomainRisk.HIGH_RISK,
-        'domain_4': DomainRisk.SOME_CONCERNS,
-        'domain_5': DomainRisk.LOW_RISK,
-        'domain_6': DomainRisk.LOW_RISK,
-        'domain_7': DomainRisk.LOW_RISK
-    }
-    
-    result_very_high = robins_e_overall.generate_comprehensive_assessment(domain_assessments_very_high)
-    print("=== Very High Risk (Additive) Example ===")
-    print(f"Overall Risk: {result_very_high['overall_bias_assessment']['overall_risk'].value}")
-    print(f"Rationale: {result_very_high['overall_bias_assessment']['rationale']}")
-    print(f"Contributing Domains: {result_very_high['overall_bias_assessment']['contributing_domains']}")
-    print()
-    
-    # Example 5: With conclusion threat assessment
-    domain_threat_assessments = {
-        'domain_1': ConclusionThreat.NO,
-        'domain_2': ConclusionThreat.YES,
-        'domain_3': ConclusionThreat.CANNOT_TELL,
-        'domain_4': ConclusionThreat.NO,
-        'domain_5': ConclusionThreat.NO,
-        'domain_6': ConclusionThreat.NO,
-        'domain_7': ConclusionThreat.NO
-    }
-    
-    result_with_threat = robins_e_overall.generate_comprehensive_assessment(
-        domain_assessments_concerns, domain_threat_assessments
-    )
-    print("=== With Conclusion Threat Assessment ===")
-    print(f"Overall Risk: {result_with_threat['overall_bias_assessment']['overall_risk'].value}")
-    print(f"Conclusion Threat: {result_with_threat['conclusion_threat_assessment']['conclusion_threat'].value}")
-    print(f"Threatening Domains: {result_with_threat['conclusion_threat_assessment'].get('threatening_domains', [])}")
-    print(f"Explanation: {result_with_threat['explanation']}")
-    print()
-    
-    # Example 6: Using string inputs (compatibility with domain implementations)
-    domain_assessments_strings = {
-        'domain_1': "Low risk of bias",
-        'domain_2': "Some concerns", 
-        'domain_3': "High risk of bias",
-        'domain_4': "Low risk of bias",
-        'domain_5': "Low risk of bias",
-        'domain_6': "Low risk of bias",
-        'domain_7': "Low risk of bias"
-    }
+# Shared instance for callers that do not need their own assessor
+default_assessor = ROBINSEOverallAssessment()
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only deep view of a result: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _cached_comprehensive(risk_key: tuple, threat_key: Optional[tuple]) -> MappingProxyType:
+    """
+    Comprehensive assessment for frozen (domain, type, value) inputs
     
-    result_strings = robins_e_overall.assess_overall_bias_risk(domain_assessments_strings)
-    print("=== String Input Example ===")
-    print(f"Overall Risk: {result_strings['overall_risk'].value}")
-    print(f"Rationale: {result_strings['rationale']}")
-    print()
+    The result is frozen, so every caller can be handed the cached entry
+    itself instead of a copy.
+    """
+    domain_threat_assessments = None
+    if threat_key is not None:
+        domain_threat_assessments = {key: value for key, _, value in threat_key}
+    return _freeze(default_assessor._comprehensive(
+        {key: value for key, _, value in risk_key}, domain_threat_assessments
+    ))
@@ -0,0 +1,121 @@
+"""
+Example usage of the ROBINS-E overall assessment
+
+Kept apart from robins_e_overall so importing the algorithm does not
+carry the demo code. Run directly: python robins_e_overall_demo.py
+"""
+
+from robins_e_overall import ROBINSEOverallAssessment, DomainRisk, ConclusionThreat
+
+# Example usage and testing
+if __name__ == "__main__":
+    robins_e_overall = ROBINSEOverallAssessment()
+    
+    # Example 1: Low risk except confounding
+    domain_assessments_low = {
+        'domain_1': DomainRisk.LOW_RISK,
+        'domain_2': DomainRisk.LOW_RISK,
+        'domain_3': DomainRisk.LOW_RISK,
+        'domain_4': DomainRisk.LOW_RISK,
+        'domain_5': DomainRisk.LOW_RISK,
+        'domain_6': DomainRisk.LOW_RISK,
+        'domain_7': DomainRisk.LOW_RISK
+    }
+    
+    result_low = robins_e_overall.generate_comprehensive_assessment(domain_assessments_low)
+    print("=== Low Risk Except Confounding Example ===")
+    print(f"Overall Risk: {result_low['overall_bias_assessment']['overall_risk'].value}")
+    print(f"Rationale: {result_low['overall_bias_assessment']['rationale']}")
+    print(f"Explanation: {result_low['explanation']}")
+    print()
+    
+    # Example 2: Some concerns
+    domain_assessments_concerns = {
+        'domain_1': DomainRisk.LOW_RISK,
+        'domain_2': DomainRisk.SOME_CONCERNS,
+        'domain_3': DomainRisk.LOW_RISK,
+        'domain_4': DomainRisk.LOW_RISK,
+        'domain_5': DomainRisk.SOME_CONCERNS,
+        'domain_6': DomainRisk.LOW_RISK,
+        'domain_7': DomainRisk.LOW_RISK
+    }
+    
+    result_concerns = robins_e_overall.generate_comprehensive_assessment(domain_assessments_concerns)
+    print("=== Some Concerns Example ===")
+    print(f"Overall Risk: {result_concerns['overall_bias_assessment']['overall_risk'].value}")
+    print(f"Contributing Domains: {list(result_concerns['overall_bias_assessment']['contributing_domains'])}")
+    print(f"Risk Counts: {result_concerns['overall_bias_assessment']['risk_counts']}")
+    print()
+    
+    # Example 3: High risk - single high risk domain
+    domain_assessments_high = {
+        'domain_1': DomainRisk.LOW_RISK,
+        'domain_2': DomainRisk.HIGH_RISK,
+        'domain_3': DomainRisk.SOME_CONCERNS,
+        'domain_4': DomainRisk.LOW_RISK,
+        'domain_5': DomainRisk.LOW_RISK,
+        'domain_6': DomainRisk.LOW_RISK,
+        'domain_7': DomainRisk.LOW_RISK
+    }
+    
+    result_high = robins_e_overall.generate_comprehensive_assessment(domain_assessments_high)
+    print("=== High Risk (Single Domain) Example ===")
+    print(f"Overall Risk: {result_high['overall_bias_assessment']['overall_risk'].value}")
+    print(f"Contributing Domains: {list(result_high['overall_bias_assessment']['contributing_domains'])}")
+    print()
+    
+    # Example 4: Very high risk - multiple high risk domains
+    domain_assessments_very_high = {
+        'domain_1': DomainRisk.HIGH_RISK,
+        'domain_2': DomainRisk.HIGH_RISK,
+        'domain_3': DomainRisk.HIGH_RISK,
+        'domain_4': DomainRisk.SOME_CONCERNS,
+        'domain_5': DomainRisk.LOW_RISK,
+        'domain_6': DomainRisk.LOW_RISK,
+        'domain_7': DomainRisk.LOW_RISK
+    }
+    
+    result_very_high = robins_e_overall.generate_comprehensive_assessment(domain_assessments_very_high)
+    print("=== Very High Risk (Additive) Example ===")
+    print(f"Overall Risk: {result_very_high['overall_bias_assessment']['overall_risk'].value}")
+    print(f"Rationale: {result_very_high['overall_bias_assessment']['rationale']}")
+    print(f"Contributing Domains: {list(result_very_high['overall_bias_assessment']['contributing_domains'])}")
+    print()
+    
+    # Example 5: With conclusion threat assessment
+    domain_threat_assessments = {
+        'domain_1': ConclusionThreat.NO,
+        'domain_2': ConclusionThreat.YES,
+        'domain_3': ConclusionThreat.CANNOT_TELL,
+        'domain_4': ConclusionThreat.NO,
+        'domain_5': ConclusionThreat.NO,
+        'domain_6': ConclusionThreat.NO,
+        'domain_7': ConclusionThreat.NO
+    }
+    
+    result_with_threat = robins_e_overall.generate_comprehensive_assessment(
+        domain_assessments_concerns, domain_threat_assessments
+    )
+    print("=== With Conclusion Threat Assessment ===")
+    print(f"Overall Risk: {result_with_threat['overall_bias_assessment']['overall_risk'].value}")
+    print(f"Conclusion Threat: {result_with_threat['conclusion_threat_assessment']['conclusion_threat'].value}")
+    print(f"Threatening Domains: {list(result_with_threat['conclusion_threat_assessment'].get('threatening_domains', []))}")
+    print(f"Explanation: {result_with_threat['explanation']}")
+    print()
+    
+    # Example 6: Using string inputs (compatibility with domain implementations)
+    domain_assessments_strings = {
+        'domain_1': "Low risk of bias",
+        'domain_2': "Some concerns", 
+        'domain_3': "High risk of bias",
+        'domain_4': "Low risk of bias",
+        'domain_5': "Low risk of bias",
+        'domain_6': "Low risk of bias",
+        'domain_7': "Low risk of bias"
+    }
+    
+    result_strings = robins_e_overall.assess_overall_bias_risk(domain_assessments_strings)
+    print("=== String Input Example ===")
+    print(f"Overall Risk: {result_strings['overall_risk'].value}")
+    print(f"Rationale: {result_strings['rationale']}")
+    print()
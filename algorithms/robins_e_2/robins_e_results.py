@@ -0,0 +1,36 @@
+"""
+ROBINS-E shared result types
+Immutable assessment outcomes used by the domain algorithms
+"""
+
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Tuple
+
+@dataclass(frozen=True, slots=True)
+class AssessmentResult:
+    """Immutable domain assessment outcome, shared by identical answer sets"""
+    risk_level: Enum
+    rationale: str
+    pathway: Tuple[str, ...] = ()
+    # Pathway rendered once for display, joined the way the engine prints it
+    pathway_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'pathway_text', sys.intern(' -> '.join(self.pathway)))
+
+    def __getitem__(self, key: str) -> Any:
+        """Support dict-style access for callers written against the dict result"""
+        # __slots__ lists only the fields a subclass adds, so check every field
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a mutable dictionary copy of the result"""
+        return {
+            'risk_level': self.risk_level,
+            'pathway': list(self.pathway),
+            'rationale': self.rationale
+        }
@@ -18,11 +18,16 @@ class SignallingQuestionInline(admin.TabularInline):
     extra = 0
     ordering = ['order']
 
+    def get_queryset(self, request):
+        # Each row's label reads the domain's short name
+        return super().get_queryset(request).select_related('domain')
+
 
 @admin.register(Domain)
 class DomainAdmin(admin.ModelAdmin):
     list_display = ['name', 'assessment_tool', 'short_name', 'order', 'is_overall']
-    list_filter = ['assessment_tool', 'is_overall']
+    list_filter = [('assessment_tool', admin.RelatedOnlyFieldListFilter), 'is_overall']
+    list_select_related = ['assessment_tool']
     search_fields = ['name', 'short_name', 'description']
     ordering = ['assessment_tool', 'order']
     inlines = [SignallingQuestionInline]
@@ -32,6 +37,7 @@ class DomainAdmin(admin.ModelAdmin):
 class SignallingQuestionAdmin(admin.ModelAdmin):
     list_display = ['domain', 'order', 'question_text', 'is_required']
     list_filter = ['domain__assessment_tool', 'is_required']
+    list_select_related = ['domain']
     search_fields = ['question_text', 'guidance']
     ordering = ['domain', 'order']
 
@@ -45,9 +51,11 @@ class StudyInline(admin.TabularInline):
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ['name', 'user', 'created_at', 'updated_at']
-    list_filter = ['created_at', 'user']
+    list_filter = ['created_at', ('user', admin.RelatedOnlyFieldListFilter)]
+    list_select_related = ['user']
     search_fields = ['name', 'description']
     ordering = ['-updated_at']
+    date_hierarchy = 'created_at'
     inlines = [StudyInline]
     readonly_fields = ['id', 'created_at', 'updated_at']
 
@@ -55,7 +63,8 @@ class ProjectAdmin(admin.ModelAdmin):
 @admin.register(Study)
 class StudyAdmin(admin.ModelAdmin):
     list_display = ['title', 'project', 'authors', 'year', 'journal']
-    list_filter = ['year', 'project', 'created_at']
+    list_filter = ['year', ('project', admin.RelatedOnlyFieldListFilter), 'created_at']
+    list_select_related = ['project']
     search_fields = ['title', 'authors', 'journal', 'doi']
     ordering = ['-updated_at']
     readonly_fields = ['created_at', 'updated_at']
@@ -64,16 +73,19 @@ class StudyAdmin(admin.ModelAdmin):
 @admin.register(Assessment)
 class AssessmentAdmin(admin.ModelAdmin):
     list_display = ['study', 'assessment_tool', 'assessor_name', 'status', 'overall_bias', 'updated_at']
-    list_filter = ['assessment_tool', 'status', 'overall_bias', 'created_at']
+    list_filter = [('assessment_tool', admin.RelatedOnlyFieldListFilter), 'status', 'overall_bias', 'created_at']
+    list_select_related = ['study', 'assessment_tool']
     search_fields = ['study__title', 'assessor_name', 'assessor_email']
     ordering = ['-updated_at']
+    date_hierarchy = 'created_at'
     readonly_fields = ['created_at', 'updated_at']
 
 
 @admin.register(DomainAssessment)
 class DomainAssessmentAdmin(admin.ModelAdmin):
     list_display = ['assessment', 'domain', 'bias_rating']
-    list_filter = ['domain__assessment_tool', 'bias_rating', 'domain']
+    list_filter = [('domain__assessment_tool', admin.RelatedOnlyFieldListFilter), 'bias_rating', ('domain', admin.RelatedOnlyFieldListFilter)]
+    list_select_related = ['assessment__study', 'assessment__assessment_tool', 'domain__assessment_tool']
     search_fields = ['assessment__study__title', 'domain__name']
     ordering = ['assessment', 'domain__order']
 
@@ -81,7 +93,13 @@ class DomainAssessmentAdmin(admin.ModelAdmin):
 @admin.register(QuestionResponse)
 class QuestionResponseAdmin(admin.ModelAdmin):
     list_display = ['domain_assessment', 'signalling_question', 'response']
-    list_filter = ['response', 'signalling_question__domain__assessment_tool']
+    list_filter = ['response', ('signalling_question__domain__assessment_tool', admin.RelatedOnlyFieldListFilter)]
+    list_select_related = [
+        'domain_assessment__assessment__study',
+        'domain_assessment__assessment__assessment_tool',
+        'domain_assessment__domain',
+        'signalling_question'
+    ]
     search_fields = ['domain_assessment__assessment__study__title']
     ordering = ['domain_assessment', 'signalling_question__order']
 
@@ -90,5 +108,6 @@ class QuestionResponseAdmin(admin.ModelAdmin):
 class AssessmentExportAdmin(admin.ModelAdmin):
     list_display = ['project', 'export_type', 'created_at']
     list_filter = ['export_type', 'created_at']
+    list_select_related = ['project']
     ordering = ['-created_at']
     readonly_fields = ['created_at']
@@ -1,7 +1,26 @@
+from datetime import date
+from itertools import islice
+
+import numpy as np
+import pandas as pd
 from django import forms
+from django.db import transaction
 from .models import Project, Study, Assessment, DomainAssessment, QuestionResponse, AssessmentTool
 
 
+MIN_STUDY_YEAR = 1900
+CSV_MAX_UPLOAD_SIZE = 5 << 20
+
+# Shared by StudyForm and the bulk importer so both apply the same DOI rule
+DOI_PREFIX = '10.'
+_DOI_ERROR = f'DOI should start with "{DOI_PREFIX}"'
+
+
+def _year_error(max_year):
+    """Out-of-range year message"""
+    return f'Year must be between {MIN_STUDY_YEAR} and {max_year}'
+
+
 class ProjectForm(forms.ModelForm):
     """Form for creating and editing projects"""
     
@@ -84,9 +103,10 @@ class StudyForm(forms.ModelForm):
         """Validate publication year"""
         year = self.cleaned_data.get('year')
         if year:
-            current_year = 2024  # You might want to use datetime.now().year
-            if year < 1900 or year > current_year + 1:
-                raise forms.ValidationError(f'Year must be between 1900 and {current_year + 1}')
+            # Allow next year for studies published ahead of print
+            max_year = date.today().year + 1
+            if not MIN_STUDY_YEAR <= year <= max_year:
+                raise forms.ValidationError(_year_error(max_year))
         return year
     
     def clean_doi(self):
@@ -94,8 +114,8 @@ class StudyForm(forms.ModelForm):
         doi = self.cleaned_data.get('doi')
         if doi:
             doi = doi.strip()
-            if doi and not doi.startswith('10.'):
-                raise forms.ValidationError('DOI should start with "10."')
+            if doi and not doi.startswith(DOI_PREFIX):
+                raise forms.ValidationError(_DOI_ERROR)
         return doi
 
 
@@ -164,6 +184,9 @@ class QuestionResponseForm(forms.ModelForm):
 class BulkStudyImportForm(forms.Form):
     """Form for importing multiple studies at once"""
     
+    CSV_COLUMNS = ('title', 'authors', 'journal', 'year', 'doi', 'pmid', 'study_design', 'notes')
+    CSV_BATCH_ROWS = 10000
+    
     CSV_HELP_TEXT = """
     Upload a CSV file with the following columns:
     title, authors, journal, year, doi, pmid, study_design, notes
@@ -187,11 +210,122 @@ class BulkStudyImportForm(forms.Form):
                 raise forms.ValidationError('File must be a CSV file')
             
             # Check file size (limit to 5MB)
-            if file.size > 5 * 1024 * 1024:
+            if file.size > CSV_MAX_UPLOAD_SIZE:
                 raise forms.ValidationError('File size cannot exceed 5MB')
+            
+            # Parse only the first batch to check the header; the rest is
+            # read on demand by iter_batches()
+            try:
+                self._reader = pd.read_csv(
+                    file, chunksize=self.CSV_BATCH_ROWS, engine='c', encoding='utf-8-sig',
+                    dtype=str, keep_default_na=False, skipinitialspace=True
+                )
+                self._first_batch = next(self._reader)
+            except UnicodeDecodeError:
+                raise forms.ValidationError('CSV file must be UTF-8 encoded')
+            except (pd.errors.ParserError, pd.errors.EmptyDataError):
+                raise forms.ValidationError('File could not be read as CSV')
+            
+            self._first_batch.columns = self._first_batch.columns.str.strip().str.lower()
+            if 'title' not in self._first_batch.columns:
+                raise forms.ValidationError('CSV file must have a "title" column')
+            if self._first_batch.empty:
+                raise forms.ValidationError('CSV file contains no studies')
         
         return file
-
+    
+    def iter_batches(self):
+        """
+        Yield the uploaded studies as DataFrames of at most CSV_BATCH_ROWS rows
+        
+        Raises:
+            forms.ValidationError: if a later batch cannot be decoded or parsed
+        """
+        yield self._first_batch
+        first_row = len(self._first_batch) + 1
+        while True:
+            try:
+                batch = next(self._reader)
+            except StopIteration:
+                return
+            except UnicodeDecodeError:
+                raise forms.ValidationError(f'Row {first_row} onwards: CSV file must be UTF-8 encoded')
+            except pd.errors.ParserError as e:
+                raise forms.ValidationError(f'Row {first_row} onwards: file could not be read as CSV ({e})')
+            batch.columns = self._first_batch.columns
+            first_row += len(batch)
+            yield batch
+    
+    def iter_rows(self):
+        """
+        Yield a dict of Study fields for each CSV row, one batch at a time
+        
+        Rows are checked with the same rules as StudyForm, a whole batch at
+        a time. Iteration stops at the first batch with invalid rows, so
+        nothing past it is parsed.
+        
+        Raises:
+            forms.ValidationError: listing every invalid row in that batch
+        """
+        columns = [column for column in self.CSV_COLUMNS if column in self._first_batch.columns]
+        max_year = date.today().year + 1
+        first_row = 1
+        
+        for batch in self.iter_batches():
+            # Short rows leave NaN in the missing cells
+            batch = batch[columns].fillna('').apply(lambda column: column.str.strip())
+            
+            checks = [(batch['title'] == '', 'title is required')]
+            # Rows are bulk inserted without model validation, so check lengths here
+            for column in columns:
+                max_length = Study._meta.get_field(column).max_length
+                if max_length:
+                    checks.append((
+                        batch[column].str.len() > max_length,
+                        f'{column} cannot exceed {max_length} characters'
+                    ))
+            if 'year' in batch:
+                year_text = batch['year']
+                years = pd.to_numeric(year_text.where(year_text.str.isdecimal()), errors='coerce')
+                in_range = years.between(MIN_STUDY_YEAR, max_year)
+                checks.append(((year_text != '') & ~in_range, _year_error(max_year)))
+                # Out-of-range values may not fit in an integer, so cast only valid years
+                batch['year'] = years.where(in_range).astype('Int64').astype(object).where(in_range, None)
+            if 'doi' in batch:
+                doi = batch['doi']
+                checks.append(((doi != '') & ~doi.str.startswith(DOI_PREFIX), _DOI_ERROR))
+            
+            invalid = np.logical_or.reduce([mask.to_numpy() for mask, _ in checks])
+            if invalid.any():
+                raise forms.ValidationError([
+                    f'Row {first_row + index}: {message}'
+                    for index in np.flatnonzero(invalid)
+                    for mask, message in checks if mask.iat[index]
+                ])
+            
+            yield from batch.to_dict('records')
+            first_row += len(batch)
+    
+    def build_instances(self, project):
+        """Yield an unsaved Study in project for each validated CSV row"""
+        for row in self.iter_rows():
+            yield Study(project=project, **row)
+    
+    def save(self, project, batch_size=1000):
+        """
+        Create the uploaded studies in project, batch_size rows per INSERT
+        
+        All rows are inserted in one transaction, so an invalid row found
+        part way through leaves the project unchanged. Rows whose title
+        already exists in the project are skipped.
+        
+        Raises:
+            forms.ValidationError: listing the invalid rows
+        """
+        instances = self.build_instances(project)
+        with transaction.atomic():
+            while batch := list(islice(instances, batch_size)):
+                Study.objects.bulk_create(batch, ignore_conflicts=True)
 
 class AssessmentSearchForm(forms.Form):
     """Form for searching and filtering assessments"""
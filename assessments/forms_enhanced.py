@@ -8,11 +8,103 @@ This module contains forms for the new workflow:
 """
 
 from django import forms
+from django.core import signing
+from django.core.cache import cache
 from django.core.validators import FileExtensionValidator
+from django.forms.models import ModelChoiceIterator
 from .models import Study, StudyDocument, LLMModel, Assessment
 import re
 
 
+# Common identifier shapes in one pass: PMID, DOI, "doi:" prefix or URL
+_IDENTIFIER_RE = re.compile(r'(?:\d+$|10\.\d+/|doi:|http)')
+
+# Upload size limits in bytes
+PDF_MAX_UPLOAD_SIZE = 50 << 20
+DOCUMENT_MAX_UPLOAD_SIZE = 25 << 20
+
+# File types accepted by StudyDocumentForm
+_DOCUMENT_EXTENSIONS = ('pdf', 'doc', 'docx', 'txt')
+_DOCUMENT_EXTENSION_SET = frozenset(_DOCUMENT_EXTENSIONS)
+_DOCUMENT_EXTENSION_ERROR = f"File type not supported. Allowed: {', '.join(_DOCUMENT_EXTENSIONS)}"
+
+LLM_CHOICES_CACHE_KEY = 'llm_active_choices'
+LLM_CHOICES_CACHE_TIMEOUT = 300
+
+
+def active_llm_choices():
+    """(pk, label) pairs for active LLM models, cached between requests"""
+    return cache.get_or_set(
+        LLM_CHOICES_CACHE_KEY,
+        _load_llm_choices,
+        LLM_CHOICES_CACHE_TIMEOUT
+    )
+
+
+def _load_llm_choices():
+    # Fetch only the label columns; labels match LLMModel.__str__
+    rows = LLMModel.objects.filter(is_active=True).values_list('pk', 'provider', 'display_name')
+    return [(pk, f"{provider} - {display_name}") for pk, provider, display_name in rows]
+
+
+def invalidate_llm_choices(pk=None):
+    """Drop the cached choice list, and the cached model for pk if given"""
+    cache.delete(LLM_CHOICES_CACHE_KEY)
+    if pk is not None:
+        cache.delete(f'{LLM_CHOICES_CACHE_KEY}:{pk}')
+
+
+class CachedLLMChoiceIterator(ModelChoiceIterator):
+    """Yields the cached choice list instead of running the queryset"""
+    
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from active_llm_choices()
+    
+    def __len__(self):
+        return len(active_llm_choices()) + (self.field.empty_label is not None)
+    
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(active_llm_choices())
+
+
+class CachedLLMModelChoiceField(forms.ModelChoiceField):
+    """Choice field over active LLM models that reads choices and selections from the cache"""
+    
+    iterator = CachedLLMChoiceIterator
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', LLMModel.objects.filter(is_active=True))
+        super().__init__(**kwargs)
+    
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        if isinstance(value, LLMModel):
+            value = value.pk
+        
+        if str(value) not in {str(pk) for pk, _ in active_llm_choices()}:
+            raise forms.ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+        try:
+            return cache.get_or_set(
+                f'{LLM_CHOICES_CACHE_KEY}:{value}',
+                lambda: self.queryset.get(pk=value),
+                LLM_CHOICES_CACHE_TIMEOUT
+            )
+        except LLMModel.DoesNotExist:
+            # Deactivated or removed since the choice list was cached
+            raise forms.ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+
+
 class DocumentUploadForm(forms.Form):
     """Form for uploading PDF and providing PMID/DOI"""
     
@@ -42,10 +134,9 @@ class DocumentUploadForm(forms.Form):
     
     def clean(self):
         cleaned_data = super().clean()
-        pdf_file = cleaned_data.get('pdf_file')
-        identifier = cleaned_data.get('identifier')
+        pdf_file, identifier = map(cleaned_data.get, ('pdf_file', 'identifier'))
         
-        if not pdf_file and not identifier:
+        if not (pdf_file or identifier):
             raise forms.ValidationError(
                 "Please provide either a PDF file or a PMID/DOI/URL for metadata extraction."
             )
@@ -56,12 +147,19 @@ class DocumentUploadForm(forms.Form):
         pdf_file = self.cleaned_data.get('pdf_file')
         if pdf_file:
             # Check file size (limit to 50MB)
-            if pdf_file.size > 50 * 1024 * 1024:
+            if pdf_file.size > PDF_MAX_UPLOAD_SIZE:
                 raise forms.ValidationError("PDF file size cannot exceed 50MB")
             
             # Basic PDF validation
             if not pdf_file.name.lower().endswith('.pdf'):
                 raise forms.ValidationError("File must be a PDF")
+            
+            # Readers accept the %PDF- signature anywhere in the first 1KB;
+            # checking it here stops non-PDFs before they are saved and parsed
+            header = pdf_file.read(1024)
+            pdf_file.seek(0)
+            if b'%PDF-' not in header:
+                raise forms.ValidationError("File is not a valid PDF")
                 
         return pdf_file
     
@@ -71,12 +169,7 @@ class DocumentUploadForm(forms.Form):
             identifier = identifier.strip()
             
             # Basic validation for common identifier patterns
-            if not (
-                re.match(r'^\d+$', identifier) or  # PMID
-                re.match(r'^10\.\d+/', identifier) or  # DOI
-                identifier.startswith('doi:') or
-                identifier.startswith('http')  # URL
-            ):
+            if not _IDENTIFIER_RE.match(identifier):
                 # Allow through anyway - the metadata service will handle validation
                 pass
                 
@@ -146,6 +239,8 @@ class AssessmentMethodForm(forms.Form):
         ('llm', 'LLM-Assisted Assessment'),
         ('both', 'Both (LLM first, then manual review)')
     ]
+    # Methods that need an LLM model selected
+    LLM_METHODS = frozenset(['llm', 'both'])
     
     assessment_method = forms.ChoiceField(
         choices=ASSESSMENT_CHOICES,
@@ -157,8 +252,7 @@ class AssessmentMethodForm(forms.Form):
     )
     
     # LLM selection (shown only when LLM is chosen)
-    llm_model = forms.ModelChoiceField(
-        queryset=LLMModel.objects.filter(is_active=True),
+    llm_model = CachedLLMModelChoiceField(
         required=False,
         widget=forms.Select(attrs={
             'class': 'form-select',
@@ -181,10 +275,9 @@ class AssessmentMethodForm(forms.Form):
     
     def clean(self):
         cleaned_data = super().clean()
-        assessment_method = cleaned_data.get('assessment_method')
-        llm_model = cleaned_data.get('llm_model')
+        assessment_method, llm_model = map(cleaned_data.get, ('assessment_method', 'llm_model'))
         
-        if assessment_method in ['llm', 'both'] and not llm_model:
+        if assessment_method in self.LLM_METHODS and not llm_model:
             raise forms.ValidationError(
                 "Please select an LLM model for LLM-assisted assessment."
             )
@@ -195,8 +288,7 @@ class AssessmentMethodForm(forms.Form):
 class LLMConfigurationForm(forms.Form):
     """Form for configuring LLM settings"""
     
-    llm_model = forms.ModelChoiceField(
-        queryset=LLMModel.objects.filter(is_active=True),
+    llm_model = CachedLLMModelChoiceField(
         widget=forms.Select(attrs={
             'class': 'form-select'
         }),
@@ -264,16 +356,13 @@ class StudyDocumentForm(forms.ModelForm):
         file = self.cleaned_data.get('file')
         if file:
             # Check file size (limit to 25MB)
-            if file.size > 25 * 1024 * 1024:
+            if file.size > DOCUMENT_MAX_UPLOAD_SIZE:
                 raise forms.ValidationError("File size cannot exceed 25MB")
             
             # Check file extension
-            allowed_extensions = ['pdf', 'doc', 'docx', 'txt']
-            file_extension = file.name.lower().split('.')[-1]
-            if file_extension not in allowed_extensions:
-                raise forms.ValidationError(
-                    f"File type not supported. Allowed: {', '.join(allowed_extensions)}"
-                )
+            file_extension = file.name.rpartition('.')[2].lower()
+            if file_extension not in _DOCUMENT_EXTENSION_SET:
+                raise forms.ValidationError(_DOCUMENT_EXTENSION_ERROR)
                 
         return file
 
@@ -282,6 +371,7 @@ class MetadataReviewForm(forms.Form):
     """Form for reviewing and confirming extracted metadata"""
     
     title = forms.CharField(
+        disabled=True,
         max_length=500,
         widget=forms.TextInput(attrs={
             'class': 'form-control',
@@ -291,6 +381,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     authors = forms.CharField(
+        disabled=True,
         required=False,
         max_length=500,
         widget=forms.TextInput(attrs={
@@ -301,6 +392,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     journal = forms.CharField(
+        disabled=True,
         required=False,
         max_length=200,
         widget=forms.TextInput(attrs={
@@ -311,6 +403,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     year = forms.IntegerField(
+        disabled=True,
         required=False,
         widget=forms.NumberInput(attrs={
             'class': 'form-control',
@@ -320,6 +413,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     doi = forms.CharField(
+        disabled=True,
         required=False,
         max_length=100,
         widget=forms.TextInput(attrs={
@@ -330,6 +424,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     pmid = forms.CharField(
+        disabled=True,
         required=False,
         max_length=20,
         widget=forms.TextInput(attrs={
@@ -340,6 +435,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     abstract = forms.CharField(
+        disabled=True,
         required=False,
         widget=forms.Textarea(attrs={
             'class': 'form-control',
@@ -350,6 +446,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     word_count = forms.IntegerField(
+        disabled=True,
         required=False,
         widget=forms.NumberInput(attrs={
             'class': 'form-control',
@@ -359,6 +456,7 @@ class MetadataReviewForm(forms.Form):
     )
     
     extraction_success = forms.BooleanField(
+        disabled=True,
         required=False,
         widget=forms.CheckboxInput(attrs={
             'class': 'form-check-input',
@@ -383,6 +481,54 @@ class MetadataReviewForm(forms.Form):
         }),
         help_text="Confirm that the extracted text quality is sufficient for assessment"
     )
+    
+    # Extracted metadata, signed so it comes back with the POST unaltered
+    payload = forms.CharField(widget=forms.HiddenInput)
+    
+    PAYLOAD_SALT = 'assessments.metadata_review'
+    PAYLOAD_MAX_AGE = 3600
+    
+    def __init__(self, *args, metadata=None, **kwargs):
+        """
+        Args:
+            metadata: Extracted metadata to display and sign into the payload
+        """
+        super().__init__(*args, **kwargs)
+        if metadata is not None:
+            display = {
+                name: metadata[name] for name, field in self.fields.items()
+                if field.disabled and name in metadata
+            }
+            self.initial.update(display)
+            self.initial['payload'] = signing.dumps(display, salt=self.PAYLOAD_SALT)
+    
+    def _clean_fields(self):
+        # Disabled fields only display server-extracted metadata: take their
+        # values from initial without parsing, so only the payload and the
+        # confirmation checkboxes are cleaned
+        for name, bf in self._bound_items():
+            if bf.field.disabled:
+                self.cleaned_data[name] = bf.initial
+                continue
+            try:
+                self.cleaned_data[name] = bf.field.clean(bf.data)
+            except forms.ValidationError as e:
+                self.add_error(name, e)
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        payload = cleaned_data.get('payload')
+        if payload:
+            # One signature check restores every display field
+            try:
+                cleaned_data.update(signing.loads(
+                    payload, salt=self.PAYLOAD_SALT, max_age=self.PAYLOAD_MAX_AGE
+                ))
+            except signing.SignatureExpired:
+                raise forms.ValidationError("The metadata review has expired. Please start again.")
+            except signing.BadSignature:
+                raise forms.ValidationError("The reviewed metadata could not be verified.")
+        return cleaned_data
 
 
 class AssessmentReviewForm(forms.Form):
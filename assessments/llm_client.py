@@ -4,24 +4,74 @@ LLM Client for automated Risk of Bias assessments
 This module provides interfaces to various LLM APIs for automated assessment generation.
 """
 
+import asyncio
+import hashlib
 import json
+import os
+import random
+import re
 import time
 import requests
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, closing
+from itertools import repeat
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
 from django.conf import settings
+from django.core.cache import cache
 import openai
-from anthropic import Anthropic
+import anthropic
+from anthropic import Anthropic, AsyncAnthropic
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+
+# Upper bound on requests in flight at once from gather_responses()
+DEFAULT_MAX_CONCURRENCY = 8
+
+MAX_OUTPUT_TOKENS = 4000
+
+# Default per-minute request and token budgets by provider, set a little
+# under the entry-level API tiers; override with settings.LLM_RATE_LIMITS
+PROVIDER_RATE_LIMITS = {
+    'ChatGPT': {'rpm': 500, 'tpm': 30000},
+    'Claude': {'rpm': 40, 'tpm': 40000},
+    'Gemini': {'rpm': 15, 'tpm': 1000000},
+}
+
+RATE_LIMIT_ERRORS = (
+    openai.RateLimitError,
+    anthropic.RateLimitError,
+    google_exceptions.ResourceExhausted,
+)
+
+# Marks a prompt block for Anthropic's prompt cache (5 minute lifetime)
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Successful responses are reused for identical requests; temperature is
+# fixed, so a repeat call would only pay for a near-identical answer
+RESPONSE_CACHE_PREFIX = 'llm-response'
+RESPONSE_CACHE_TIMEOUT = 24 * 60 * 60
 
 
 class LLMClientBase(ABC):
-    """Base class for LLM clients"""
+    """
+    Base class for LLM clients
+    
+    Subclasses build the provider request in _create/_acreate and turn the
+    provider response into content and usage in _format_response; timing
+    and error handling are shared by the sync and async entry points.
+    """
     
-    def __init__(self, api_key: str, model_name: str):
+    def __init__(self, api_key: str, model_name: str, cache_responses: bool = True):
         self.api_key = api_key
         self.model_name = model_name
+        self.cache_responses = cache_responses
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.client = None
+        self.async_client = None
         self._setup_client()
     
     @abstractmethod
@@ -30,9 +80,195 @@ class LLMClientBase(ABC):
         pass
     
     @abstractmethod
-    def generate_response(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
-        """Generate a response from the LLM"""
+    def _setup_async_client(self):
+        """Return a new asyncio API client"""
+        pass
+    
+    @abstractmethod
+    def _create(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        """Send the request and return the provider response"""
+        pass
+    
+    @abstractmethod
+    async def _acreate(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        """Send the request without blocking the event loop"""
+        pass
+    
+    @abstractmethod
+    def _stream(self, prompt: str, system_prompt: str = None,
+                prompt_prefix: str = None) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Send a streaming request, yielding text deltas then the usage"""
         pass
+    
+    @abstractmethod
+    def _format_response(self, response) -> Dict[str, Any]:
+        """Extract 'content' and 'usage' from a provider response"""
+        pass
+    
+    @asynccontextmanager
+    async def async_session(self):
+        """
+        Share one asyncio API client between the requests made in the block
+        
+        The client's connections belong to the running event loop, so it is
+        closed on leaving the block rather than kept for later loops.
+        """
+        self.async_client = self._setup_async_client()
+        try:
+            yield self
+        finally:
+            async_client, self.async_client = self.async_client, None
+            if hasattr(async_client, 'close'):
+                await async_client.close()
+    
+    def generate_response(self, prompt: str, system_prompt: str = None,
+                          prompt_prefix: str = None) -> Dict[str, Any]:
+        """
+        Generate a response from the LLM
+        
+        prompt_prefix is static text sent ahead of prompt in the user turn.
+        Keeping it identical across calls lets the provider serve it, and
+        the system prompt, from its prompt cache.
+        """
+        start_time = time.time()
+        key = self._cache_key(prompt, system_prompt, prompt_prefix)
+        
+        if key:
+            cached = cache.get(key)
+            if cached is not None:
+                return self._cache_hit(cached, start_time)
+            self.cache_misses += 1
+        
+        try:
+            response = self._create(prompt, system_prompt, prompt_prefix)
+            result = self._success(response, start_time)
+        except Exception as e:
+            return self._failure(e, start_time)
+        
+        if key:
+            cache.set(key, result, RESPONSE_CACHE_TIMEOUT)
+        return result
+    
+    async def agenerate_response(self, prompt: str, system_prompt: str = None,
+                                 prompt_prefix: str = None) -> Dict[str, Any]:
+        """Generate a response from the LLM on the running event loop"""
+        cached = await self.aget_cached_response(prompt, system_prompt, prompt_prefix)
+        if cached is not None:
+            return cached
+        return await self._asend(prompt, system_prompt, prompt_prefix)
+    
+    async def aget_cached_response(self, prompt: str, system_prompt: str = None,
+                                   prompt_prefix: str = None) -> Optional[Dict[str, Any]]:
+        """Cached response for this request, or None if it must be sent"""
+        start_time = time.time()
+        key = self._cache_key(prompt, system_prompt, prompt_prefix)
+        if not key:
+            return None
+        
+        cached = await cache.aget(key)
+        if cached is None:
+            self.cache_misses += 1
+            return None
+        return self._cache_hit(cached, start_time)
+    
+    async def _asend(self, prompt: str, system_prompt: str = None,
+                     prompt_prefix: str = None) -> Dict[str, Any]:
+        """Send the request without looking in the cache; a success is still cached"""
+        if self.async_client is None:
+            async with self.async_session():
+                return await self._asend(prompt, system_prompt, prompt_prefix)
+        
+        start_time = time.time()
+        try:
+            response = await self._acreate(prompt, system_prompt, prompt_prefix)
+            result = self._success(response, start_time)
+        except Exception as e:
+            return self._failure(e, start_time)
+        
+        key = self._cache_key(prompt, system_prompt, prompt_prefix)
+        if key:
+            await cache.aset(key, result, RESPONSE_CACHE_TIMEOUT)
+        return result
+    
+    def generate_response_stream(self, prompt: str, system_prompt: str = None,
+                                 prompt_prefix: str = None) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Generate a response from the LLM as it is produced
+        
+        Yields (delta_text, None) as text arrives, then ('', usage) once
+        the response is complete. Unlike generate_response(), provider
+        errors are raised to the caller. A complete response is cached as
+        if it had come from generate_response().
+        """
+        start_time = time.time()
+        key = self._cache_key(prompt, system_prompt, prompt_prefix)
+        
+        if key:
+            cached = cache.get(key)
+            if cached is not None:
+                cached = self._cache_hit(cached, start_time)
+                yield cached['content'], None
+                yield '', cached['usage']
+                return
+            self.cache_misses += 1
+        
+        parts = []
+        usage = None
+        for delta, usage in self._stream(prompt, system_prompt, prompt_prefix):
+            if delta:
+                parts.append(delta)
+                yield delta, None
+        yield '', usage
+        
+        if key:
+            cache.set(key, {
+                'success': True,
+                'content': ''.join(parts),
+                'processing_time': time.time() - start_time,
+                'usage': usage
+            }, RESPONSE_CACHE_TIMEOUT)
+    
+    def _cache_key(self, prompt: str, system_prompt: str = None,
+                   prompt_prefix: str = None) -> Optional[str]:
+        """Response cache key for this request, or None when caching is off"""
+        if not self.cache_responses:
+            return None
+        request = json.dumps({
+            'c': type(self).__name__,
+            'm': self.model_name,
+            's': system_prompt,
+            'x': prompt_prefix,
+            'p': prompt
+        }, sort_keys=True)
+        return f'{RESPONSE_CACHE_PREFIX}:{hashlib.sha256(request.encode()).hexdigest()}'
+    
+    def _cache_hit(self, cached: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        self.cache_hits += 1
+        # No tokens were spent on this call, so the stored usage is zeroed
+        return {
+            **cached,
+            'cached': True,
+            'processing_time': time.time() - start_time,
+            'usage': dict.fromkeys(cached.get('usage') or {}, 0)
+        }
+    
+    def _success(self, response, start_time: float) -> Dict[str, Any]:
+        result = self._format_response(response)
+        return {
+            'success': True,
+            'content': result['content'],
+            'processing_time': time.time() - start_time,
+            'usage': result['usage']
+        }
+    
+    @staticmethod
+    def _failure(error: Exception, start_time: float) -> Dict[str, Any]:
+        return {
+            'success': False,
+            'error': str(error),
+            'rate_limited': isinstance(error, RATE_LIMIT_ERRORS),
+            'processing_time': time.time() - start_time
+        }
 
 
 class OpenAIClient(LLMClientBase):
@@ -42,42 +278,59 @@ class OpenAIClient(LLMClientBase):
         openai.api_key = self.api_key
         self.client = openai
     
-    def generate_response(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
-        start_time = time.time()
-        
-        try:
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                temperature=0.1,  # Low temperature for consistent assessments
-                max_tokens=4000,
-                response_format={"type": "json_object"} if "gpt-" in self.model_name else None
-            )
-            
-            processing_time = time.time() - start_time
-            
-            return {
-                'success': True,
-                'content': response.choices[0].message.content,
-                'processing_time': processing_time,
-                'usage': {
-                    'prompt_tokens': response.usage.prompt_tokens,
-                    'completion_tokens': response.usage.completion_tokens,
-                    'total_tokens': response.usage.total_tokens
-                }
-            }
+    def _setup_async_client(self):
+        return openai.AsyncOpenAI(api_key=self.api_key)
+    
+    def _request(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None) -> Dict[str, Any]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        # OpenAI caches long prompt prefixes automatically
+        messages.append({"role": "user", "content": (prompt_prefix or '') + prompt})
         
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'processing_time': time.time() - start_time
-            }
+        return dict(
+            model=self.model_name,
+            messages=messages,
+            temperature=0.1,  # Low temperature for consistent assessments
+            max_tokens=MAX_OUTPUT_TOKENS,
+            response_format={"type": "json_object"} if "gpt-" in self.model_name else None
+        )
+    
+    def _create(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        return self.client.chat.completions.create(**self._request(prompt, system_prompt, prompt_prefix))
+    
+    async def _acreate(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        return await self.async_client.chat.completions.create(**self._request(prompt, system_prompt, prompt_prefix))
+    
+    def _stream(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        response = self.client.chat.completions.create(
+            **self._request(prompt, system_prompt, prompt_prefix),
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        usage = None
+        for chunk in response:
+            # The usage arrives in a final chunk without choices
+            if chunk.usage:
+                usage = self._format_usage(chunk.usage)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content, None
+        yield '', usage
+    
+    def _format_response(self, response) -> Dict[str, Any]:
+        return {
+            'content': response.choices[0].message.content,
+            'usage': self._format_usage(response.usage)
+        }
+    
+    @staticmethod
+    def _format_usage(usage) -> Dict[str, Any]:
+        return {
+            'prompt_tokens': usage.prompt_tokens,
+            'completion_tokens': usage.completion_tokens,
+            'total_tokens': usage.total_tokens,
+            'cached_tokens': getattr(getattr(usage, 'prompt_tokens_details', None), 'cached_tokens', None)
+        }
 
 
 class AnthropicClient(LLMClientBase):
@@ -86,36 +339,49 @@ class AnthropicClient(LLMClientBase):
     def _setup_client(self):
         self.client = Anthropic(api_key=self.api_key)
     
-    def generate_response(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
-        start_time = time.time()
-        
-        try:
-            response = self.client.messages.create(
-                model=self.model_name,
-                max_tokens=4000,
-                temperature=0.1,
-                system=system_prompt or "You are an expert in systematic review methodology and risk of bias assessment.",
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            processing_time = time.time() - start_time
-            
-            return {
-                'success': True,
-                'content': response.content[0].text,
-                'processing_time': processing_time,
-                'usage': {
-                    'input_tokens': response.usage.input_tokens,
-                    'output_tokens': response.usage.output_tokens
-                }
-            }
+    def _setup_async_client(self):
+        return AsyncAnthropic(api_key=self.api_key)
+    
+    def _request(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None) -> Dict[str, Any]:
+        # Anthropic caches up to each block marked with cache_control
+        content = [{"type": "text", "text": prompt}]
+        if prompt_prefix:
+            content.insert(0, {"type": "text", "text": prompt_prefix, "cache_control": CACHE_CONTROL})
         
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'processing_time': time.time() - start_time
+        return dict(
+            model=self.model_name,
+            max_tokens=MAX_OUTPUT_TOKENS,
+            temperature=0.1,
+            system=[{
+                "type": "text",
+                "text": system_prompt or "You are an expert in systematic review methodology and risk of bias assessment.",
+                "cache_control": CACHE_CONTROL
+            }],
+            messages=[{"role": "user", "content": content}]
+        )
+    
+    def _create(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        return self.client.messages.create(**self._request(prompt, system_prompt, prompt_prefix))
+    
+    async def _acreate(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        return await self.async_client.messages.create(**self._request(prompt, system_prompt, prompt_prefix))
+    
+    def _stream(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        with self.client.messages.stream(**self._request(prompt, system_prompt, prompt_prefix)) as stream:
+            for text in stream.text_stream:
+                yield text, None
+            yield '', self._format_response(stream.get_final_message())['usage']
+    
+    def _format_response(self, response) -> Dict[str, Any]:
+        return {
+            'content': response.content[0].text,
+            'usage': {
+                'input_tokens': response.usage.input_tokens,
+                'output_tokens': response.usage.output_tokens,
+                'cache_creation_input_tokens': getattr(response.usage, 'cache_creation_input_tokens', None),
+                'cache_read_input_tokens': getattr(response.usage, 'cache_read_input_tokens', None)
             }
+        }
 
 
 class GeminiClient(LLMClientBase):
@@ -125,40 +391,186 @@ class GeminiClient(LLMClientBase):
         genai.configure(api_key=self.api_key)
         self.client = genai.GenerativeModel(self.model_name)
     
-    def generate_response(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
-        start_time = time.time()
+    def _setup_async_client(self):
+        # GenerativeModel has async methods of its own
+        return self.client
+    
+    def _request(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None) -> Dict[str, Any]:
+        full_prompt = (prompt_prefix or '') + prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{full_prompt}"
         
-        try:
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-            
-            response = self.client.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.1,
-                    max_output_tokens=4000,
-                )
+        return dict(
+            contents=full_prompt,
+            generation_config=genai.types.GenerationConfig(
+                temperature=0.1,
+                max_output_tokens=MAX_OUTPUT_TOKENS,
             )
-            
-            processing_time = time.time() - start_time
-            
-            return {
-                'success': True,
-                'content': response.text,
-                'processing_time': processing_time,
-                'usage': {
-                    'prompt_tokens': response.usage_metadata.prompt_token_count if hasattr(response, 'usage_metadata') else None,
-                    'completion_tokens': response.usage_metadata.candidates_token_count if hasattr(response, 'usage_metadata') else None
-                }
+        )
+    
+    def _create(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        return self.client.generate_content(**self._request(prompt, system_prompt, prompt_prefix))
+    
+    async def _acreate(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        return await self.async_client.generate_content_async(**self._request(prompt, system_prompt, prompt_prefix))
+    
+    def _stream(self, prompt: str, system_prompt: str = None, prompt_prefix: str = None):
+        response = self.client.generate_content(
+            **self._request(prompt, system_prompt, prompt_prefix), stream=True
+        )
+        for chunk in response:
+            yield chunk.text, None
+        # Usage is filled in once the stream has been consumed
+        yield '', self._format_response(response)['usage']
+    
+    def _format_response(self, response) -> Dict[str, Any]:
+        return {
+            'content': response.text,
+            'usage': {
+                'prompt_tokens': response.usage_metadata.prompt_token_count if hasattr(response, 'usage_metadata') else None,
+                'completion_tokens': response.usage_metadata.candidates_token_count if hasattr(response, 'usage_metadata') else None,
+                'cached_tokens': getattr(response.usage_metadata, 'cached_content_token_count', None) if hasattr(response, 'usage_metadata') else None
             }
+        }
+
+
+class RateLimitedDispatcher:
+    """
+    Sends requests no faster than a per-minute request and token budget
+    
+    Requests and their estimated tokens are kept in one-minute sliding
+    windows; a request waits until both windows have room for it, so the
+    provider's limits are approached without being hit. A request that is
+    still rate limited is retried with exponential backoff and jitter.
+    """
+    
+    WINDOW_SECONDS = 60.0
+    MAX_ATTEMPTS = 3
+    BACKOFF_SECONDS = 2.0
+    
+    def __init__(self, rpm: int, tpm: int, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = deque()
+        self._tokens = deque()
+        self._token_total = 0
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    @classmethod
+    def for_client(cls, client: LLMClientBase, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """Dispatcher using the configured limits for the client's provider"""
+        provider = next((
+            name for name, client_class in LLMClientFactory.CLIENT_MAPPING.items()
+            if isinstance(client, client_class)
+        ), None)
+        if provider is None:
+            raise ValueError(f"No rate limits known for {type(client).__name__}")
+        limits = {**PROVIDER_RATE_LIMITS, **getattr(settings, 'LLM_RATE_LIMITS', {})}[provider]
+        return cls(limits['rpm'], limits['tpm'], max_concurrency)
+    
+    def _expire(self, now: float):
+        cutoff = now - self.WINDOW_SECONDS
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._token_total -= self._tokens.popleft()[1]
+    
+    async def _acquire(self, tokens: int):
+        # The lock keeps waiting requests in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                
+                if len(self._requests) >= self.rpm:
+                    wait_until = self._requests[0]
+                # A request larger than the whole budget goes alone
+                elif self._tokens and self._token_total + tokens > self.tpm:
+                    wait_until = self._tokens[0][0]
+                else:
+                    self._requests.append(now)
+                    self._tokens.append((now, tokens))
+                    self._token_total += tokens
+                    return
+                
+                await asyncio.sleep(wait_until + self.WINDOW_SECONDS - now)
+    
+    async def dispatch(self, client: LLMClientBase, prompt: str, system_prompt: str = None,
+                       prompt_prefix: str = None) -> Dict[str, Any]:
+        """Generate a response once the budget allows, retrying if rate limited"""
+        # Cached responses cost no requests or tokens
+        cached = await client.aget_cached_response(prompt, system_prompt, prompt_prefix)
+        if cached is not None:
+            return cached
         
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'processing_time': time.time() - start_time
-            }
+        tokens = estimate_tokens((system_prompt or '') + (prompt_prefix or '') + prompt) + MAX_OUTPUT_TOKENS
+        
+        async with self._semaphore:
+            for attempt in range(self.MAX_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(self.BACKOFF_SECONDS * 2 ** (attempt - 1) + random.random())
+                await self._acquire(tokens)
+                # The cache was checked above, so go straight to the provider
+                result = await client._asend(prompt, system_prompt, prompt_prefix)
+                if not result.get('rate_limited'):
+                    break
+            return result
+
+
+async def gather_responses(client: LLMClientBase, prompts: Iterable[str],
+                           system_prompt: str = None, prompt_prefix: str = None,
+                           max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                           dispatcher: RateLimitedDispatcher = None) -> List[Dict[str, Any]]:
+    """
+    Generate responses for several prompts concurrently
+    
+    At most max_concurrency requests are in flight at once, within the
+    provider's rate limits unless another dispatcher is given. Results are
+    returned in prompt order, each in the generate_response() format.
+    """
+    dispatcher = dispatcher or RateLimitedDispatcher.for_client(client, max_concurrency)
+    
+    async with client.async_session():
+        return await asyncio.gather(*(
+            dispatcher.dispatch(client, prompt, system_prompt, prompt_prefix) for prompt in prompts
+        ))
+
+
+def generate_responses(client: LLMClientBase, prompts: Iterable[str],
+                       system_prompt: str = None, prompt_prefix: str = None,
+                       max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                       dispatcher: RateLimitedDispatcher = None) -> List[Dict[str, Any]]:
+    """Blocking wrapper around gather_responses() for synchronous callers"""
+    return asyncio.run(gather_responses(
+        client, prompts, system_prompt, prompt_prefix, max_concurrency, dispatcher
+    ))
+
+
+_RESULT_KEY_RE = re.compile(r'"((?:domain_\d+)|overall|meta)"\s*:\s*')
+_json_decoder = json.JSONDecoder()
+
+
+def iter_domain_results(deltas: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (key, value) for each top-level domain, overall and meta entry
+    of a streamed JSON assessment as soon as that entry is complete
+    
+    Takes the text deltas of generate_response_stream(), so early domains
+    can be handled while later ones are still being generated.
+    """
+    buffer = ''
+    position = 0
+    for delta in deltas:
+        buffer += delta
+        while match := _RESULT_KEY_RE.search(buffer, position):
+            try:
+                value, end = _json_decoder.raw_decode(buffer, match.end())
+            except json.JSONDecodeError:
+                # Value still incomplete; wait for more text
+                break
+            yield match.group(1), value
+            position = end
 
 
 class LLMClientFactory:
@@ -171,21 +583,84 @@ class LLMClientFactory:
     }
     
     @classmethod
-    def create_client(cls, provider: str, model_name: str, api_key: str) -> LLMClientBase:
-        """Create an LLM client based on provider"""
+    def create_client(cls, provider: str, model_name: str, api_key: str,
+                      cache_responses: bool = True) -> LLMClientBase:
+        """
+        Create an LLM client based on provider
+        
+        Pass cache_responses=False for a client that always asks the
+        provider, e.g. to re-score a study.
+        """
         client_class = cls.CLIENT_MAPPING.get(provider)
         if not client_class:
             raise ValueError(f"Unsupported LLM provider: {provider}")
         
-        return client_class(api_key, model_name)
+        return client_class(api_key, model_name, cache_responses)
+
+
+def _extract_pdf_pages(pdf, page_numbers) -> str:
+    """Text of the given pages of an open pypdfium2 document, a blank line after each"""
+    texts = []
+    for number in page_numbers:
+        page = pdf[number]
+        textpage = page.get_textpage()
+        # PDFium ends lines with CRLF and marks line-break hyphens as U+FFFE.
+        # The blank line lets truncate_text() cut at page boundaries.
+        text = textpage.get_text_range().replace("\r\n", "\n").replace("\ufffe", "-")
+        texts.append(text.rstrip("\n") + "\n\n")
+        textpage.close()
+        page.close()
+    return "".join(texts)
+
+
+def _extract_pdf_range(file_path: str, start: int, stop: int) -> str:
+    # Runs in a worker process, which opens its own copy of the document
+    import pypdfium2
+    with closing(pypdfium2.PdfDocument(file_path)) as pdf:
+        return _extract_pdf_pages(pdf, range(start, stop))
 
 
 class TextExtractor:
     """Extract text from various document formats"""
     
-    @staticmethod
-    def extract_from_pdf(file_path: str) -> str:
+    # Extraction runs in the request worker, so pages are read serially
+    # unless PDF_EXTRACTION_WORKERS allows more processes. PDFium reads a
+    # page in about 2.5 ms, so only very long documents are worth the
+    # cost of starting a pool.
+    PARALLEL_MIN_PAGES = 200
+    PAGES_PER_WORKER = 100
+    
+    @classmethod
+    def extract_from_pdf(cls, file_path: str) -> str:
         """Extract text from PDF file"""
+        try:
+            import pypdfium2
+        except ImportError:
+            return cls._extract_from_pdf_pypdf2(file_path)
+        
+        try:
+            with closing(pypdfium2.PdfDocument(file_path)) as pdf:
+                page_count = len(pdf)
+                workers = min(
+                    getattr(settings, 'PDF_EXTRACTION_WORKERS', 1),
+                    os.cpu_count() or 1,
+                    page_count // cls.PAGES_PER_WORKER
+                )
+                if page_count < cls.PARALLEL_MIN_PAGES or workers < 2:
+                    return _extract_pdf_pages(pdf, range(page_count))
+            
+            # Pages are independent and extraction is CPU-bound, so split them
+            # into one contiguous range per worker
+            bounds = [page_count * i // workers for i in range(workers + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return "".join(executor.map(
+                    _extract_pdf_range, repeat(file_path), bounds[:-1], bounds[1:]
+                ))
+        except Exception as e:
+            raise Exception(f"Error extracting PDF text: {str(e)}")
+    
+    @staticmethod
+    def _extract_from_pdf_pypdf2(file_path: str) -> str:
         try:
             import PyPDF2
             with open(file_path, 'rb') as file:
@@ -195,7 +670,7 @@ class TextExtractor:
                     text += page.extract_text() + "\n"
                 return text
         except ImportError:
-            raise ImportError("PyPDF2 is required for PDF text extraction")
+            raise ImportError("pypdfium2 or PyPDF2 is required for PDF text extraction")
         except Exception as e:
             raise Exception(f"Error extracting PDF text: {str(e)}")
     
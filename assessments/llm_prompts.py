@@ -23,10 +23,10 @@ Response format requirements:
 - Follow the exact RoB 2.0 signaling questions and decision rules
 """
 
-ROB2_ASSESSMENT_PROMPT = """
-Conduct a comprehensive Risk of Bias 2.0 assessment for the following parallel randomized controlled trial. 
-
-{study_context}
+# The static instructions are sent ahead of the study so that every request
+# starts with the same bytes, which lets providers reuse their prompt cache
+ROB2_ASSESSMENT_INSTRUCTIONS = """
+Conduct a comprehensive Risk of Bias 2.0 assessment for the parallel randomized controlled trial described at the end of this message.
 
 ASSESSMENT INSTRUCTIONS:
 
@@ -191,90 +191,110 @@ CRITICAL INSTRUCTIONS:
 6. Your overall assessment MUST follow the combination rules (High if any domain High, etc.)
 7. Include confidence scores reflecting certainty in available evidence
 8. Be thorough but focus on the most relevant evidence for each question
+"""
+
+ROB2_STUDY_PROMPT = """
+STUDY TO ASSESS:
+{study_context}
 
 Begin your assessment now:
 """
 
-def get_domain_specific_prompt(domain_number: int, study_context: str) -> str:
-    """Get a focused prompt for assessing a specific domain"""
-    
-    domain_prompts = {
-        1: f"""
-Assess Domain 1 (Randomization Process) for this study:
+DOMAIN_NAMES = {
+    1: "Randomization Process",
+    2: "Deviations from Intended Interventions",
+    3: "Missing Outcome Data",
+    4: "Outcome Measurement",
+    5: "Selective Reporting",
+}
 
-{study_context}
+DOMAIN_FOCUS = {
+    1: (
+        "How randomization sequence was generated",
+        "Whether allocation was concealed until assignment",
+        "Baseline characteristics and any imbalances",
+        "Any evidence of selection bias",
+    ),
+    2: (
+        "Participant and personnel blinding status",
+        "Any deviations from protocol and their causes",
+        "Whether deviations affected outcomes",
+        "Balance of deviations between groups",
+        "Analysis method (ITT vs per-protocol)",
+    ),
+    3: (
+        "Completeness of outcome data",
+        "Reasons for missing data",
+        "Differential missingness between groups",
+        "Impact of missing data on results",
+        "Any sensitivity analyses performed",
+    ),
+    4: (
+        "Appropriateness of outcome measurement method",
+        "Consistency of measurement between groups",
+        "Blinding of outcome assessors",
+        "Potential for measurement bias",
+        "Objectivity vs subjectivity of outcome",
+    ),
+    5: (
+        "Pre-specified analysis plan and timing",
+        "Multiple outcome measurements or time points",
+        "Multiple analysis methods",
+        "Evidence of selective reporting",
+        "Protocol vs publication consistency",
+    ),
+}
 
-Focus specifically on:
-- How randomization sequence was generated
-- Whether allocation was concealed until assignment
-- Baseline characteristics and any imbalances
-- Any evidence of selection bias
 
-Provide detailed assessment following RoB 2.0 methodology for Domain 1 only.
-""",
-        
-        2: f"""
-Assess Domain 2 (Deviations from Intended Interventions) for this study:
+def _focus_list(domain_number: int) -> str:
+    return "\n".join(f"- {item}" for item in DOMAIN_FOCUS[domain_number])
 
-{study_context}
 
-Focus specifically on:
-- Participant and personnel blinding status
-- Any deviations from protocol and their causes
-- Whether deviations affected outcomes
-- Balance of deviations between groups
-- Analysis method (ITT vs per-protocol)
-
-Provide detailed assessment following RoB 2.0 methodology for Domain 2 only.
-""",
-        
-        3: f"""
-Assess Domain 3 (Missing Outcome Data) for this study:
+def get_domain_specific_prompt(domain_number: int, study_context: str) -> str:
+    """Get a focused prompt for assessing a specific domain"""
+    if domain_number not in DOMAIN_NAMES:
+        return "Invalid domain number"
+    
+    return f"""
+Assess Domain {domain_number} ({DOMAIN_NAMES[domain_number]}) for this study:
 
 {study_context}
 
 Focus specifically on:
-- Completeness of outcome data
-- Reasons for missing data
-- Differential missingness between groups
-- Impact of missing data on results
-- Any sensitivity analyses performed
-
-Provide detailed assessment following RoB 2.0 methodology for Domain 3 only.
-""",
-        
-        4: f"""
-Assess Domain 4 (Outcome Measurement) for this study:
+{_focus_list(domain_number)}
 
-{study_context}
-
-Focus specifically on:
-- Appropriateness of outcome measurement method
-- Consistency of measurement between groups
-- Blinding of outcome assessors
-- Potential for measurement bias
-- Objectivity vs subjectivity of outcome
-
-Provide detailed assessment following RoB 2.0 methodology for Domain 4 only.
-""",
-        
-        5: f"""
-Assess Domain 5 (Selective Reporting) for this study:
+Provide detailed assessment following RoB 2.0 methodology for Domain {domain_number} only.
+"""
 
-{study_context}
 
+# All five domains in one request, so the study context is sent once
+# instead of once per domain; static text first, as for the full assessment
+ROB2_ALL_DOMAINS_INSTRUCTIONS = """
+Assess all five RoB 2.0 domains for the study described at the end of this message.
+""" + "".join(f"""
+**Domain {number} ({name})**
 Focus specifically on:
-- Pre-specified analysis plan and timing
-- Multiple outcome measurements or time points
-- Multiple analysis methods
-- Evidence of selective reporting
-- Protocol vs publication consistency
-
-Provide detailed assessment following RoB 2.0 methodology for Domain 5 only.
+{_focus_list(number)}
+""" for number, name in DOMAIN_NAMES.items()) + """
+Follow RoB 2.0 methodology for each domain separately. Respond with a single
+JSON object with the keys "domain_1" to "domain_5". Each value must contain:
+- "questions": each signaling question number mapped to {"response": "Y/PY/PN/N/NI", "justification": "..."}
+- "risk_assessment": "Low/Some concerns/High"
+- "reasoning": explanation of the domain judgement
+- "confidence": 0.0-1.0
+- "key_evidence": list of supporting quotes
 """
-    }
+
+
+def get_all_domains_prompt(study_context: str) -> str:
+    """
+    Get the study part of the single prompt assessing domains 1-5
     
-    return domain_prompts.get(domain_number, "Invalid domain number")
+    Send ROB2_ALL_DOMAINS_INSTRUCTIONS as the prompt_prefix, so the static
+    instructions can be served from the provider's prompt cache.
+    """
+    return ROB2_STUDY_PROMPT.format(study_context=study_context)
+
 
 def get_validation_prompt(assessment_json: str) -> str:
     """Prompt to validate and refine an assessment"""
@@ -12,21 +12,31 @@ from typing import Dict, Any, Optional, List
 from django.utils import timezone
 
 from .models import Assessment, StudyDocument, LLMModel, LLMAssessment
-from .llm_client import LLMClientFactory, TextExtractor, format_study_context, truncate_text
-from .llm_prompts import ROB2_SYSTEM_PROMPT, ROB2_ASSESSMENT_PROMPT, get_validation_prompt
+from .llm_client import (
+    LLMClientFactory, TextExtractor, format_study_context, generate_responses, truncate_text
+)
+from .llm_prompts import ROB2_SYSTEM_PROMPT, ROB2_ASSESSMENT_INSTRUCTIONS, ROB2_STUDY_PROMPT, get_validation_prompt
 from .rob2_engine import calculate_rob2_assessment
 
 
 class LLMAssessmentService:
     """Service for conducting automated LLM-based RoB assessments"""
     
-    def __init__(self, api_key: str, llm_model: LLMModel):
+    def __init__(self, api_key: str, llm_model: LLMModel, cache_responses: bool = True):
+        """
+        Args:
+            api_key: API key for the model's provider
+            llm_model: The model to run assessments with
+            cache_responses: Reuse stored responses for identical requests;
+                pass False to always get a fresh answer
+        """
         self.api_key = api_key
         self.llm_model = llm_model
         self.client = LLMClientFactory.create_client(
             llm_model.provider, 
             llm_model.model_name, 
-            api_key
+            api_key,
+            cache_responses=cache_responses
         )
     
     def conduct_assessment(self, assessment: Assessment, 
@@ -44,77 +54,132 @@ class LLMAssessmentService:
         start_time = time.time()
         
         try:
-            # Extract text from documents if not already done
-            self._ensure_text_extracted(documents or [])
-            
-            # Prepare study context
-            study_context = format_study_context(
-                assessment.study, 
-                documents or list(assessment.study.documents.all())
-            )
-            
-            # Truncate context if needed to fit within model limits
-            study_context = self._prepare_context_for_model(study_context)
-            
-            # Generate the full assessment prompt
-            assessment_prompt = ROB2_ASSESSMENT_PROMPT.format(
-                study_context=study_context
-            )
+            study_prompt = self._build_study_prompt(assessment, documents)
             
             # Get LLM response
             response = self.client.generate_response(
-                prompt=assessment_prompt,
-                system_prompt=ROB2_SYSTEM_PROMPT
+                prompt=study_prompt,
+                system_prompt=ROB2_SYSTEM_PROMPT,
+                prompt_prefix=ROB2_ASSESSMENT_INSTRUCTIONS
             )
             
-            processing_time = time.time() - start_time
+            return self._record_response(assessment, study_prompt, response, start_time)
             
-            if not response['success']:
-                return {
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'processing_time': time.time() - start_time
+            }
+    
+    def conduct_assessments(self, assessments: List[Assessment]) -> List[Dict[str, Any]]:
+        """
+        Conduct LLM assessments for several studies at once
+        
+        The requests are sent concurrently, within the provider's rate
+        limits, instead of one after another. Each assessment uses the
+        documents already attached to its study.
+        
+        Returns:
+            One result per assessment, in the conduct_assessment() format
+        """
+        start_time = time.time()
+        results = [None] * len(assessments)
+        pending = []
+        
+        for index, assessment in enumerate(assessments):
+            try:
+                pending.append((index, assessment, self._build_study_prompt(assessment)))
+            except Exception as e:
+                results[index] = {
                     'success': False,
-                    'error': response.get('error', 'Unknown error'),
-                    'processing_time': processing_time
+                    'error': str(e),
+                    'processing_time': time.time() - start_time
                 }
-            
-            # Parse and validate the response
-            parsed_results = self._parse_llm_response(response['content'])
-            
-            if not parsed_results:
-                return {
+        
+        responses = generate_responses(
+            self.client,
+            [study_prompt for _, _, study_prompt in pending],
+            system_prompt=ROB2_SYSTEM_PROMPT,
+            prompt_prefix=ROB2_ASSESSMENT_INSTRUCTIONS
+        )
+        
+        for (index, assessment, study_prompt), response in zip(pending, responses):
+            try:
+                results[index] = self._record_response(assessment, study_prompt, response, start_time)
+            except Exception as e:
+                results[index] = {
                     'success': False,
-                    'error': 'Failed to parse LLM response into valid format',
-                    'processing_time': processing_time,
-                    'raw_response': response['content']
+                    'error': str(e),
+                    'processing_time': time.time() - start_time
                 }
-            
-            # Validate assessment logic using our RoB2 engine
-            validation_results = self._validate_assessment_logic(parsed_results)
-            
-            # Save LLM assessment results
-            llm_assessment = self._save_llm_assessment(
-                assessment=assessment,
-                prompt_used=assessment_prompt,
-                raw_response=response['content'],
-                parsed_results=parsed_results,
-                processing_time=processing_time,
-                validation_results=validation_results
-            )
-            
+        
+        return results
+    
+    def _build_study_prompt(self, assessment: Assessment,
+                            documents: List[StudyDocument] = None) -> str:
+        """Study part of the assessment prompt, sent after the static instructions"""
+        # Extract text from documents if not already done
+        self._ensure_text_extracted(documents or [])
+        
+        # Prepare study context
+        study_context = format_study_context(
+            assessment.study, 
+            documents or list(assessment.study.documents.all())
+        )
+        
+        # Truncate context if needed to fit within model limits
+        study_context = self._prepare_context_for_model(study_context)
+        
+        # The instructions go first as a cacheable prefix, the study last
+        return ROB2_STUDY_PROMPT.format(
+            study_context=study_context
+        )
+    
+    def _record_response(self, assessment: Assessment, study_prompt: str,
+                         response: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """Parse, validate and save an LLM response for assessment"""
+        processing_time = time.time() - start_time
+        
+        if not response['success']:
             return {
-                'success': True,
-                'llm_assessment_id': llm_assessment.id,
-                'parsed_results': parsed_results,
-                'validation_results': validation_results,
-                'processing_time': processing_time,
-                'usage_stats': response.get('usage', {})
+                'success': False,
+                'error': response.get('error', 'Unknown error'),
+                'processing_time': processing_time
             }
-            
-        except Exception as e:
+        
+        # Parse and validate the response
+        parsed_results = self._parse_llm_response(response['content'])
+        
+        if not parsed_results:
             return {
                 'success': False,
-                'error': str(e),
-                'processing_time': time.time() - start_time
+                'error': 'Failed to parse LLM response into valid format',
+                'processing_time': processing_time,
+                'raw_response': response['content']
             }
+        
+        # Validate assessment logic using our RoB2 engine
+        validation_results = self._validate_assessment_logic(parsed_results)
+        
+        # Save LLM assessment results
+        llm_assessment = self._save_llm_assessment(
+            assessment=assessment,
+            prompt_used=ROB2_ASSESSMENT_INSTRUCTIONS + study_prompt,
+            raw_response=response['content'],
+            parsed_results=parsed_results,
+            processing_time=processing_time,
+            validation_results=validation_results
+        )
+        
+        return {
+            'success': True,
+            'llm_assessment_id': llm_assessment.id,
+            'parsed_results': parsed_results,
+            'validation_results': validation_results,
+            'processing_time': processing_time,
+            'usage_stats': response.get('usage', {})
+        }
     
     def _ensure_text_extracted(self, documents: List[StudyDocument]) -> None:
         """Extract text from documents that don't have it yet"""
@@ -18,7 +18,7 @@ from robins_e_domain4 import ROBINSEDomain4
 from robins_e_domain5 import ROBINSEDomain5
 from robins_e_domain6 import ROBINSEDomain6
 from robins_e_domain7 import ROBINSEDomain7
-from robins_e_overall import ROBINSEOverallAssessment, DomainRisk, OverallRisk, ConclusionThreat
+from robins_e_overall import default_assessor, DomainRisk, OverallRisk, ConclusionThreat
 
 from typing import Dict, Any, List, Tuple
 from enum import Enum
@@ -43,7 +43,7 @@ class ROBINSEEngine:
         self.domain5 = ROBINSEDomain5()
         self.domain6 = ROBINSEDomain6()
         self.domain7 = ROBINSEDomain7()
-        self.overall_assessor = ROBINSEOverallAssessment()
+        self.overall_assessor = default_assessor
         
         self.domain_names = {
             'domain_1': 'Risk of bias due to confounding',
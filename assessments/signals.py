@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .forms_enhanced import invalidate_llm_choices
+from .models import LLMModel
+
+
+@receiver([post_save, post_delete], sender=LLMModel)
+def clear_llm_choice_cache(sender, instance, **kwargs):
+    """Keep the cached LLM model choices in step with the table"""
+    invalidate_llm_choices(instance.pk)
@@ -1,3 +1,453 @@
-from django.test import TestCase
+import asyncio
+import itertools
+import sys
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest import mock, skipIf
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from google.api_core import exceptions as google_exceptions
+
+from . import llm_client
+from .forms import BulkStudyImportForm
+from .forms_enhanced import LLM_CHOICES_CACHE_KEY, CachedLLMModelChoiceField, MetadataReviewForm
+from .llm_client import LLMClientBase, LLMClientFactory, RateLimitedDispatcher
+from .llm_service import LLMAssessmentService
+from .models import AssessmentTool, LLMModel, Project, Study
+# Importing the engine puts algorithms/robins_e_2 on sys.path
+from .robins_e_engine import ROBINSEEngine  # noqa: F401
+import robins_e_domain6
+import robins_e_domain7
+import robins_e_overall
+
+
+def _csv_form(content, name='studies.csv'):
+    """Bound BulkStudyImportForm for the given CSV text or bytes"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return BulkStudyImportForm(files={'csv_file': SimpleUploadedFile(name, content, 'text/csv')})
+
+
+class BulkStudyImportFormTests(TestCase):
+    """Validation and saving of CSV study imports"""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Import project')
+
+    def assertFileError(self, form, message):
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors['csv_file'], [message])
+
+    def test_rejects_file_without_title_column(self):
+        self.assertFileError(_csv_form('name,year\nA study,2020\n'), 'CSV file must have a "title" column')
+
+    def test_rejects_non_utf8_file(self):
+        self.assertFileError(
+            _csv_form('title\nÉtude\n'.encode('latin-1')), 'CSV file must be UTF-8 encoded'
+        )
+
+    def test_rejects_empty_file(self):
+        self.assertFileError(_csv_form(''), 'The submitted file is empty.')
+        self.assertFileError(_csv_form('\n\n'), 'File could not be read as CSV')
+        self.assertFileError(_csv_form('title,year\n'), 'CSV file contains no studies')
+
+    def test_lists_every_invalid_row(self):
+        form = _csv_form(
+            'title,year,doi,pmid\n'
+            'Valid,2020,10.1000/a,123\n'
+            'Overflow,99999999999999999999,,\n'
+            'Bad DOI,,doi:10.1000/b,\n'
+            f'Long PMID,,,{"1" * 21}\n'
+        )
+        self.assertTrue(form.is_valid())
+
+        with self.assertRaises(ValidationError) as raised:
+            form.save(self.project)
+        self.assertEqual(raised.exception.messages, [
+            f'Row 2: Year must be between 1900 and {date.today().year + 1}',
+            'Row 3: DOI should start with "10."',
+            'Row 4: pmid cannot exceed 20 characters',
+        ])
+        self.assertFalse(Study.objects.exists())
+
+    def test_short_rows_leave_missing_fields_blank(self):
+        form = _csv_form('title,authors,year\nShort row\nFull row,Smith,2020\n')
+        self.assertTrue(form.is_valid())
+        form.save(self.project)
+
+        short = Study.objects.get(title='Short row')
+        self.assertEqual((short.authors, short.year), ('', None))
+        full = Study.objects.get(title='Full row')
+        self.assertEqual((full.authors, full.year), ('Smith', 2020))
+
+    def test_skips_titles_already_in_project(self):
+        Study.objects.create(project=self.project, title='Existing', authors='Original')
+        form = _csv_form('title,authors\nExisting,Imported\nNew,Imported\n')
+        self.assertTrue(form.is_valid())
+        form.save(self.project)
+
+        self.assertEqual(self.project.studies.count(), 2)
+        self.assertEqual(Study.objects.get(title='Existing').authors, 'Original')
+
+    def test_invalid_later_batch_rolls_back_whole_import(self):
+        form = _csv_form('title,year\nFirst,2020\nSecond,2021\nThird,2022\nFourth,1800\n')
+        with mock.patch.object(BulkStudyImportForm, 'CSV_BATCH_ROWS', 2):
+            self.assertTrue(form.is_valid())
+            with self.assertRaises(ValidationError) as raised:
+                form.save(self.project, batch_size=1)
+
+        self.assertEqual(len(raised.exception.messages), 1)
+        self.assertTrue(raised.exception.messages[0].startswith('Row 4: Year must be between'))
+        self.assertFalse(Study.objects.exists())
+
+
+class FakeLLMClient(LLMClientBase):
+    """LLM client that answers from a list of canned replies instead of an API"""
+
+    def __init__(self, replies=(), cache_responses=False):
+        # Each reply is the response content, or an exception to raise
+        self.replies = list(replies)
+        self.prompts = []
+        super().__init__('test-key', 'fake-model', cache_responses)
+
+    def _setup_client(self):
+        pass
+
+    def _setup_async_client(self):
+        return object()
+
+    def _reply(self, prompt):
+        self.prompts.append(prompt)
+        reply = self.replies.pop(0) if self.replies else f'answer to {prompt}'
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def _create(self, prompt, system_prompt=None, prompt_prefix=None):
+        return self._reply(prompt)
+
+    async def _acreate(self, prompt, system_prompt=None, prompt_prefix=None):
+        return self._reply(prompt)
+
+    def _stream(self, prompt, system_prompt=None, prompt_prefix=None):
+        yield self._reply(prompt), None
+        yield '', {'total_tokens': 10}
+
+    def _format_response(self, response):
+        return {'content': response, 'usage': {'total_tokens': 10}}
+
+
+class RateLimitedDispatcherTests(SimpleTestCase):
+    """Request and token budgets, and retries of rate limited requests"""
+
+    def dispatcher(self, rpm=100, tpm=10 ** 6):
+        dispatcher = RateLimitedDispatcher(rpm, tpm)
+        dispatcher.WINDOW_SECONDS = 0.2
+        dispatcher.BACKOFF_SECONDS = 0.05
+        return dispatcher
+
+    def dispatch_all(self, dispatcher, client, prompts):
+        """Dispatch the prompts concurrently; returns (results, seconds taken)"""
+        async def run():
+            return await asyncio.gather(*(dispatcher.dispatch(client, prompt) for prompt in prompts))
+        start = time.monotonic()
+        results = asyncio.run(run())
+        return results, time.monotonic() - start
+
+    def test_requests_within_budget_are_not_delayed(self):
+        results, elapsed = self.dispatch_all(self.dispatcher(rpm=3), FakeLLMClient(), ['a', 'b', 'c'])
+        self.assertEqual([result['content'] for result in results], ['answer to a', 'answer to b', 'answer to c'])
+        self.assertLess(elapsed, 0.15)
+
+    def test_waits_for_request_budget(self):
+        _, elapsed = self.dispatch_all(self.dispatcher(rpm=2), FakeLLMClient(), ['a', 'b', 'c'])
+        self.assertGreaterEqual(elapsed, 0.2)
+
+    def test_waits_for_token_budget(self):
+        # Every request reserves MAX_OUTPUT_TOKENS, so only one fits at a time
+        tpm = llm_client.MAX_OUTPUT_TOKENS + 100
+        _, elapsed = self.dispatch_all(self.dispatcher(tpm=tpm), FakeLLMClient(), ['a', 'b'])
+        self.assertGreaterEqual(elapsed, 0.2)
+
+    def test_retries_rate_limited_request(self):
+        client = FakeLLMClient([google_exceptions.ResourceExhausted('quota'), 'second try'])
+        with mock.patch.object(llm_client.random, 'random', return_value=0.0):
+            (result,), _ = self.dispatch_all(self.dispatcher(), client, ['a'])
+        self.assertTrue(result['success'])
+        self.assertEqual(result['content'], 'second try')
+        self.assertEqual(client.prompts, ['a', 'a'])
+
+    def test_gives_up_after_max_attempts(self):
+        dispatcher = self.dispatcher()
+        client = FakeLLMClient([google_exceptions.ResourceExhausted('quota')] * dispatcher.MAX_ATTEMPTS)
+        with mock.patch.object(llm_client.random, 'random', return_value=0.0):
+            (result,), _ = self.dispatch_all(dispatcher, client, ['a'])
+        self.assertTrue(result['rate_limited'])
+        self.assertEqual(len(client.prompts), dispatcher.MAX_ATTEMPTS)
+
+    def test_cache_miss_is_looked_up_once(self):
+        client = FakeLLMClient(cache_responses=True)
+        with mock.patch.object(llm_client, 'cache') as fake_cache:
+            fake_cache.aget = mock.AsyncMock(return_value=None)
+            fake_cache.aset = mock.AsyncMock()
+            self.dispatch_all(self.dispatcher(), client, ['a'])
+        fake_cache.aget.assert_awaited_once()
+        fake_cache.aset.assert_awaited_once()
+
+    def test_for_client_rejects_unknown_client(self):
+        with self.assertRaises(ValueError):
+            RateLimitedDispatcher.for_client(FakeLLMClient())
+
+
+class LLMResponseCacheTests(SimpleTestCase):
+    """Reuse of stored responses for identical requests"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_miss_then_hit(self):
+        client = FakeLLMClient(cache_responses=True)
+        first = client.generate_response('prompt', system_prompt='system')
+        second = client.generate_response('prompt', system_prompt='system')
+
+        self.assertNotIn('cached', first)
+        self.assertEqual(first['usage'], {'total_tokens': 10})
+        self.assertTrue(second['cached'])
+        self.assertEqual(second['content'], first['content'])
+        # The hit spent no tokens
+        self.assertEqual(second['usage'], {'total_tokens': 0})
+        self.assertEqual(client.prompts, ['prompt'])
+        self.assertEqual((client.cache_hits, client.cache_misses), (1, 1))
+
+    def test_async_hit_reuses_sync_response(self):
+        client = FakeLLMClient(cache_responses=True)
+        client.generate_response('prompt')
+        result = asyncio.run(client.agenerate_response('prompt'))
+
+        self.assertTrue(result['cached'])
+        self.assertEqual(client.prompts, ['prompt'])
+
+    def test_failure_is_not_stored(self):
+        client = FakeLLMClient([RuntimeError('provider down'), 'recovered'], cache_responses=True)
+        failure = client.generate_response('prompt')
+        retry = client.generate_response('prompt')
+
+        self.assertFalse(failure['success'])
+        self.assertTrue(retry['success'])
+        self.assertNotIn('cached', retry)
+        self.assertEqual(client.prompts, ['prompt', 'prompt'])
+
+    def test_caching_can_be_turned_off(self):
+        client = FakeLLMClient(cache_responses=False)
+        client.generate_response('prompt')
+        result = client.generate_response('prompt')
+
+        self.assertNotIn('cached', result)
+        self.assertEqual(client.prompts, ['prompt', 'prompt'])
+
+    def test_factory_and_service_pass_the_cache_setting_on(self):
+        client = LLMClientFactory.create_client('Claude', 'claude-model', 'test-key', cache_responses=False)
+        self.assertFalse(client.cache_responses)
+
+        llm_model = SimpleNamespace(provider='Claude', model_name='claude-model')
+        self.assertTrue(LLMAssessmentService('test-key', llm_model).client.cache_responses)
+        service = LLMAssessmentService('test-key', llm_model, cache_responses=False)
+        self.assertFalse(service.client.cache_responses)
+
+
+REVIEWED_METADATA = {
+    'title': 'Extracted title',
+    'authors': 'Smith J',
+    'year': 2020,
+    'doi': '10.1000/extracted',
+    'word_count': 1200,
+    'extraction_success': True,
+}
+
+
+def _review_post(**changes):
+    """POST data for MetadataReviewForm signed over REVIEWED_METADATA"""
+    data = {
+        'payload': MetadataReviewForm(metadata=REVIEWED_METADATA).initial['payload'],
+        'metadata_confirmed': 'on',
+        'text_quality_confirmed': 'on',
+        **{name: str(value) for name, value in REVIEWED_METADATA.items()},
+    }
+    data.update(changes)
+    return data
+
+
+class MetadataReviewFormTests(SimpleTestCase):
+    """Signed metadata carried through the review form"""
+
+    def test_display_fields_come_from_payload(self):
+        form = MetadataReviewForm(_review_post(title='Tampered title', year='1999'))
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['title'], 'Extracted title')
+        self.assertEqual(form.cleaned_data['year'], 2020)
+
+    def test_rejects_tampered_payload(self):
+        forged = signing.dumps(
+            {**REVIEWED_METADATA, 'title': 'Forged title'},
+            key='not-the-secret-key', salt=MetadataReviewForm.PAYLOAD_SALT
+        )
+        form = MetadataReviewForm(_review_post(payload=forged))
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.non_field_errors(), ['The reviewed metadata could not be verified.'])
+
+
+@skipIf(sys.version_info < (3, 12), 'views_enhanced imports prompt templates that need Python 3.12')
+class MetadataReviewViewTests(TestCase):
+    """Study creation from reviewed metadata"""
+
+    def test_study_uses_signed_metadata(self):
+        from .views_enhanced import metadata_review_view
+
+        user = User.objects.create_user('reviewer', password='reviewer-password')
+        project = Project.objects.create(name='Review project', user=user)
+        AssessmentTool.objects.create(name='rob2_parallel', display_name='RoB 2', description='RoB 2')
+
+        request = RequestFactory().post('/', _review_post(
+            title='Tampered title', authors='Someone else', study_design='RCT'
+        ))
+        request.user = user
+        SessionMiddleware(lambda request: None).process_request(request)
+        request.session.update({
+            'processing_results': {'pdf_results': {}, 'metadata_results': REVIEWED_METADATA},
+            'project_id': str(project.id),
+            'tool_name': 'rob2_parallel',
+        })
+        request._messages = FallbackStorage(request)
+
+        with mock.patch('assessments.views_enhanced.redirect', return_value=HttpResponse()):
+            metadata_review_view(request)
+
+        study = project.studies.get()
+        self.assertEqual((study.title, study.authors, study.year), ('Extracted title', 'Smith J', 2020))
+        # Fields the review form does not carry still come from the study form
+        self.assertEqual(study.study_design, 'RCT')
+
+
+def _decode_responses(module, keys, codes):
+    """Responses dictionary for one row of batch codes; code 0 leaves a question out"""
+    responses_by_code = {code: response for response, code in module.RESPONSE_CODES.items()}
+    return {key: responses_by_code[code] for key, code in zip(keys, codes) if code}
+
+
+class ROBINSEBatchAssessmentTests(SimpleTestCase):
+    """Batch assessment agrees with the one-study API and rejects bad codes"""
+
+    def test_overall_batch_matches_scalar(self):
+        assessor = robins_e_overall.ROBINSEOverallAssessment()
+        risks = list(robins_e_overall.DOMAIN_RISK_CODES)
+        rows = np.array(list(itertools.product(range(len(risks)), repeat=7)))
+
+        for row, code in zip(rows, assessor.assess_overall_bias_risk_batch(rows)):
+            expected = assessor.assess_overall_bias_risk(
+                {f'domain_{number}': risks[risk] for number, risk in enumerate(row, start=1)}
+            )['overall_risk']
+            self.assertIs(robins_e_overall.OVERALL_RISKS_BY_CODE[code], expected)
+
+    def test_domain6_batch_matches_scalar(self):
+        domain = robins_e_domain6.ROBINSEDomain6()
+        keys = list(domain.get_questions())
+        rows = np.array(list(itertools.product(range(len(robins_e_domain6.RESPONSE_CODES)), repeat=3)))
+
+        for row, code in zip(rows, domain.assess_batch(*rows.T)):
+            expected = domain.assess_outcome_measurement_bias(
+                _decode_responses(robins_e_domain6, keys, row)
+            )['risk_level']
+            self.assertIs(robins_e_domain6.RISK_LEVELS_BY_CODE[code], expected)
+
+    def test_domain7_batch_matches_scalar(self):
+        domain = robins_e_domain7.ROBINSEDomain7()
+        keys = list(domain.get_questions())
+        rows = np.array(list(itertools.product(range(len(robins_e_domain7.RESPONSE_CODES)), repeat=5)))
+
+        for row, code in zip(rows, domain.assess_batch(rows)):
+            expected = domain.assess_risk_level(_decode_responses(robins_e_domain7, keys, row))
+            self.assertIs(robins_e_domain7.RISK_LEVELS_BY_CODE[code], expected)
+
+    def test_overall_batch_rejects_bad_codes(self):
+        assess = robins_e_overall.ROBINSEOverallAssessment().assess_overall_bias_risk_batch
+        with self.assertRaises(ValueError):
+            assess([[1.7] * 7])
+        with self.assertRaises(ValueError):
+            assess([[0] * 6])
+        with self.assertRaises(IndexError):
+            assess([[0] * 6 + [len(robins_e_overall.DOMAIN_RISK_CODES)]])
+        with self.assertRaises(IndexError):
+            assess([[0] * 6 + [-1]])
+        self.assertEqual(len(assess(np.empty((0, 7), dtype=np.int8))), 0)
+
+    def test_domain6_batch_rejects_bad_codes(self):
+        assess = robins_e_domain6.ROBINSEDomain6().assess_batch
+        with self.assertRaises(ValueError):
+            assess([1.5], [1], [1])
+        with self.assertRaises(ValueError):
+            assess([1, 1], [1], [1])
+        with self.assertRaises(IndexError):
+            assess([1], [-1], [1])
+        with self.assertRaises(IndexError):
+            assess([1], [1], [len(robins_e_domain6.RESPONSE_CODES)])
+
+    def test_domain7_batch_rejects_bad_codes(self):
+        assess = robins_e_domain7.ROBINSEDomain7().assess_batch
+        with self.assertRaises(ValueError):
+            assess([[1.5] * 5])
+        with self.assertRaises(ValueError):
+            assess([[1] * 4])
+        with self.assertRaises(IndexError):
+            assess([[1] * 4 + [-1]])
+        with self.assertRaises(IndexError):
+            assess([[1] * 4 + [len(robins_e_domain7.RESPONSE_CODES)]])
+
+
+class CachedLLMModelChoiceFieldTests(TestCase):
+    """Cached LLM model choices stay in step with the LLMModel table"""
+
+    def setUp(self):
+        cache.clear()
+        self.llm_model = LLMModel.objects.create(
+            provider='Claude', model_name='claude-model', display_name='Claude Model'
+        )
+        self.field = CachedLLMModelChoiceField()
+        self.model_key = f'{LLM_CHOICES_CACHE_KEY}:{self.llm_model.pk}'
+
+    def assertCached(self):
+        self.assertEqual(self.field.to_python(self.llm_model.pk), self.llm_model)
+        self.assertIsNotNone(cache.get(LLM_CHOICES_CACHE_KEY))
+        self.assertIsNotNone(cache.get(self.model_key))
+
+    def assertNotCached(self):
+        self.assertIsNone(cache.get(LLM_CHOICES_CACHE_KEY))
+        self.assertIsNone(cache.get(self.model_key))
+
+    def test_save_clears_both_cache_keys(self):
+        self.assertCached()
+        self.llm_model.display_name = 'Renamed'
+        self.llm_model.save()
+        self.assertNotCached()
+        self.assertEqual(list(self.field.choices)[1:], [(self.llm_model.pk, 'Claude - Renamed')])
+
+    def test_delete_clears_both_cache_keys(self):
+        self.assertCached()
+        self.llm_model.delete()
+        self.assertNotCached()
+
+    def test_deactivated_model_is_rejected(self):
+        self.assertCached()
+        self.llm_model.is_active = False
+        self.llm_model.save()
+        with self.assertRaises(ValidationError):
+            self.field.to_python(self.llm_model.pk)
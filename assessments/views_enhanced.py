@@ -20,7 +20,6 @@ from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
 from django.conf import settings
 
 from .models import (
@@ -38,6 +37,12 @@ from .services.llm_service import LLMClient
 from .rob2_engine import calculate_rob2_assessment
 
 
+# Study fields set from the signed metadata in MetadataReviewForm
+REVIEWED_STUDY_FIELDS = tuple(
+    name for name in StudyCreationForm.Meta.fields if name in MetadataReviewForm.base_fields
+)
+
+
 @login_required
 def enhanced_study_create_view(request, project_id, tool_name):
     """Enhanced study creation with PDF upload and metadata extraction"""
@@ -58,11 +63,8 @@ def enhanced_study_create_view(request, project_id, tool_name):
             # Process PDF if uploaded
             if pdf_file:
                 try:
-                    # Save PDF temporarily
-                    temp_path = default_storage.save(
-                        f'temp_pdfs/{pdf_file.name}',
-                        ContentFile(pdf_file.read())
-                    )
+                    # Save PDF temporarily; storage copies the upload in chunks
+                    temp_path = default_storage.save(f'temp_pdfs/{pdf_file.name}', pdf_file)
                     full_path = os.path.join(settings.MEDIA_ROOT, temp_path)
                     
                     # Extract PDF content
@@ -158,7 +160,14 @@ def metadata_review_view(request):
     
     if request.method == 'POST':
         review_form = MetadataReviewForm(request.POST)
-        study_form = StudyCreationForm(request.POST)
+        study_data = request.POST.copy()
+        if review_form.is_valid():
+            # The reviewed metadata comes from the signed payload; any copy
+            # of those fields posted with the study form is ignored
+            for name in REVIEWED_STUDY_FIELDS:
+                value = review_form.cleaned_data.get(name)
+                study_data[name] = '' if value is None else value
+        study_form = StudyCreationForm(study_data)
         
         if review_form.is_valid() and study_form.is_valid():
             # Create study with confirmed metadata
@@ -188,7 +197,7 @@ def metadata_review_view(request):
     
     else:
         # Pre-populate forms with extracted data
-        review_form = MetadataReviewForm(initial=combined_metadata)
+        review_form = MetadataReviewForm(metadata=combined_metadata)
         study_form = StudyCreationForm(initial=combined_metadata)
     
     context = {